@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: memory and build time of the dependency graph, networkx.DiGraph
+(the previous DependencyMap backend) vs. CompactGraph.
+
+Edges are generated like a real dependency map: path-string nodes, a 'type'
+and 'line' attribute per edge, and a few repeated imports. Memory is the
+peak traced by tracemalloc while building, so it includes the node names.
+
+Usage:
+    python benchmarks/bench_graph_memory.py [--nodes 20000 --edges-per-node 8]
+"""
+
+import time
+import random
+import argparse
+import tracemalloc
+
+import networkx as nx
+
+from codevalue_architect_assistant.graph import CompactGraph
+
+def synthetic_edges(nodes: int, edges_per_node: int, seed: int = 1):
+    rng = random.Random(seed)
+    names = [f"src/package_{i // 50}/module_{i}.py" for i in range(nodes)]
+    types = ("import_from", "static_import", "require")
+    edges = []
+    for i, name in enumerate(names):
+        for _ in range(edges_per_node):
+            edges.append((name, names[rng.randrange(nodes)], types[i % 3], rng.randrange(1, 400)))
+    return edges
+
+def build_networkx(edges):
+    graph = nx.DiGraph()
+    for u, v, type_, line in edges:
+        graph.add_edge(u, v, type=type_, line=line)
+    return graph.number_of_edges()
+
+def build_compact(edges):
+    graph = CompactGraph()
+    for u, v, type_, line in edges:
+        graph.add_edge(u, v, type=type_, line=line)
+    return graph.number_of_edges() # Forces compaction into CSR form
+
+def _measure(build, edges):
+    """Times a build, then repeats it under tracemalloc (which slows it down) for the peak memory."""
+    start = time.perf_counter()
+    edge_count = build(edges)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    build(edges)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return edge_count, elapsed, peak
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=20000)
+    parser.add_argument("--edges-per-node", type=int, default=8)
+    args = parser.parse_args()
+
+    edges = synthetic_edges(args.nodes, args.edges_per_node)
+    print(f"{len(edges)} edges over {args.nodes} nodes")
+    print(f"{'backend':<10} {'edges':>9} {'build (s)':>10} {'peak MiB':>9} {'bytes/edge':>11}")
+    for name, build in (("networkx", build_networkx), ("compact", build_compact)):
+        edge_count, elapsed, peak = _measure(build, edges)
+        print(f"{name:<10} {edge_count:>9} {elapsed:>10.2f} {peak / 2**20:>9.1f} {peak / edge_count:>11.0f}")
+
+if __name__ == "__main__":
+    main()
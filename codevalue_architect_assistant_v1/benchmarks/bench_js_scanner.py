@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: linear JavaScript import scanner vs. the legacy line regexes.
+
+The legacy patterns (copied below from javascript_parser.py before the scanner
+replaced them) use '.*?' / '.+?' under MULTILINE and are anchored at line
+starts, so they also find at most one require / import per line: on minified
+bundles most imports are missed. The "found" columns show this.
+
+Usage:
+    python benchmarks/bench_js_scanner.py [--sizes 1000 4000 16000]
+"""
+
+import re
+import time
+import argparse
+
+from codevalue_architect_assistant.analysis.javascript_parser import scan_javascript_imports
+
+# --- Legacy regexes ---
+LEGACY_REQUIRE_REGEX = re.compile(
+    r"^\s*(?!\/\/)(?!\/\*.*\*\/)"
+    r".*?\brequire\s*\(\s*['\"]"
+    r"([^'\"]+)"
+    r"['\"]\s*\)",
+    re.MULTILINE
+)
+LEGACY_IMPORT_FROM_REGEX = re.compile(
+    r"^\s*(?!\/\/)(?!\/\*.*\*\/)"
+    r"import(?:.+?from\s*)?['\"]"
+    r"([^'\"]+)"
+    r"['\"]\s*;?",
+    re.MULTILINE
+)
+LEGACY_DYNAMIC_IMPORT_REGEX = re.compile(
+    r"\bimport\s*\(\s*['\"]"
+    r"([^'\"]+)"
+    r"['\"]\s*\)",
+)
+
+def legacy_scan(content: str) -> int:
+    count = 0
+    for regex in (LEGACY_REQUIRE_REGEX, LEGACY_IMPORT_FROM_REGEX, LEGACY_DYNAMIC_IMPORT_REGEX):
+        count += sum(1 for _ in regex.finditer(content))
+    return count
+
+# --- Inputs ---
+
+def minified_bundle(statements: int) -> str:
+    """One line of webpack-like code: calls, strings and a require every 50 statements."""
+    body = "function f{i}(a,b){{return a.map(function(x){{return x*b+\"s{i}\"}}).filter(Boolean)}}var v{i}=f{i}([1,2],3);"
+    parts = [body.format(i=i) for i in range(statements)]
+    for i in range(0, statements, 50):
+        parts[i] += f"var m{i}=require(\"./chunk{i}\");"
+    parts.insert(0, "import x from'./entry';")
+    return "".join(parts)
+
+def regular_module(statements: int) -> str:
+    """Readable source: one statement per line, imports at the top."""
+    lines = [f"import mod{i} from './mod{i}';" for i in range(20)]
+    lines += [f"const value{i} = compute({i}, 'label {i}'); // note {i}" for i in range(statements)]
+    return "\n".join(lines) + "\n"
+
+def _time(func, content: str, repeat: int = 3):
+    """Returns (best time in seconds, number of imports found)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(content)
+        best = min(best, time.perf_counter() - start)
+    return best, result if isinstance(result, int) else len(result)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 4000, 16000],
+                        help="Number of statements per generated input.")
+    args = parser.parse_args()
+
+    print(f"{'input':<10} {'statements':>10} {'bytes':>10} {'legacy (s)':>11} {'found':>6}"
+          f" {'scanner (s)':>12} {'found':>6} {'speedup':>8}")
+    for name, factory in (("minified", minified_bundle), ("regular", regular_module)):
+        for size in args.sizes:
+            content = factory(size)
+            legacy, legacy_found = _time(legacy_scan, content)
+            scanner, scanner_found = _time(scan_javascript_imports, content)
+            print(f"{name:<10} {size:>10} {len(content):>10} {legacy:>11.4f} {legacy_found:>6}"
+                  f" {scanner:>12.4f} {scanner_found:>6} {legacy / scanner:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
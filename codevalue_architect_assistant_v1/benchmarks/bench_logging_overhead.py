@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: per-file cost of the debug logging in the scan/parse/resolve hot
+loops when debug output is off (--log-level INFO, the default).
+
+'unguarded' replays the messages the pipeline used to log for each file and
+import: logging.debug(f"...") with the f-string built every time, only to be
+dropped by the logger. 'guarded' is the current form, `if log.DEBUG:`
+around the same calls. Both use real Path objects and per-import values,
+like the pipeline does; the difference is pure logging overhead.
+
+Usage:
+    python benchmarks/bench_logging_overhead.py [--files 20000 --imports-per-file 20]
+"""
+
+import time
+import logging
+import argparse
+from pathlib import Path
+
+from codevalue_architect_assistant.utils import log
+
+def _synthetic_files(files: int, imports_per_file: int):
+    return [
+        (Path(f"/repo/src/package_{i // 50}/module_{i}.py"),
+         [(f"app.package_{(i + j) % 400 // 50}.module_{(i + j) % 400}", j + 1) for j in range(imports_per_file)])
+        for i in range(files)
+    ]
+
+def unguarded(files) -> None:
+    for path, imports in files:
+        logging.debug(f"Found file: {path}")
+        logging.debug(f"Detected language 'python' for file: {path}")
+        logging.debug(f"Attempting to parse Python file: {path}")
+        for module, line in imports:
+            logging.debug(f"Found import: {module} (alias: None) at line {line}")
+        logging.debug(f"Found {len(imports)} imports in {path}")
+        logging.debug(f"Processing python file for imports: {path}")
+
+def guarded(files) -> None:
+    for path, imports in files:
+        if log.DEBUG:
+            logging.debug(f"Found file: {path}")
+        if log.DEBUG:
+            logging.debug(f"Detected language 'python' for file: {path}")
+        if log.DEBUG:
+            logging.debug(f"Attempting to parse Python file: {path}")
+        for module, line in imports:
+            if log.DEBUG:
+                logging.debug(f"Found import: {module} (alias: None) at line {line}")
+        if log.DEBUG:
+            logging.debug(f"Found {len(imports)} imports in {path}")
+        if log.DEBUG:
+            logging.debug(f"Processing python file for imports: {path}")
+
+def _best_of(runs: int, function, files) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        function(files)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=20000)
+    parser.add_argument("--imports-per-file", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    log.configure_logging("INFO")
+    files = _synthetic_files(args.files, args.imports_per_file)
+    print(f"{args.files} files, {args.imports_per_file} imports each, log level INFO (best of {args.runs})")
+    print(f"{'variant':<10} {'total s':>8} {'us/file':>8}")
+    for name, function in (("unguarded", unguarded), ("guarded", guarded)):
+        elapsed = _best_of(args.runs, function, files)
+        print(f"{name:<10} {elapsed:>8.3f} {elapsed / args.files * 1e6:>8.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Mermaid generation, the previous list-and-join generator vs.
+write_mermaid_diagram() streaming to a file.
+
+'previous' replays the old algorithm: every line collected in a list, and
+each node checked for being isolated by scanning all emitted edge lines for
+its ID (O(N * E)), then joined into one string and written. 'streaming' is
+the current O(N + E) writer. Memory is the peak traced by tracemalloc during
+generation and writing, on top of the already built graph.
+
+Usage:
+    python benchmarks/bench_mermaid.py [--nodes 5000 --edges-per-node 8 --isolated 0.05]
+"""
+
+import os
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from codevalue_architect_assistant.models import DependencyMap
+from codevalue_architect_assistant.diagrams.mermaid_generator import write_mermaid_diagram, _sanitize_mermaid_id
+
+def synthetic_map(nodes: int, edges_per_node: int, isolated: float, seed: int = 1) -> DependencyMap:
+    rng = random.Random(seed)
+    names = [f"src/package_{i // 50}/module_{i}.py" for i in range(nodes)]
+    connected = int(nodes * (1 - isolated))
+    dep_map = DependencyMap(repository_root=Path("/repo"))
+    for name in names[connected:]:
+        dep_map.graph.add_node(name)
+    for name in names[:connected]:
+        for _ in range(edges_per_node):
+            dep_map.graph.add_edge(name, names[rng.randrange(connected)], type="import_from")
+    dep_map.graph.number_of_edges() # Compact before timing
+    return dep_map
+
+def previous(dep_map: DependencyMap, path: Path) -> None:
+    graph = dep_map.graph
+    names = graph.paths.names
+    sanitized_ids = [_sanitize_mermaid_id(name) for name in names]
+    lines = ["graph LR;"]
+    edges_added = set()
+    for u, v in graph.iter_edges():
+        edge_str = f'    {sanitized_ids[u]} --> {sanitized_ids[v]};'
+        if edge_str not in edges_added:
+            lines.append(edge_str)
+            edges_added.add(edge_str)
+    for node, node_id_sanitized in zip(names, sanitized_ids):
+        if not any(node_id_sanitized in edge for edge in edges_added):
+            lines.append(f'    {node_id_sanitized}["{node}"];')
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+def streaming(dep_map: DependencyMap, path: Path) -> None:
+    with path.open("w", encoding="utf-8") as sink:
+        write_mermaid_diagram(dep_map, sink)
+
+def _measure(function, dep_map, path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(dep_map, path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--edges-per-node", type=int, default=8)
+    parser.add_argument("--isolated", type=float, default=0.05, help="Share of nodes without edges")
+    args = parser.parse_args()
+
+    dep_map = synthetic_map(args.nodes, args.edges_per_node, args.isolated)
+    print(f"{dep_map.graph.number_of_nodes()} nodes, {dep_map.graph.number_of_edges()} edges")
+    print(f"{'variant':<10} {'time s':>8} {'peak MiB':>9} {'output MiB':>11}")
+    with tempfile.TemporaryDirectory() as out_dir:
+        outputs = []
+        for name, function in (("previous", previous), ("streaming", streaming)):
+            path = Path(out_dir, f"{name}.mmd")
+            elapsed, peak = _measure(function, dep_map, path)
+            outputs.append(path.read_bytes())
+            print(f"{name:<10} {elapsed:>8.3f} {peak / 2**20:>9.1f} {os.path.getsize(path) / 2**20:>11.1f}")
+        print("same output" if outputs[0] == outputs[1] else "outputs differ")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: diagram partitioning time at growing graph sizes.
+
+Graphs are synthetic repositories: files spread over a three-level
+directory tree, most imports staying in the same top-level package. For
+each size and strategy the time of partition_graph() is reported together
+with the time per node, which should stay roughly flat (near-linear
+scaling), and the number and largest size of the partitions.
+
+Usage:
+    python benchmarks/bench_partition.py [--sizes 10000 100000 --edges-per-node 8]
+"""
+
+import time
+import random
+import argparse
+
+from codevalue_architect_assistant.graph import CompactGraph
+from codevalue_architect_assistant.diagrams.partition import partition_graph, PARTITION_STRATEGIES
+
+def synthetic_graph(nodes: int, edges_per_node: int, seed: int = 1) -> CompactGraph:
+    rng = random.Random(seed)
+    names = [f"src/pkg_{i % 40}/sub_{i % 7}/leaf_{i % 3}/module_{i}.py" for i in range(nodes)]
+    graph = CompactGraph()
+    for name in names:
+        graph.add_node(name)
+    for i in range(nodes):
+        for _ in range(edges_per_node):
+            # Three in four imports stay in the same top-level package
+            j = rng.randrange(nodes)
+            if rng.random() < 0.75:
+                j -= (j - i) % 40
+            graph.add_edge_ids(i, j % nodes)
+    graph.number_of_edges() # Compact before timing
+    return graph
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--edges-per-node", type=int, default=8)
+    parser.add_argument("--max-nodes", type=int, default=500)
+    parser.add_argument("--max-edges", type=int, default=1500)
+    args = parser.parse_args()
+
+    print(f"{'nodes':>8} {'edges':>9} {'strategy':<10} {'time s':>8} {'us/node':>8} {'parts':>6} {'largest':>8}")
+    for size in args.sizes:
+        graph = synthetic_graph(size, args.edges_per_node)
+        for strategy in PARTITION_STRATEGIES:
+            start = time.perf_counter()
+            partitioning = partition_graph(graph, args.max_nodes, args.max_edges, strategy=strategy)
+            elapsed = time.perf_counter() - start
+            largest = max(len(partition.nodes) for partition in partitioning.partitions)
+            print(f"{size:>8} {graph.number_of_edges():>9} {strategy:<10} {elapsed:>8.2f} "
+                  f"{elapsed / size * 1e6:>8.1f} {len(partitioning.partitions):>6} {largest:>8}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Python import resolution through PythonModuleIndex vs. the legacy
+Path-based lookups.
+
+The legacy resolver (copied below, absolute imports only, from
+dependency_resolver.py before the index replaced it) builds and hashes several
+Path objects per import. The index is built once per run and answers each
+import with string dictionary lookups; its build time is reported separately.
+
+Usage:
+    python benchmarks/bench_python_resolver.py [--packages 50 200 800]
+"""
+
+import time
+import argparse
+from pathlib import Path
+from typing import List, Optional, Set
+
+from codevalue_architect_assistant.analysis.python_parser import RawImport
+from codevalue_architect_assistant.analysis.module_index import PythonModuleIndex
+from codevalue_architect_assistant.analysis.dependency_resolver import resolve_python_import
+
+# --- Legacy resolver ---
+
+def legacy_resolve(raw_import: RawImport, project_py_files_rel: Set[Path]) -> Optional[Path]:
+    if raw_import.is_from_import:
+        module_path_parts = raw_import.from_module.split('.')
+        potential_pkg_init = Path(*module_path_parts) / "__init__.py"
+        potential_module_file = Path(*module_path_parts[:-1]) / (module_path_parts[-1] + ".py")
+        if potential_pkg_init in project_py_files_rel:
+            return potential_pkg_init
+        if potential_module_file in project_py_files_rel:
+            return potential_module_file
+        return None
+    module_path_parts = raw_import.module_name.split('.')
+    potential_pkg_init = Path(*module_path_parts) / "__init__.py"
+    potential_module_file = Path(*module_path_parts[:-1]) / (module_path_parts[-1] + ".py") if len(module_path_parts) > 1 else Path(module_path_parts[0]).with_suffix(".py")
+    potential_top_pkg_init = Path(module_path_parts[0]) / "__init__.py"
+    for candidate in (potential_pkg_init, potential_module_file, potential_top_pkg_init):
+        if candidate in project_py_files_rel:
+            return candidate
+    return None
+
+# --- Inputs ---
+
+def synthetic_project(packages: int, modules_per_package: int = 10) -> Set[Path]:
+    files = set()
+    for p in range(packages):
+        files.add(Path(f"app/pkg{p}/__init__.py"))
+        for m in range(modules_per_package):
+            files.add(Path(f"app/pkg{p}/mod{m}.py"))
+    return files
+
+def synthetic_imports(packages: int, count: int) -> List[RawImport]:
+    """A mix of project imports (resolved) and stdlib / third-party imports (unresolved)."""
+    imports = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            imports.append(RawImport(f"app.pkg{i % packages}.mod{i % 10}", None, 1, False, None))
+        elif kind == 1:
+            imports.append(RawImport(f"mod{i % 10}", None, 1, True, f"app.pkg{i % packages}"))
+        elif kind == 2:
+            imports.append(RawImport("os.path", None, 1, False, None))
+        else:
+            imports.append(RawImport("Request", None, 1, True, "requests.models"))
+    return imports
+
+def _best(func, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packages", type=int, nargs="+", default=[50, 200, 800],
+                        help="Number of packages (10 modules each) in the generated project.")
+    parser.add_argument("--imports", type=int, default=20000, help="Number of imports resolved per run.")
+    args = parser.parse_args()
+
+    source = Path("app/main.py")
+    root = Path("/project")
+    print(f"{'packages':>8} {'files':>6} {'imports':>8} {'legacy (s)':>11} {'index build (s)':>16}"
+          f" {'index (s)':>10} {'speedup':>8}")
+    for packages in args.packages:
+        files = synthetic_project(packages)
+        imports = synthetic_imports(packages, args.imports)
+        index = PythonModuleIndex(files)
+        assert [legacy_resolve(imp, files) for imp in imports] == \
+               [resolve_python_import(imp, source, root, index).target_file for imp in imports]
+
+        legacy = _best(lambda: [legacy_resolve(imp, files) for imp in imports])
+        build = _best(lambda: PythonModuleIndex(files))
+        indexed = _best(lambda: [resolve_python_import(imp, source, root, index) for imp in imports])
+        print(f"{packages:>8} {len(files):>6} {len(imports):>8} {legacy:>11.4f} {build:>16.4f}"
+              f" {indexed:>10.4f} {legacy / (build + indexed):>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: memory held by the per-file and per-import records, with the
+previous dataclass layout vs. the current __slots__ records.
+
+A synthetic repository of --files files with --imports-per-file imports each
+(1M imports by default) is turned into ProjectFile, RawImport and Dependency
+records the way a run creates them: module names arrive as fresh strings from
+the parser, source paths are shared per file and target paths per target.
+The dataclass layout stores both paths of every file and keeps one module
+string per import; the current layout derives absolute paths from the shared
+root and interns module names through a PathTable.
+
+Memory is what tracemalloc still sees allocated once the records are built,
+divided by the number of records.
+
+Usage:
+    python benchmarks/bench_record_memory.py [--files 10000 --imports-per-file 100]
+"""
+
+import gc
+import argparse
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from codevalue_architect_assistant.graph import PathTable
+from codevalue_architect_assistant.models import Dependency, ProjectFile
+from codevalue_architect_assistant.analysis.python_parser import RawImport
+
+# --- The previous layout ---
+
+@dataclass
+class DataclassProjectFile:
+    path: Path
+    relative_path: Path
+    language: Optional[str] = None
+    size_bytes: Optional[int] = None
+    mtime_ns: Optional[int] = None
+
+@dataclass
+class DataclassRawImport:
+    module_name: str
+    alias: Optional[str]
+    line_number: int
+    is_from_import: bool
+    from_module: Optional[str] = None
+
+@dataclass
+class DataclassDependency:
+    source_file: Path
+    target_module: str
+    target_file: Optional[Path] = None
+    line_number: Optional[int] = None
+    type: str = "static_import"
+
+# --- Synthetic repository ---
+
+ROOT = Path("/repo")
+MODULES = 2000 # Distinct imported modules
+
+def _relative_paths(files: int):
+    return [Path(f"src/package_{i // 50}/module_{i}.py") for i in range(files)]
+
+def build_files(layout: str, relative_paths):
+    if layout == "dataclass":
+        return [DataclassProjectFile(ROOT / rel, rel, "python", 1000, 0) for rel in relative_paths]
+    return [ProjectFile(root=ROOT, relative_path=rel, language="python", size_bytes=1000, mtime_ns=0)
+            for rel in relative_paths]
+
+def build_imports(layout: str, relative_paths, imports_per_file: int):
+    """Returns (raw imports of one file, dependencies of all files)."""
+    targets = {i: Path(f"src/package_{i // 50}/module_{i}.py") for i in range(MODULES)}
+    raw_type, dep_type = (DataclassRawImport, DataclassDependency) if layout == "dataclass" else (RawImport, Dependency)
+    names = PathTable()
+    raw_imports, dependencies = [], []
+    for i, source in enumerate(relative_paths):
+        raw_imports = [] # A file's raw imports are dropped once it is resolved
+        for j in range(imports_per_file):
+            target = (i * 7 + j * 13) % MODULES
+            module = "".join(("app.package_", str(target // 50), ".module_", str(target))) # A fresh string, as parsed
+            raw_imports.append(raw_type(module, None, j + 1, False))
+            if layout != "dataclass":
+                module = names.canonical(module)
+            dependencies.append(dep_type(source, module, targets[target] if j % 4 else None, j + 1))
+    return raw_imports, dependencies
+
+def _retained(build, *args):
+    gc.collect()
+    tracemalloc.start()
+    result = build(*args)
+    gc.collect()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, current
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=10000)
+    parser.add_argument("--imports-per-file", type=int, default=100)
+    args = parser.parse_args()
+
+    relative_paths = _relative_paths(args.files)
+    imports = args.files * args.imports_per_file
+    print(f"{imports} imports in {args.files} files ({MODULES} distinct modules)")
+    print(f"{'layout':<10} {'files MiB':>10} {'B/file':>7} {'imports MiB':>12} {'B/import':>9} "
+          f"{'B/RawImport':>12} {'B/Dependency':>13}")
+    for layout in ("dataclass", "slots"):
+        files, file_bytes = _retained(build_files, layout, relative_paths)
+        (raw_imports, dependencies), import_bytes = _retained(build_imports, layout, relative_paths, args.imports_per_file)
+        del files, raw_imports, dependencies
+        # Per-record sizes on their own (strings and paths excluded)
+        raw = RawImport("m", None, 1, False) if layout == "slots" else DataclassRawImport("m", None, 1, False)
+        dep = Dependency(ROOT, "m") if layout == "slots" else DataclassDependency(ROOT, "m")
+        _, raw_bytes = _retained(lambda: [type(raw)("m", None, 1, False) for _ in range(10000)])
+        _, dep_bytes = _retained(lambda: [type(dep)(ROOT, "m") for _ in range(10000)])
+        print(f"{layout:<10} {file_bytes / 2**20:>10.1f} {file_bytes / args.files:>7.0f} "
+              f"{import_bytes / 2**20:>12.1f} {import_bytes / imports:>9.0f} "
+              f"{raw_bytes / 10000:>12.0f} {dep_bytes / 10000:>13.0f}")
+
+if __name__ == "__main__":
+    main()
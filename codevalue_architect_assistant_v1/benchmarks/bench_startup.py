@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: start-up time of `arch-assist --help` and `arch-assist analyze`.
+
+Each case runs in a fresh interpreter, --runs times; the median wall time is
+reported next to that of a bare interpreter, and the difference (the cost of
+our imports and the command itself) is checked against a budget. The exit
+status is 1 if a case is over budget, so this can guard a pre-commit or CI
+step.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 15 --help-budget-ms 100 --analyze-budget-ms 150]
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+
+def _median_ms(args, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def _cli_args(*cli_args: str):
+    return [sys.executable, "-c", f"from codevalue_architect_assistant.cli import cli; cli({list(cli_args)!r})"]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--help-budget-ms", type=float, default=100)
+    parser.add_argument("--analyze-budget-ms", type=float, default=150)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as repo:
+        for i in range(20):
+            Path(repo, f"module_{i}.py").write_text("import os\n", encoding="utf-8")
+        baseline = _median_ms([sys.executable, "-c", "pass"], args.runs)
+        cases = (
+            ("--help", _cli_args("--help"), args.help_budget_ms),
+            ("analyze", _cli_args("analyze", repo), args.analyze_budget_ms),
+        )
+        print(f"bare interpreter: {baseline:.0f} ms (median of {args.runs})")
+        print(f"{'case':<10} {'median ms':>10} {'overhead ms':>12} {'budget ms':>10}")
+        over_budget = False
+        for name, command, budget in cases:
+            median = _median_ms(command, args.runs)
+            overhead = median - baseline
+            over_budget |= overhead > budget
+            print(f"{name:<10} {median:>10.0f} {overhead:>12.0f} {budget:>10.0f}{'  OVER BUDGET' if overhead > budget else ''}")
+    sys.exit(1 if over_budget else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+Architecture rules (layers and slices) checked against the dependency graph.
+
+Rules are read from a JSON file (comments and trailing commas allowed, as
+in tsconfig.json), by default .archrules.json at the repository root:
+
+    {
+      "layers": {
+        "domain": ["src/app/domain"],
+        "infrastructure": ["src/app/infra/**", "re:src/app/adapters/.*_db\\.py"]
+      },
+      "rules": [
+        {"from": "domain", "forbid": ["infrastructure"]},
+        {"name": "api stays thin", "from": "api", "allow": ["domain"]}
+      ],
+      "slices": {"features": "src/app/features/*"}
+    }
+
+Selectors are globs over repository-relative paths ('*' within a directory,
+'**' across directories, a plain path also covers what is below it) or,
+prefixed with 're:', regular expressions matched against the whole path. A
+file belongs to the first layer with a matching selector. A rule forbids
+imports from a layer into the listed layers, or (with 'allow') into every
+layer not listed except its own. Files of a slice group (one slice per
+directory matched by its pattern, or per value of a regex's first group)
+must not import files of another slice of the same group.
+
+compile_rules() turns the rules into per-node lookup tables (the layer and
+slice of every node, and a layer-to-layer verdict table), so that
+check_architecture() is one pass over the edges.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ..graph import CompactGraph
+from .tsconfig import parse_jsonc
+
+ARCH_RULES_FILE = ".archrules.json"
+
+class ArchRulesError(ValueError):
+    """The rules file is missing, malformed or inconsistent."""
+
+@dataclass
+class LayerRule:
+    """Imports from the 'source' layers that are forbidden."""
+    name: str
+    sources: List[str]
+    forbid: List[str] = field(default_factory=list)
+    allow: Optional[List[str]] = None # If set, every other layer (but the importer's own) is forbidden
+
+@dataclass
+class ArchRules:
+    layers: Dict[str, List[str]] # Layer name -> selectors, in priority order
+    rules: List[LayerRule]
+    slices: Dict[str, str] # Slice group name -> pattern
+
+@dataclass
+class Violation:
+    source_file: str
+    target_file: str
+    line_number: Optional[int]
+    rule: str # Name of the broken rule
+
+# --- Loading ---
+
+def _string_list(value: Any, what: str) -> List[str]:
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return value
+    raise ArchRulesError(f"{what} must be a string or a list of strings")
+
+def parse_arch_rules(data: Any) -> ArchRules:
+    """
+    Validates parsed rules (see the module docstring for the format).
+
+    Raises:
+        ArchRulesError: If the rules are malformed or refer to unknown layers.
+    """
+    if not isinstance(data, dict):
+        raise ArchRulesError("the rules must be a JSON object")
+    layers_data = data.get("layers", {})
+    if not isinstance(layers_data, dict):
+        raise ArchRulesError("'layers' must map layer names to selectors")
+    layers = {name: _string_list(selectors, f"selectors of layer '{name}'") for name, selectors in layers_data.items()}
+
+    rules = []
+    for number, rule_data in enumerate(data.get("rules", []), 1):
+        if not isinstance(rule_data, dict) or "from" not in rule_data or ("forbid" in rule_data) == ("allow" in rule_data):
+            raise ArchRulesError(f"rule {number} needs 'from' and either 'forbid' or 'allow'")
+        sources = _string_list(rule_data["from"], f"'from' of rule {number}")
+        forbid = _string_list(rule_data.get("forbid", []), f"'forbid' of rule {number}")
+        allow = _string_list(rule_data["allow"], f"'allow' of rule {number}") if "allow" in rule_data else None
+        for layer in sources + forbid + (allow or []):
+            if layer not in layers:
+                raise ArchRulesError(f"rule {number} refers to unknown layer '{layer}'")
+        if "name" in rule_data:
+            name = str(rule_data["name"])
+        elif allow is not None:
+            name = f"{'/'.join(sources)} may only import {', '.join(allow) or 'itself'}"
+        else:
+            name = f"{'/'.join(sources)} must not import {', '.join(forbid)}"
+        rules.append(LayerRule(name, sources, forbid, allow))
+
+    slices = data.get("slices", {})
+    if not isinstance(slices, dict) or not all(isinstance(pattern, str) for pattern in slices.values()):
+        raise ArchRulesError("'slices' must map slice group names to a pattern")
+    return ArchRules(layers, rules, slices)
+
+def load_arch_rules(path: Union[str, Path]) -> ArchRules:
+    """
+    Reads a rules file.
+
+    Raises:
+        ArchRulesError: If the file cannot be read or its rules are invalid.
+    """
+    try:
+        data = parse_jsonc(Path(path).read_text(encoding="utf-8"))
+    except OSError as e:
+        raise ArchRulesError(f"cannot read {path}: {e}") from e
+    except ValueError as e:
+        raise ArchRulesError(f"{path} is not valid JSON: {e}") from e
+    return parse_arch_rules(data)
+
+# --- Compiling ---
+
+def _glob_to_regex(glob: str) -> str:
+    if not any(char in glob for char in "*?["):
+        return re.escape(glob.rstrip("/")) + "(?:/.*)?"
+    parts, index = [], 0
+    while index < len(glob):
+        if glob.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+        elif glob.startswith("**", index):
+            parts.append(".*")
+            index += 2
+        elif glob[index] == "*":
+            parts.append("[^/]*")
+            index += 1
+        elif glob[index] == "?":
+            parts.append("[^/]")
+            index += 1
+        else:
+            parts.append(re.escape(glob[index]))
+            index += 1
+    return "".join(parts)
+
+def selector_regex(selector: str) -> str:
+    """The regular expression (to match a whole path) of a glob or 're:' selector."""
+    return selector[3:] if selector.startswith("re:") else _glob_to_regex(selector)
+
+@dataclass
+class CompiledRules:
+    """Lookup tables of ArchRules for one graph."""
+    rule_names: List[str]
+    layer_of: List[int] # Per node: layer index, or -1
+    verdict: List[List[int]] # [source layer][target layer]: index of the broken rule, or -1
+    slice_of: List[int] # Per node: slice ID, or -1
+    slice_group_of: List[int] # Per slice ID: its group's rule index
+
+def compile_rules(rules: ArchRules, graph: CompactGraph) -> CompiledRules:
+    """
+    Computes the layer and slice of every node of the graph, and the verdict table.
+
+    All layer selectors are joined into one regular expression with a
+    group per layer, so each node is matched once.
+
+    Raises:
+        ArchRulesError: If a regular expression selector is invalid.
+    """
+    layer_names = list(rules.layers)
+    layer_index = {name: index for index, name in enumerate(layer_names)}
+    try:
+        layer_pattern = re.compile("|".join(
+            f"(?P<layer{index}>{'|'.join(f'(?:{selector_regex(selector)})' for selector in rules.layers[name])})"
+            for index, name in enumerate(layer_names) if rules.layers[name]
+        ) or "(?!)")
+        slice_patterns = [
+            re.compile(pattern[3:] if pattern.startswith("re:") else f"({_glob_to_regex(pattern)})(?=/)")
+            for pattern in rules.slices.values()
+        ]
+    except re.error as e:
+        raise ArchRulesError(f"invalid regular expression: {e}") from e
+
+    rule_names = [rule.name for rule in rules.rules]
+    verdict = [[-1] * len(layer_names) for _ in layer_names]
+    for rule_index, rule in enumerate(rules.rules):
+        for source in rule.sources:
+            row = verdict[layer_index[source]]
+            if rule.allow is None:
+                forbidden = [layer_index[layer] for layer in rule.forbid]
+            else:
+                allowed = {layer_index[layer] for layer in rule.allow} | {layer_index[source]}
+                forbidden = [index for index in range(len(layer_names)) if index not in allowed]
+            for target in forbidden:
+                if row[target] == -1: # The first rule that forbids an import reports it
+                    row[target] = rule_index
+
+    layer_of, slice_of, slice_group_of = [], [], []
+    slice_ids: Dict[tuple, int] = {}
+    for group_name in rules.slices:
+        rule_names.append(f"slices of '{group_name}' must not import each other")
+    first_slice_rule = len(rules.rules)
+    for name in graph.paths.names:
+        path = name.replace("\\", "/")
+        match = layer_pattern.fullmatch(path)
+        layer_of.append(int(match.lastgroup[5:]) if match else -1)
+        slice_id = -1
+        for group, pattern in enumerate(slice_patterns):
+            match = pattern.match(path)
+            if match:
+                key = (group, match.group(1) if pattern.groups else match.group(0))
+                slice_id = slice_ids.get(key, -1)
+                if slice_id == -1:
+                    slice_id = slice_ids[key] = len(slice_group_of)
+                    slice_group_of.append(first_slice_rule + group)
+                break
+        slice_of.append(slice_id)
+    return CompiledRules(rule_names, layer_of, verdict, slice_of, slice_group_of)
+
+# --- Checking ---
+
+def check_architecture(graph: CompactGraph, rules: ArchRules) -> List[Violation]:
+    """
+    Finds the imports that break the rules, in one pass over the edges.
+
+    Returns:
+        The violations, in graph edge order (grouped by importing file).
+    """
+    compiled = compile_rules(rules, graph)
+    names = graph.paths.names
+    layer_of, verdict, slice_of, slice_group_of = (
+        compiled.layer_of, compiled.verdict, compiled.slice_of, compiled.slice_group_of
+    )
+    violations = []
+    for u, v, _, line in graph.iter_edge_data():
+        broken = -1
+        source_layer, target_layer = layer_of[u], layer_of[v]
+        if source_layer != -1 and target_layer != -1:
+            broken = verdict[source_layer][target_layer]
+        if broken == -1:
+            source_slice, target_slice = slice_of[u], slice_of[v]
+            if (source_slice != -1 and target_slice != -1 and source_slice != target_slice
+                    and slice_group_of[source_slice] == slice_group_of[target_slice]):
+                broken = slice_group_of[source_slice]
+        if broken != -1:
+            violations.append(Violation(names[u], names[v], line, compiled.rule_names[broken]))
+    return violations
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+Import cycle detection over the dependency graph.
+
+Every import cycle lies within one strongly connected component (SCC) of
+the graph; a cycle group is an SCC of more than one file, or a single file
+importing itself. The SCCs are found with Tarjan's algorithm, run with an
+explicit stack instead of recursion so that long import chains cannot hit
+the interpreter's recursion limit. It reads the CSR arrays directly and
+takes O(N + E).
+
+For each group, example_cycle() gives one shortest cycle through the
+group's first file, by breadth-first search inside the group.
+"""
+
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Union
+
+from ..graph import CompactGraph
+
+@dataclass
+class CycleGroup:
+    """Files that import each other in a cycle, directly or through one another."""
+    files: List[str] # Sorted
+    example: List[str] = field(default_factory=list) # A shortest cycle through files[0], first file repeated at the end
+
+def strongly_connected_components(graph: CompactGraph) -> List[List[int]]:
+    """
+    Returns the SCCs of a graph as lists of node IDs, each SCC after all SCCs it depends on.
+
+    Iterative Tarjan: each frame of the work stack is a node and the
+    position of the next outgoing edge to explore.
+    """
+    offsets, targets = graph.csr()
+    node_count = len(offsets) - 1
+    index = [-1] * node_count # Discovery order
+    low = [0] * node_count # Smallest discovery index reachable through the DFS subtree and one back edge
+    on_stack = [False] * node_count
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(node_count):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, offsets[root])]
+        while work:
+            node, position = work[-1]
+            end = offsets[node + 1]
+            while position < end:
+                child = targets[position]
+                position += 1
+                if index[child] == -1:
+                    # Descend; resume this node at the next edge afterwards
+                    work[-1] = (node, position)
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, offsets[child]))
+                    break
+                if on_stack[child] and index[child] < low[node]:
+                    low[node] = index[child]
+            else:
+                # All edges of node explored
+                work.pop()
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+    return components
+
+def example_cycle(graph: CompactGraph, start: int, members: FrozenSet[int]) -> List[int]:
+    """
+    A shortest cycle through start that stays within members (start's SCC).
+
+    Returns:
+        The node IDs along the cycle, start first and last, e.g. [a, b, a].
+    """
+    offsets, targets = graph.csr()
+    parents: Dict[int, int] = {start: start}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for position in range(offsets[node], offsets[node + 1]):
+            child = targets[position]
+            if child == start:
+                path = [node]
+                while path[-1] != start:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                path.append(start)
+                return path
+            if child in members and child not in parents:
+                parents[child] = node
+                queue.append(child)
+    return [] # Not reached for a node of a cycle group
+
+def find_cycles(graph: CompactGraph) -> List[CycleGroup]:
+    """
+    Finds the import cycle groups of a graph.
+
+    Returns:
+        The groups, largest first (then by first file), each with an example cycle.
+    """
+    names = graph.paths.names
+    offsets, targets = graph.csr()
+    groups = []
+    for component in strongly_connected_components(graph):
+        if len(component) == 1:
+            node = component[0]
+            if node not in targets[offsets[node]:offsets[node + 1]]:
+                continue # Not a self-import
+        start = min(component, key=names.__getitem__)
+        example = example_cycle(graph, start, frozenset(component))
+        groups.append(CycleGroup(sorted(names[node] for node in component), [names[node] for node in example]))
+    groups.sort(key=lambda group: (-len(group.files), group.files[0]))
+    logging.info(f"Found {len(groups)} import cycle groups among {len(names)} nodes")
+    return groups
+
+# --- Baseline ---
+
+def load_baseline(path: Union[str, Path]) -> List[FrozenSet[str]]:
+    """
+    Reads the cycle groups recorded by write_baseline().
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If it is not a baseline file.
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or not isinstance(data.get("cycles"), list):
+        raise ValueError(f"{path} is not a cycles baseline (expected an object with a 'cycles' list)")
+    return [frozenset(files) for files in data["cycles"]]
+
+def write_baseline(path: Union[str, Path], groups: Sequence[CycleGroup]) -> None:
+    """Records the files of each cycle group, so later runs can tell new cycles from known ones."""
+    Path(path).write_text(json.dumps({"cycles": [group.files for group in groups]}, indent=2) + "\n", encoding="utf-8")
+
+def new_cycle_groups(groups: Iterable[CycleGroup], baseline: Optional[Sequence[FrozenSet[str]]]) -> List[CycleGroup]:
+    """
+    The groups not covered by the baseline.
+
+    A group is known if all its files formed one group of the baseline
+    (or part of one, e.g. after a cycle was partly broken). A group that
+    grew or merged with another is new. Without a baseline every group is new.
+    """
+    if baseline is None:
+        return list(groups)
+    known_group = {file: index for index, files in enumerate(baseline) for file in files}
+    new_groups = []
+    for group in groups:
+        indexes = {known_group.get(file) for file in group.files}
+        if len(indexes) != 1 or None in indexes:
+            new_groups.append(group)
+    return new_groups
@@ -5,12 +5,23 @@ or marks them as external/unresolved.
 """
 
 import logging
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Set, Optional, ForwardRef
+from typing import Dict, Iterator, List, Set, Optional, ForwardRef, Sequence, Tuple, Union
 
+from ..graph import PathTable
 from ..models import Dependency, ProjectFile, AnalysisResult # Added AnalysisResult
 from .python_parser import RawImport, parse_python_file # Added parse_python_file
 from .javascript_parser import JSRawImport, parse_javascript_file # Added JS parser imports
+from .parse_cache import ParseCache, LANGUAGE_PARSERS, content_hash_of
+from .module_index import PythonModuleIndex, JavaScriptFileIndex, TS_RESOLVE_EXTENSIONS, TS_INDEX_FILES
+from .node_resolver import NodePackageIndex, MANIFEST_NAME
+from .tsconfig import TsConfigIndex, TSCONFIG_NAME
+from ..utils.content import read_file_content
+from ..utils.profiling import Profiler
+from ..utils import log
 
 # --- Python Import Resolution ---
 
@@ -18,88 +29,65 @@ def resolve_python_import(
     raw_import: RawImport,
     source_file_rel_path: Path, # Relative path of the file containing the import
     project_root: Path,
-    project_py_files_rel: Set[Path] # Set of all known .py file relative paths
+    project_py_files_rel: Union[Set[Path], PythonModuleIndex] # Known .py files, or an index built from them
 ) -> Dependency:
     """
     Attempts to resolve a single Python RawImport to a specific file within the project.
-    (Implementation details omitted for brevity - assume it's the same as before)
+
+    - 'import a.b.c' resolves to a/b/c/__init__.py or a/b/c.py, else to the
+      top-level package a/__init__.py.
+    - 'from a.b import c' resolves to the module a.b.c if there is one (c is a
+      submodule), else to the module or package a.b.
+    - Relative imports resolve against the importing file's directory, the same way.
+
+    Args:
+        raw_import: The import to resolve.
+        source_file_rel_path: Relative path of the file containing the import.
+        project_root: Absolute path to the project root.
+        project_py_files_rel: A PythonModuleIndex (build one per run when resolving
+            many imports), or the set of .py file relative paths to build it from.
+
+    Returns:
+        A Dependency; target_file is None if the import is not a project file.
     """
+    index = project_py_files_rel
+    if not isinstance(index, PythonModuleIndex):
+        index = PythonModuleIndex(project_py_files_rel)
+
     target_file: Optional[Path] = None
-    target_module_str: str = ""
 
     if raw_import.is_from_import:
-        base_module = raw_import.from_module
+        base_module = raw_import.from_module or ""
         imported_item = raw_import.module_name
-        target_module_str = (base_module or "") + "." + imported_item # Simplified representation
+        # 'from . import x' -> '.x'; 'from .a import x' -> '.a.x'
+        target_module_str = base_module + imported_item if base_module.endswith('.') else base_module + "." + imported_item
 
-        if base_module and base_module.startswith('.'):
-            # Relative Import Logic (Simplified for brevity)
-            level = base_module.count('.')
+        if base_module.startswith('.'):
             module_part = base_module.lstrip('.')
-            current_dir = source_file_rel_path.parent
-            for _ in range(level - 1):
-                current_dir = current_dir.parent
-
-            potential_target_dir = current_dir # Directory calculated based on level
-            potential_target_name = module_part # Name part after dots (e.g., 'utils', or '' for 'from . import X')
-
-            target_file = None # Reset target_file before checking
-
-            if potential_target_name:
-                # Case 1: from .module import X OR from .package import X
-                # Check for module: current_dir / module.py
-                potential_module_file_abs = (potential_target_dir / potential_target_name).with_suffix(".py")
-                potential_module_file_rel = potential_module_file_abs.relative_to(project_root) if potential_module_file_abs.is_relative_to(project_root) else None
-                if potential_module_file_rel and potential_module_file_rel in project_py_files_rel:
-                    target_file = potential_module_file_rel
-
-                # Check for package: current_dir / module / __init__.py
-                potential_pkg_init_abs = potential_target_dir / potential_target_name / "__init__.py"
-                potential_pkg_init_rel = potential_pkg_init_abs.relative_to(project_root) if potential_pkg_init_abs.is_relative_to(project_root) else None
-                if not target_file and potential_pkg_init_rel and potential_pkg_init_rel in project_py_files_rel:
-                     target_file = potential_pkg_init_rel
+            level = len(base_module) - len(module_part)
+            if module_part:
+                # from .package import submodule, else from .module import X / from .package import X
+                if imported_item != '*':
+                    target_file = index.lookup_relative(source_file_rel_path, level, module_part + "." + imported_item)
+                if target_file is None:
+                    target_file = index.lookup_relative(source_file_rel_path, level, module_part)
             else:
-                # Case 2: from . import name OR from .. import name
-                # Here, 'name' is in raw_import.module_name, not base_module/module_part
-                imported_item_name = raw_import.module_name
-
-                # Check for module: current_dir / name.py
-                potential_module_file_abs = (potential_target_dir / imported_item_name).with_suffix(".py")
-                potential_module_file_rel = potential_module_file_abs.relative_to(project_root) if potential_module_file_abs.is_relative_to(project_root) else None
-                if potential_module_file_rel and potential_module_file_rel in project_py_files_rel:
-                    target_file = potential_module_file_rel
-
-                # Check for package: current_dir / name / __init__.py
-                potential_pkg_init_abs = potential_target_dir / imported_item_name / "__init__.py"
-                potential_pkg_init_rel = potential_pkg_init_abs.relative_to(project_root) if potential_pkg_init_abs.is_relative_to(project_root) else None
-                if not target_file and potential_pkg_init_rel and potential_pkg_init_rel in project_py_files_rel:
-                     target_file = potential_pkg_init_rel
+                # from . import name: the name is a module of the package
+                target_file = index.lookup_relative(source_file_rel_path, level, imported_item)
 
         elif base_module:
-            # Absolute Import Logic (Simplified for brevity)
-            module_path_parts = base_module.split('.')
-            potential_pkg_init = Path(*module_path_parts) / "__init__.py"
-            potential_module_file = Path(*module_path_parts[:-1]) / (module_path_parts[-1] + ".py") if len(module_path_parts) > 0 else Path(module_path_parts[0]).with_suffix(".py")
-
-            if potential_pkg_init in project_py_files_rel:
-                 target_file = potential_pkg_init
-            elif potential_module_file in project_py_files_rel:
-                 target_file = potential_module_file
-        # else: from . import x case handled by relative logic
+            if imported_item != '*':
+                target_file = index.lookup(base_module + "." + imported_item) # The item is a submodule
+            if target_file is None:
+                target_file = index.lookup(base_module)
 
     else: # Direct import: import x.y.z
         target_module_str = raw_import.module_name
-        module_path_parts = target_module_str.split('.')
-        potential_pkg_init = Path(*module_path_parts) / "__init__.py"
-        potential_module_file = Path(*module_path_parts[:-1]) / (module_path_parts[-1] + ".py") if len(module_path_parts) > 1 else Path(module_path_parts[0]).with_suffix(".py")
-        potential_top_pkg_init = Path(module_path_parts[0]) / "__init__.py" # Check top level package too
-
-        if potential_pkg_init in project_py_files_rel:
-            target_file = potential_pkg_init
-        elif potential_module_file in project_py_files_rel:
-             target_file = potential_module_file
-        elif potential_top_pkg_init in project_py_files_rel:
-             target_file = potential_top_pkg_init # Link to top package if sub-module/pkg not found directly
+        target_file = index.lookup(target_module_str)
+        if target_file is None:
+            top_level = target_module_str.partition('.')[0]
+            if index.is_package(top_level):
+                target_file = index.lookup(top_level) # Link to top package if sub-module/pkg not found directly
 
     dependency = Dependency(
         source_file=source_file_rel_path,
@@ -112,82 +100,60 @@ def resolve_python_import(
 
 # --- JavaScript Import Resolution ---
 
-def _try_resolve_js_path(
-    base_path: Path,
-    project_root: Path,
-    project_js_files_rel: Set[Path]
-) -> Optional[Path]:
-    """Helper to check variations of a JS path against known project files."""
-    # 1. Try exact path + extensions
-    for ext in ['.js', '.mjs', '.cjs', '.json']: # Add .json as it's often required
-        potential_file = base_path.with_suffix(ext)
-        if potential_file.is_relative_to(project_root):
-             rel_path = potential_file.relative_to(project_root)
-             if rel_path in project_js_files_rel:
-                 return rel_path
-
-    # 2. Try as directory + index + extensions
-    for ext in ['index.js', 'index.mjs', 'index.cjs']:
-        potential_file = base_path / ext
-        if potential_file.is_relative_to(project_root):
-            rel_path = potential_file.relative_to(project_root)
-            if rel_path in project_js_files_rel:
-                return rel_path
-
-    return None
-
-
 def resolve_javascript_import(
     raw_import: JSRawImport,
     source_file_rel_path: Path, # Relative path of the file containing the import
     project_root: Path,
-    project_js_files_rel: Set[Path] # Set of all known .js/.mjs/.cjs file relative paths
+    project_js_files_rel: Union[Set[Path], JavaScriptFileIndex], # Known .js/.mjs/.cjs/.json files, or an index built from them
+    node_packages: Optional[NodePackageIndex] = None
 ) -> Dependency:
     """
     Attempts to resolve a single JSRawImport to a specific file within the project.
-    Handles relative paths and basic absolute paths from root. Bare specifiers are unresolved.
+    Handles relative paths and basic absolute paths from root. Bare specifiers are
+    resolved through workspace packages and node_modules when node_packages is given,
+    and are unresolved otherwise.
+
+    Resolution is lexical: specifiers are normalised as strings and looked up in
+    a JavaScriptFileIndex, so no filesystem calls are made.
+
+    Args:
+        raw_import: The import to resolve.
+        source_file_rel_path: Relative path of the file containing the import.
+        project_root: Absolute path to the project root.
+        project_js_files_rel: A JavaScriptFileIndex (build one per run when resolving
+            many imports), or the set of file relative paths to build it from.
+        node_packages: Optional index of workspace and installed packages.
+
+    Returns:
+        A Dependency; target_file is None if the import is not a project file.
     """
+    index = project_js_files_rel
+    if not isinstance(index, JavaScriptFileIndex):
+        index = JavaScriptFileIndex(project_js_files_rel)
+
     specifier = raw_import.module_specifier
     target_file: Optional[Path] = None
 
-    if specifier.startswith('.'):
-        # --- Relative Import ---
-        # Resolve relative to the source file's directory
-        base_dir = (project_root / source_file_rel_path).parent
-        try:
-            # Use os.path.normpath or similar logic if Path.resolve causes issues with '..'
-            # Path.resolve() might go outside project root, handle carefully
-            potential_target_abs = (base_dir / specifier).resolve()
-
-            # Check variations (.js, /index.js, etc.) relative to project root
-            target_file = _try_resolve_js_path(potential_target_abs, project_root, project_js_files_rel)
-
+    if specifier.startswith('.') or specifier.startswith('/'):
+        # --- Relative import, or absolute path from the project root ---
+        target_file = index.resolve(source_file_rel_path, specifier)
+        if log.DEBUG:
             if target_file:
-                logging.debug(f"Resolved relative JS import '{specifier}' to {target_file}")
+                logging.debug(f"Resolved JS import '{specifier}' to {target_file}")
             else:
-                logging.debug(f"Could not resolve relative JS import '{specifier}' from {source_file_rel_path}")
-
-        except Exception as e: # Broad exception for path resolution issues
-             logging.warning(f"Error resolving relative JS path '{specifier}' from {source_file_rel_path}: {e}")
-
-
-    elif specifier.startswith('/'):
-         # --- Absolute path from root? (Less common for imports, maybe config paths) ---
-         # Treat '/' as relative to project_root
-         potential_target_abs = (project_root / specifier.lstrip('/')).resolve()
-         target_file = _try_resolve_js_path(potential_target_abs, project_root, project_js_files_rel)
-         if target_file:
-             logging.debug(f"Resolved absolute JS import '{specifier}' to {target_file}")
-         else:
-             logging.debug(f"Could not resolve absolute JS import '{specifier}' from {source_file_rel_path}")
+                logging.debug(f"Could not resolve JS import '{specifier}' from {source_file_rel_path}")
 
     # Add check for windows absolute paths C:\... if necessary, treat as unresolved
 
     else:
-        # --- Bare specifier (e.g., 'react', 'lodash', 'my-module') ---
-        # Assume external or node_modules (unresolved for now)
-        # TODO: Could add logic to check node_modules later
-        logging.debug(f"Treating bare JS specifier '{specifier}' as external/unresolved.")
+        # --- Bare specifier (e.g., 'react', 'lodash', '@org/ui/button') ---
+        if node_packages is not None:
+            target_file = node_packages.resolve(source_file_rel_path, specifier, is_require=raw_import.type == 'require')
+        if log.DEBUG:
+            if target_file:
+                logging.debug(f"Resolved JS package import '{specifier}' to {target_file}")
+            else:
+                logging.debug(f"Treating bare JS specifier '{specifier}' as external/unresolved.")
 
 
     dependency = Dependency(
@@ -200,64 +166,317 @@ def resolve_javascript_import(
     return dependency
 
 
-# --- Combined Dependency Resolution ---
+# --- TypeScript Import Resolution ---
 
-def resolve_all_dependencies(
-    analysis_result: AnalysisResult,
-    project_root: Path
-) -> List[Dependency]:
+def resolve_typescript_import(
+    raw_import: JSRawImport,
+    source_file_rel_path: Path, # Relative path of the file containing the import
+    project_root: Path,
+    project_ts_files_rel: Union[Set[Path], JavaScriptFileIndex], # Known .ts/.tsx/.js/.json files, or a TypeScript index
+    node_packages: Optional[NodePackageIndex] = None,
+    tsconfigs: Optional[TsConfigIndex] = None
+) -> Dependency:
     """
-    Parses all supported files found in the analysis result and resolves their dependencies.
+    Attempts to resolve a single import of a TypeScript file to a project file.
+
+    Relative specifiers are resolved like JavaScript ones, preferring .ts/.tsx
+    files (so './util.js' also finds util.ts). Non-relative specifiers go
+    through the nearest tsconfig.json ("paths", then "baseUrl") and then
+    through workspace packages and node_modules.
 
     Args:
-        analysis_result: The result object from the initial scan.
+        raw_import: The import to resolve.
+        source_file_rel_path: Relative path of the file containing the import.
         project_root: Absolute path to the project root.
+        project_ts_files_rel: A JavaScriptFileIndex built with TS_RESOLVE_EXTENSIONS,
+            or the set of file relative paths to build it from.
+        node_packages: Optional index of workspace and installed packages.
+        tsconfigs: Optional index of the project's tsconfig.json files.
 
     Returns:
-        A list of all resolved Dependency objects from all languages.
+        A Dependency; target_file is None if the import is not a project file.
+    """
+    index = project_ts_files_rel
+    if not isinstance(index, JavaScriptFileIndex):
+        index = JavaScriptFileIndex(project_ts_files_rel, TS_RESOLVE_EXTENSIONS, TS_INDEX_FILES)
+
+    specifier = raw_import.module_specifier
+    target_file: Optional[Path] = None
+
+    if specifier.startswith('.') or specifier.startswith('/'):
+        target_file = index.resolve(source_file_rel_path, specifier)
+    else:
+        if tsconfigs is not None:
+            target_file = tsconfigs.resolve(source_file_rel_path, specifier)
+        if target_file is None and node_packages is not None:
+            target_file = node_packages.resolve(source_file_rel_path, specifier,
+                                                is_require=raw_import.type == 'require', file_index=index)
+    if log.DEBUG:
+        if target_file:
+            logging.debug(f"Resolved TS import '{specifier}' to {target_file}")
+        else:
+            logging.debug(f"Could not resolve TS import '{specifier}' from {source_file_rel_path}")
+
+    return Dependency(
+        source_file=source_file_rel_path,
+        target_module=specifier,
+        target_file=target_file,
+        line_number=raw_import.line_number,
+        type=raw_import.type # Including 'import_type' for type-only imports
+    )
+
+
+# --- Combined Dependency Resolution ---
+
+def _parse_project_file(
+    project_file: ProjectFile,
+    parse_cache: Optional[ParseCache] = None
+) -> List[Union[RawImport, JSRawImport]]:
+    """Parses a single file, going through the persistent cache when given."""
+    if parse_cache is not None:
+        return parse_cache.get_or_parse(project_file)
+    if project_file.language == 'python':
+        return parse_python_file(project_file.path)
+    if project_file.language in ('javascript', 'typescript'):
+        return parse_javascript_file(project_file.path)
+    return []
+
+# --- Parallel Parsing ---
+
+# (absolute path, language, hash of the cached content or None)
+_ParseTask = Tuple[str, str, Optional[str]]
+# (content hash, import records); records is None if the hash matched, both are None if unreadable
+_ParseOutcome = Tuple[Optional[str], Optional[List[tuple]]]
+
+def _parse_chunk(chunk: List[_ParseTask]) -> List[_ParseOutcome]:
     """
-    all_dependencies: List[Dependency] = []
+    Worker entry point: reads, hashes and parses a chunk of files.
 
-    # Prepare sets of known files for efficient lookup
-    project_py_files_rel: Set[Path] = {
-        pf.relative_path for pf in analysis_result.files if pf.language == 'python'
-    }
-    project_js_files_rel: Set[Path] = {
-        pf.relative_path for pf in analysis_result.files if pf.language == 'javascript'
-    }
-    # Add other language file sets here if needed
+    Only plain tuples cross the process boundary, so results are cheap to pickle.
+    """
+    outcomes: List[_ParseOutcome] = []
+    for path_str, language, known_hash in chunk:
+        try:
+            content = read_file_content(Path(path_str))
+        except OSError as e:
+            logging.warning(f"Could not read file {path_str} for parsing: {e}")
+            outcomes.append((None, None))
+            continue
+        content_hash = content_hash_of(content.data)
+        if content_hash == known_hash:
+            outcomes.append((content_hash, None))
+            continue
+        imports = LANGUAGE_PARSERS[language].parse_content(content)
+        outcomes.append((content_hash, [imp.to_record() for imp in imports]))
+    return outcomes
+
+def _chunked(items: List[_ParseTask], size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def _map_bounded(executor: Executor, function, items: Iterator, window: int) -> Iterator:
+    """
+    Like executor.map(), but keeps at most `window` items submitted and not yet
+    yielded, so results pile up only that far ahead of a slow consumer.
+    """
+    pending = deque()
+    try:
+        for item in items:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(function, item))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+def _iter_parsed_parallel(
+    files: List[ProjectFile],
+    jobs: int,
+    parse_cache: Optional[ParseCache] = None
+) -> Iterator[List[Union[RawImport, JSRawImport]]]:
+    """
+    Parses files on a pool of worker processes, yielding each file's imports in
+    the order of `files` as soon as they are available.
+
+    Cache lookups and stores stay in this process; workers only see files whose
+    metadata changed. At most two chunks per worker are in flight, so parsed
+    imports do not pile up when the consumer is slower than the workers.
+
+    Raises:
+        OSError / BrokenProcessPool: If the worker pool cannot be used.
+    """
+    fresh: List[bool] = []
+    tasks: List[_ParseTask] = []
+    for project_file in files:
+        is_fresh, known_hash = parse_cache.is_fresh(project_file) if parse_cache is not None else (False, None)
+        fresh.append(is_fresh)
+        if not is_fresh:
+            tasks.append((str(project_file.path), project_file.language, known_hash))
+
+    if not tasks:
+        for project_file in files:
+            yield parse_cache.lookup(project_file)[0]
+        return
+
+    # A few chunks per worker keeps the pool balanced without per-file IPC overhead
+    chunk_size = max(1, min(256, len(tasks) // (jobs * 4)))
+    logging.info(f"Parsing {len(tasks)} files on {jobs} worker processes (chunks of {chunk_size})")
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        outcomes = (outcome for chunk in _map_bounded(executor, _parse_chunk, _chunked(tasks, chunk_size), jobs * 2)
+                    for outcome in chunk)
+        for project_file, is_fresh in zip(files, fresh):
+            if is_fresh:
+                yield parse_cache.lookup(project_file)[0]
+                continue
+            content_hash, records = next(outcomes)
+            if content_hash is None:
+                yield []
+            elif records is None:
+                yield parse_cache.refresh(project_file)
+            else:
+                if parse_cache is not None:
+                    parse_cache.store(project_file, content_hash, records)
+                record_type = LANGUAGE_PARSERS[project_file.language].record_type
+                yield [record_type.from_record(record) for record in records]
+
+def _iter_parsed(
+    files: List[ProjectFile],
+    jobs: int,
+    parse_cache: Optional[ParseCache]
+) -> Iterator[List[Union[RawImport, JSRawImport]]]:
+    """Yields the imports of each file in order, in parallel when jobs > 1."""
+    done = 0
+    if jobs > 1 and len(files) > 1:
+        try:
+            for imports in _iter_parsed_parallel(files, jobs, parse_cache):
+                yield imports
+                done += 1
+        except (OSError, BrokenProcessPool) as e:
+            logging.warning(f"Parallel parsing unavailable ({e}); parsing the remaining files serially.")
+    for project_file in files[done:]:
+        yield _parse_project_file(project_file, parse_cache)
+
+def _resolve_raw_import(
+    raw_import: Union[RawImport, JSRawImport],
+    project_file: ProjectFile,
+    project_root: Path,
+    known_files: Dict[str, Union[Set[Path], PythonModuleIndex, JavaScriptFileIndex]],
+    node_packages: Optional[NodePackageIndex] = None,
+    tsconfigs: Optional[TsConfigIndex] = None
+) -> Dependency:
+    if project_file.language == 'python':
+        return resolve_python_import(raw_import, project_file.relative_path, project_root, known_files['python'])
+    if project_file.language == 'typescript':
+        return resolve_typescript_import(raw_import, project_file.relative_path, project_root, known_files['typescript'],
+                                         node_packages, tsconfigs)
+    return resolve_javascript_import(raw_import, project_file.relative_path, project_root, known_files['javascript'],
+                                     node_packages)
+
+def iter_dependencies(
+    analysis_result: AnalysisResult,
+    project_root: Path,
+    parse_cache: Optional[ParseCache] = None,
+    jobs: int = 1,
+    python_source_roots: Optional[Sequence[str]] = None,
+    names: Optional[PathTable] = None,
+    profiler: Optional[Profiler] = None
+) -> Iterator[Dependency]:
+    """
+    Parses all supported files found in the analysis result and yields their
+    dependencies one at a time, file by file.
+
+    Feed the result straight into DependencyMap.add_dependencies() so that only
+    the graph, and not every Dependency, is held in memory.
+
+    Args:
+        analysis_result: The result object from the initial scan.
+        project_root: Absolute path to the project root.
+        parse_cache: Optional persistent cache; unchanged files are not re-parsed.
+        jobs: Number of worker processes used for parsing. 1 parses in this process.
+        python_source_roots: Import roots for absolute Python imports, relative to
+            project_root (default: the root itself and 'src/' if present).
+        names: Table through which target module names are interned, so that the
+            dependencies of a run share one string per distinct module (default: a
+            new table per call).
+        profiler: Optional profiler; records the 'index', 'parse' (reading, decoding
+            and parsing, or cache lookups) and 'resolve' stages.
+
+    Yields:
+        Dependency objects from all languages, in file order (the same for any value of jobs).
+    """
+    profiler = profiler or Profiler(enabled=False)
+    with profiler.stage("index"):
+        # Prepare sets of known files for efficient lookup
+        known_files: Dict[str, Union[Set[Path], PythonModuleIndex, JavaScriptFileIndex]] = {language: set() for language in LANGUAGE_PARSERS}
+        supported_files: List[ProjectFile] = []
+        json_files: Set[Path] = set()
+        manifest_files: List[Path] = []
+        tsconfig_files: List[Path] = []
+        for pf in analysis_result.files:
+            if pf.language in known_files:
+                known_files[pf.language].add(pf.relative_path)
+                supported_files.append(pf)
+            elif pf.language == 'json':
+                json_files.add(pf.relative_path) # Targets of require('./data.json')
+                if pf.relative_path.name == MANIFEST_NAME:
+                    manifest_files.append(pf.relative_path)
+                elif pf.relative_path.name == TSCONFIG_NAME:
+                    tsconfig_files.append(pf.relative_path)
+        # Imports are resolved through lookup indexes built once per run
+        known_files['python'] = PythonModuleIndex(known_files['python'], python_source_roots)
+        # TypeScript files may import TypeScript, JavaScript and JSON files
+        known_files['typescript'] = JavaScriptFileIndex(
+            known_files['typescript'] | known_files['javascript'] | json_files, TS_RESOLVE_EXTENSIONS, TS_INDEX_FILES
+        )
+        known_files['javascript'] = JavaScriptFileIndex(known_files['javascript'] | json_files)
+        node_packages = NodePackageIndex(project_root, known_files['javascript'], manifest_files)
+        tsconfigs = TsConfigIndex(project_root, known_files['typescript'], tsconfig_files) if tsconfig_files else None
 
     logging.info("Starting dependency resolution for all supported languages...")
 
-    for project_file in analysis_result.files:
-        if project_file.language == 'python':
-            logging.debug(f"Processing Python file for imports: {project_file.relative_path}")
-            raw_imports = parse_python_file(project_file.path)
-            for raw_import in raw_imports:
-                resolved_dep = resolve_python_import(
-                    raw_import,
-                    project_file.relative_path,
-                    project_root,
-                    project_py_files_rel
-                )
-                all_dependencies.append(resolved_dep)
-
-        elif project_file.language == 'javascript':
-            logging.debug(f"Processing JavaScript file for imports/requires: {project_file.relative_path}")
-            raw_imports = parse_javascript_file(project_file.path)
+    names = names if names is not None else PathTable()
+    count = 0
+    parsed = _iter_parsed(supported_files, jobs, parse_cache)
+    for project_file in supported_files:
+        if log.DEBUG:
+            logging.debug(f"Processing {project_file.language} file for imports: {project_file.relative_path}")
+        # Stages are closed before yielding, so the consumer's time is not charged to them
+        with profiler.stage("parse") as stats:
+            raw_imports = next(parsed)
+            stats.files += 1
+            stats.bytes += project_file.size_bytes or 0
+            stats.items += len(raw_imports)
+        with profiler.stage("resolve") as stats:
+            dependencies = []
             for raw_import in raw_imports:
-                resolved_dep = resolve_javascript_import(
-                    raw_import,
-                    project_file.relative_path,
-                    project_root,
-                    project_js_files_rel # Pass the set of JS files
-                )
-                all_dependencies.append(resolved_dep)
-
-        # Add elif blocks for other supported languages here
-
-    logging.info(f"Finished dependency resolution. Found {len(all_dependencies)} total potential dependencies.")
-    return all_dependencies
+                dependency = _resolve_raw_import(raw_import, project_file, project_root, known_files, node_packages, tsconfigs)
+                dependency.target_module = names.canonical(dependency.target_module)
+                dependencies.append(dependency)
+            stats.items += len(dependencies)
+        count += len(dependencies)
+        yield from dependencies
+
+    logging.info(f"Finished dependency resolution. Found {count} total potential dependencies.")
+
+def resolve_all_dependencies(
+    analysis_result: AnalysisResult,
+    project_root: Path,
+    parse_cache: Optional[ParseCache] = None,
+    jobs: int = 1,
+    python_source_roots: Optional[Sequence[str]] = None,
+    names: Optional[PathTable] = None,
+    profiler: Optional[Profiler] = None
+) -> List[Dependency]:
+    """
+    Collects iter_dependencies() into a list (same arguments).
+
+    Returns:
+        A list of all resolved Dependency objects from all languages, in file order
+        (the same for any value of jobs).
+    """
+    return list(iter_dependencies(analysis_result, project_root, parse_cache, jobs, python_source_roots, names, profiler))
 
 
 # Need dataclasses import
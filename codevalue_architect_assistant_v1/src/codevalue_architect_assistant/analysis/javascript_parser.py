@@ -1,70 +1,366 @@
 # -*- coding: utf-8 -*-
 """
-Parses JavaScript files using Regex to extract require and import statements.
+Parses JavaScript and TypeScript files to extract require, import and
+export-from statements.
 
-Note: Regex-based parsing is less robust than AST parsing and may miss
-complex cases or produce false positives. This is an initial implementation.
+A single linear pass skips comments, strings, template literals and regex
+literals, and a small state machine recognizes the import forms after each
+require/import/export keyword. It is not a full parser: specifiers built at
+runtime (concatenation, template substitutions) are not resolved.
+
+TypeScript is scanned the same way; type-only imports and re-exports
+('import type', 'export type') are reported as 'import_type'. In TSX, an
+apostrophe in JSX text is read as the start of a string up to the end of its
+line, so an import on the same line after it would be missed.
 """
 
 import re
 import logging
 from pathlib import Path
-from typing import List, Optional
-from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from ..utils.content import FileContent, read_file_content
+from ..utils.records import Record
+from ..utils import log
+
+# Bump whenever the extracted imports can change for the same input,
+# so persisted parse results (see parse_cache.py) are invalidated.
+PARSER_VERSION = 3
 
 # Define a structure similar to Python's RawImport
-@dataclass
-class JSRawImport:
-    # Non-default fields first
-    module_specifier: str # The string inside require() or from ''
-    type: str # 'require', 'import_from', 'dynamic_import'
-    # Default fields last
-    imported_items: Optional[List[str]] = None # e.g., ['useState', 'useEffect'] in 'import { useState, useEffect } from "react"'
-    line_number: Optional[int] = None # Regex doesn't easily provide line numbers without extra work
-
-# Regex for CommonJS: require('module') or require("module")
-# Handles single or double quotes. Captures the module specifier.
-# Ignores lines starting with // or /* ... */ comments (basic attempt)
-# Doesn't handle complex multi-line requires or requires inside comments perfectly.
-REQUIRE_REGEX = re.compile(
-    r"^\s*(?!\/\/)(?!\/\*.*\*\/)"  # Ignore lines starting with // or /*...*/
-    r".*?\brequire\s*\(\s*['\"]"   # Match 'require(' with quotes
-    r"([^'\"]+)"                  # Capture the module specifier (non-quote characters)
-    r"['\"]\s*\)",                # Match closing quote and parenthesis
-    re.MULTILINE
-)
+class JSRawImport(Record):
+    __slots__ = ("module_specifier", "type", "imported_items", "line_number")
 
-# Regex for ES6 Imports: import ... from 'module' or import ... from "module"
-# Handles various import forms like:
-# import defaultExport from 'module';
-# import * as name from 'module';
-# import { export1 } from 'module';
-# import { export1 as alias1 } from 'module';
-# import { export1 , export2 } from 'module';
-# import defaultExport, { export1 } from 'module';
-# import defaultExport, * as name from 'module';
-# import 'module'; (for side effects) - This regex focuses on 'from' part
-# Captures the module specifier.
-# Basic comment ignoring.
-IMPORT_FROM_REGEX = re.compile(
-    r"^\s*(?!\/\/)(?!\/\*.*\*\/)"  # Ignore lines starting with // or /*...*/
-    r"import(?:.+?from\s*)?['\"]" # Match 'import ... from ' or 'import ' with quotes
-    r"([^'\"]+)"                  # Capture the module specifier
-    r"['\"]\s*;?",                # Match closing quote and optional semicolon
-    re.MULTILINE
-)
+    def __init__(
+        self,
+        module_specifier: str, # The string inside require() or from ''
+        type: str, # 'require', 'import_from', 'export_from', 'dynamic_import', 'import_type'
+        imported_items: Optional[List[str]] = None, # e.g., ['useState', 'useEffect'] in 'import { useState, useEffect } from "react"'
+        line_number: Optional[int] = None # Line of the require/import/export keyword
+    ):
+        self.module_specifier = module_specifier
+        self.type = type
+        self.imported_items = imported_items
+        self.line_number = line_number
+
+    def to_record(self) -> tuple:
+        """Returns a compact, picklable/JSON-friendly tuple of the fields."""
+        return (self.module_specifier, self.type, self.imported_items, self.line_number)
+
+    @classmethod
+    def from_record(cls, record: Sequence) -> "JSRawImport":
+        """Rebuilds a JSRawImport from to_record() output."""
+        module_specifier, type_, imported_items, line_number = record
+        return cls(module_specifier, type_, list(imported_items) if imported_items is not None else None, line_number)
+
+# --- Scanner ---
+# The scanner jumps with C-level searches to the next character that can change
+# the lexical context (a quote, backtick or '/') and to the next occurrence of
+# each import keyword (str.find); everything in between is plain code and is
+# never looked at in Python. Only the few tokens after a keyword are tokenized.
+#
+# Every pattern that consumes a construct is written so that it cannot fail
+# once started (unterminated comments, strings and regex literals simply end
+# at the line or file end) and is never followed by another pattern that
+# could fail within the same match, so the regex engine never backtracks into
+# it and each character is consumed once: scanning is linear in the file size,
+# even on minified bundles with very long lines.
 
-# Regex for Dynamic Imports: import('module')
-DYNAMIC_IMPORT_REGEX = re.compile(
-    r"\bimport\s*\(\s*['\"]"      # Match 'import(' with quotes
-    r"([^'\"]+)"                  # Capture the module specifier
-    r"['\"]\s*\)",                # Match closing quote and parenthesis
+_KEYWORDS = ("require", "import", "export")
+# A single character class lets the regex engine skip ahead without backtracking
+_NEXT_SPECIAL = re.compile(r"[\"'`/]")
+# Inside a template substitution, braces are tracked to find where it ends
+_NEXT_SPECIAL_IN_SUBSTITUTION = re.compile(r"[\"'`/{}]")
+_IDENTIFIER_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$")
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\\n]+|\\[\s\S])*'?|\"(?:[^\"\\\n]+|\\[\s\S])*\"?")
+_LINE_COMMENT = re.compile(r"//[^\n]*")
+_BLOCK_COMMENT = re.compile(r"/\*(?:[^*]+|\*(?!/))*(?:\*/)?")
+# Body of a regex literal after the opening '/': plain chars, escapes and [classes]
+_REGEX_LITERAL_BODY = re.compile(r"(?:[^/\\\[\n]+|\\.|\[(?:[^\]\\\n]+|\\.)*\]?)*/?[\w$]*")
+# Template literal text up to the closing backtick, a '${' or the end of the file
+_TEMPLATE_CHUNK = re.compile(r"(?:[^`\\$]+|\\[\s\S]|\$(?!\{))*")
+
+# Whitespace and comments before a token. Matched on its own, so the token
+# pattern failing afterwards (e.g. on a digit) cannot backtrack into it
+_TRIVIA = re.compile(r"\s*(?:(?://[^\n]*|/\*(?:[^*]+|\*(?!/))*(?:\*/)?)\s*)*")
+# One token after an import keyword
+_TOKEN = re.compile(
+    r"(?:(?P<id>[A-Za-z_$\u0080-\uffff][\w$\u0080-\uffff]*)"
+    r"|(?P<string>'(?:[^'\\\n]+|\\[\s\S])*'?|\"(?:[^\"\\\n]+|\\[\s\S])*\"?)"
+    r"|(?P<punct>[^\s\w]))"
 )
 
+# Looks back from a '/' (within a short window) for the preceding word or character
+_PRECEDING_TOKEN = re.compile(r"(?:(?P<word>[\w$]+)|(?P<char>\S))\s*\Z")
+_PRECEDING_MEMBER_DOT = re.compile(r"(?<!\.)\.\s*\Z") # obj.require, not ...require
+_LOOKBACK = 64
+
+# After these keywords a '/' starts a regex literal rather than a division
+_KEYWORDS_BEFORE_EXPRESSION = frozenset((
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+    "throw", "case", "do", "else", "yield", "await",
+))
+
+# Token kinds
+_ID, _STRING, _PUNCT, _OTHER = "id", "string", "punct", "other"
+
+# Tokens that may appear between 'import'/'export' and 'from'
+_CLAUSE_PUNCT = frozenset((",", "{", "}", "*"))
+
+def _starts_regex_literal(content: str, slash_pos: int) -> bool:
+    """Decides whether the '/' at slash_pos starts a regex literal rather than a division."""
+    match = _PRECEDING_TOKEN.search(content, max(0, slash_pos - _LOOKBACK), slash_pos)
+    if match is None:
+        return True # Start of file (or a long run of whitespace): an expression starts here
+    word = match.group("word")
+    if word is not None:
+        return word in _KEYWORDS_BEFORE_EXPRESSION # Otherwise an identifier or number: division
+    return match.group("char") not in ")]}\"'`"
+
+def _next_token(content: str, pos: int) -> Tuple[str, Optional[str], int, int]:
+    """
+    Reads the token at pos, skipping whitespace and comments.
+
+    Returns:
+        (kind, value, start, end). Strings and substitution-free templates are
+        _STRING with the quotes stripped; unterminated strings, templates with
+        substitutions and the end of the input are _OTHER.
+    """
+    match = _TOKEN.match(content, _TRIVIA.match(content, pos).end())
+    if match is None:
+        return _OTHER, None, len(content), len(content)
+    kind = match.lastgroup
+    start = match.start(kind)
+    value = match.group(kind)
+    if kind == "string":
+        if len(value) >= 2 and value[-1] == value[0]:
+            return _STRING, value[1:-1], start, match.end()
+        return _OTHER, None, start, match.end()
+    if kind == "id":
+        return _ID, value, start, match.end()
+    if value == "`":
+        end = _TEMPLATE_CHUNK.match(content, start + 1).end()
+        if content.startswith("`", end):
+            return _STRING, content[start + 1:end], start, end + 1
+        return _OTHER, None, start, start # Let the main loop handle the substitution
+    return _PUNCT, value, start, match.end()
+
+def _is_clause_token(kind: str, value: Optional[str]) -> bool:
+    return kind == _ID or kind == _STRING or (kind == _PUNCT and value in _CLAUSE_PUNCT)
+
+def _match_import(content: str, keyword: str, pos: int) -> Tuple[Optional[Tuple[str, str]], int]:
+    """
+    Matches the tokens that follow an import keyword.
+
+    Args:
+        content: The source text.
+        keyword: 'require', 'import' or 'export'.
+        pos: Position right after the keyword.
+
+    Returns:
+        ((specifier, import type) or None, position to resume scanning from).
+        On a mismatch the resume position is the start of the offending token,
+        so that the caller handles strings, templates and '/' there itself.
+    """
+    state = keyword
+    specifier: Optional[str] = None
+    type_only = False
+    while True:
+        kind, value, start, end = _next_token(content, pos)
+        next_state = None
+        if state == "require":
+            if kind == _PUNCT and value == "(":
+                next_state = "require("
+        elif state == "require(":
+            if kind == _STRING:
+                specifier, next_state = value, "require(spec"
+        elif state == "require(spec":
+            if kind == _PUNCT and value == ")":
+                return (specifier, "require"), end
+        elif state == "import":
+            if kind == _PUNCT and value == "(":
+                next_state = "import("
+            elif kind == _STRING: # Side-effect import: import 'm'
+                return (value, "import_from"), end
+            elif kind == _ID and value == "type": # TypeScript: import type X from 'm'
+                next_state = "import type"
+            elif _is_clause_token(kind, value):
+                next_state = "from" if (kind == _ID and value == "from") else "clause"
+        elif state == "import type":
+            # Unless 'type' is itself the default binding (import type from 'm' / import type, {x} from 'm')
+            if kind == _ID and value == "from":
+                next_state = "from"
+            elif _is_clause_token(kind, value):
+                type_only = value != ","
+                next_state = "clause"
+        elif state == "import(":
+            if kind == _STRING:
+                specifier, next_state = value, "import(spec"
+        elif state == "import(spec":
+            if kind == _PUNCT and value in (")", ","): # ',' starts import attributes
+                return (specifier, "dynamic_import"), end
+        elif state == "export":
+            if kind == _PUNCT and value in ("{", "*"):
+                next_state = "clause"
+            elif kind == _ID and value == "type": # TypeScript: export type { X } from 'm'
+                type_only = True
+                next_state = "export"
+        elif state == "clause" or state == "from":
+            if state == "from" and kind == _STRING:
+                if type_only:
+                    return (value, "import_type"), end
+                return (value, "export_from" if keyword == "export" else "import_from"), end
+            if _is_clause_token(kind, value):
+                # 'from' may also be a binding name, e.g. import { from } from 'm'
+                next_state = "from" if (kind == _ID and value == "from") else "clause"
+
+        if next_state is None:
+            return None, start
+        state = next_state
+        pos = end
+
+class _LineCounter:
+    """Maps increasing offsets to 1-based line numbers in a single pass over the text."""
+
+    def __init__(self, content: str):
+        self._content = content
+        self._pos = 0
+        self._line = 1
+
+    def line_at(self, pos: int) -> int:
+        self._line += self._content.count("\n", self._pos, pos)
+        self._pos = pos
+        return self._line
+
+def scan_javascript_imports(content: str) -> List[JSRawImport]:
+    """
+    Finds imports in JavaScript source in a single linear pass.
+
+    Recognizes:
+        require('m')                              -> 'require'
+        import x from 'm' / import 'm'            -> 'import_from'
+        export { x } from 'm' / export * from 'm' -> 'export_from'
+        import('m')                               -> 'dynamic_import'
+        import type { X } from 'm'                -> 'import_type' (TypeScript;
+        export type { X } from 'm'                   also for type-only re-exports)
+
+    Only string literals (and templates without substitutions) count as
+    specifiers; occurrences inside comments, strings, templates and regex
+    literals, and member accesses such as obj.require('m'), are ignored.
+
+    Args:
+        content: The decoded source code.
+
+    Returns:
+        JSRawImport objects with line numbers, in source order.
+    """
+    imports: List[JSRawImport] = []
+    # Cheap prefilter: most files without these words need no scanning at all
+    if "require" not in content and "import" not in content and "export" not in content:
+        return imports
+
+    lines = _LineCounter(content)
+    length = len(content)
+    substitutions: List[bool] = [] # Open braces inside template substitutions; True opens a '${'
+    # Next occurrence of each keyword at or after pos (-1: none left)
+    keyword_at = {keyword: content.find(keyword) for keyword in _KEYWORDS}
+    # Next special character at or after pos; searched again only once pos passes it
+    finder = _NEXT_SPECIAL
+    match = finder.search(content)
+    special_at = match.start() if match is not None else length
+    pos = 0
+    while pos < length:
+        wanted = _NEXT_SPECIAL_IN_SUBSTITUTION if substitutions else _NEXT_SPECIAL
+        if special_at < pos or wanted is not finder:
+            finder = wanted
+            match = finder.search(content, pos)
+            special_at = match.start() if match is not None else length
+
+        # Is there an import keyword before the next special character?
+        keyword = None
+        keyword_start = special_at
+        for candidate, at in keyword_at.items():
+            if 0 <= at < pos:
+                at = keyword_at[candidate] = content.find(candidate, pos)
+            if 0 <= at < keyword_start:
+                keyword, keyword_start = candidate, at
+        if keyword is not None:
+            end = keyword_start + len(keyword)
+            if ((keyword_start > 0 and content[keyword_start - 1] in _IDENTIFIER_CHARS)
+                    or (end < length and content[end] in _IDENTIFIER_CHARS)
+                    or _PRECEDING_MEMBER_DOT.search(content, max(0, keyword_start - _LOOKBACK), keyword_start)):
+                pos = end # Part of a longer name, or a member access such as obj.require / import.meta
+                continue
+            found, pos = _match_import(content, keyword, end)
+            if found is not None:
+                specifier, import_type = found
+                imports.append(JSRawImport(specifier, import_type, line_number=lines.line_at(keyword_start)))
+            continue
+
+        if match is None:
+            break
+        start = special_at
+        char = content[start]
+        if char == "'" or char == '"':
+            pos = _STRING_LITERAL.match(content, start).end()
+        elif char == "/":
+            if content.startswith("//", start):
+                pos = _LINE_COMMENT.match(content, start).end()
+            elif content.startswith("/*", start):
+                pos = _BLOCK_COMMENT.match(content, start).end()
+            elif _starts_regex_literal(content, start):
+                pos = _REGEX_LITERAL_BODY.match(content, start + 1).end()
+            else:
+                pos = start + 1
+        elif char == "{":
+            substitutions.append(False)
+            pos = start + 1
+        else: # '`', or '}' inside a substitution
+            if char == "}" and not substitutions.pop():
+                pos = start + 1 # Closes an ordinary block inside a substitution
+                continue
+            # Template text: a new template, or the rest of one after a '${...}'
+            pos = _TEMPLATE_CHUNK.match(content, start + 1).end()
+            if content.startswith("${", pos):
+                substitutions.append(True)
+                pos += 2
+            else:
+                pos += 1 # Closing backtick
+
+    return imports
+
+def parse_javascript_source(content: str, file_path: Path) -> List[JSRawImport]:
+    """
+    Extracts require/import/export-from statements from JavaScript source text.
+
+    Args:
+        content: The decoded source code.
+        file_path: Path of the file, used for log messages only.
+
+    Returns:
+        A list of JSRawImport objects with line numbers, in source order.
+    """
+    imports_found = scan_javascript_imports(content)
+    if log.DEBUG:
+        logging.debug(f"Found {len(imports_found)} imports/requires in {file_path}")
+    return imports_found
+
+def parse_javascript_content(content: FileContent) -> List[JSRawImport]:
+    """
+    Extracts imports from already-read file content (see utils/content.py).
+
+    Args:
+        content: The file content.
+
+    Returns:
+        A list of JSRawImport objects.
+    """
+    return parse_javascript_source(content.text, content.path)
 
 def parse_javascript_file(file_path: Path) -> List[JSRawImport]:
     """
-    Parses a JavaScript file using Regex and extracts require/import statements.
+    Parses a JavaScript file and extracts require/import/export-from statements.
 
     Args:
         file_path: Path to the JavaScript file.
@@ -73,61 +369,18 @@ def parse_javascript_file(file_path: Path) -> List[JSRawImport]:
         A list of JSRawImport objects representing the found imports/requires.
         Returns an empty list if parsing fails or the file is not found.
     """
-    logging.debug(f"Attempting to parse JavaScript file: {file_path}")
+    if log.DEBUG:
+        logging.debug(f"Attempting to parse JavaScript file: {file_path}")
     imports_found: List[JSRawImport] = []
     try:
-        # Read file content, trying common encodings
-        content = None
-        encodings_to_try = ['utf-8', 'latin-1']
-        for encoding in encodings_to_try:
-            try:
-                content = file_path.read_text(encoding=encoding)
-                logging.debug(f"Successfully read {file_path} with encoding {encoding}")
-                break
-            except UnicodeDecodeError:
-                logging.debug(f"Failed to decode {file_path} with {encoding}")
-            except Exception as e:
-                logging.warning(f"Could not read file {file_path} due to error: {e}")
-                return imports_found
-
-        if content is None:
-             logging.error(f"Could not decode file {file_path} with any tried encoding.")
-             return imports_found
-
-        # Find require() calls
-        for match in REQUIRE_REGEX.finditer(content):
-            module_specifier = match.group(1)
-            imports_found.append(JSRawImport(module_specifier=module_specifier, type='require'))
-            logging.debug(f"Found require: {module_specifier}")
-
-        # Find import ... from statements
-        for match in IMPORT_FROM_REGEX.finditer(content):
-            module_specifier = match.group(1)
-            # TODO: Could try to parse the part before 'from' to get imported_items, but complex with regex
-            imports_found.append(JSRawImport(module_specifier=module_specifier, type='import_from'))
-            logging.debug(f"Found import from: {module_specifier}")
-
-        # Find dynamic import() calls
-        for match in DYNAMIC_IMPORT_REGEX.finditer(content):
-            module_specifier = match.group(1)
-            imports_found.append(JSRawImport(module_specifier=module_specifier, type='dynamic_import'))
-            logging.debug(f"Found dynamic import: {module_specifier}")
-
+        imports_found = parse_javascript_content(read_file_content(file_path))
     except FileNotFoundError:
         logging.error(f"JavaScript file not found for parsing: {file_path}")
+    except OSError as e:
+        logging.warning(f"Could not read file {file_path} due to error: {e}")
     except Exception as e:
         logging.error(f"Unexpected error parsing JavaScript file {file_path}: {e}", exc_info=True)
 
-    # Remove duplicates that might arise if regex patterns overlap slightly
-    # Note: This simple list(set()) won't work directly with dataclasses without __hash__
-    # Using a more explicit deduplication based on specifier and type
-    unique_imports = {}
-    for imp in imports_found:
-        key = (imp.module_specifier, imp.type)
-        if key not in unique_imports:
-            unique_imports[key] = imp
-    imports_found = list(unique_imports.values())
-
-
-    logging.debug(f"Found {len(imports_found)} unique imports/requires in {file_path}")
+    if log.DEBUG:
+        logging.debug(f"Found {len(imports_found)} imports/requires in {file_path}")
     return imports_found
\ No newline at end of file
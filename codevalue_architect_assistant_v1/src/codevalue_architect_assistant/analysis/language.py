@@ -3,10 +3,13 @@
 Language detection utilities.
 """
 
+import os
 import logging
 from pathlib import Path
 from typing import Optional, Dict
 
+from ..utils import log
+
 # Mapping from lowercase file extensions to language names
 # Add more mappings as needed
 LANGUAGE_EXTENSIONS: Dict[str, str] = {
@@ -36,6 +39,22 @@ LANGUAGE_EXTENSIONS: Dict[str, str] = {
     # ".zsh": "shell",
 }
 
+def detect_language_from_name(file_name: str) -> Optional[str]:
+    """
+    Detects the programming language from a file name alone, without touching the filesystem.
+
+    Use this when the caller already knows the path is a regular file (e.g. a
+    FileEntry produced by the scanner).
+
+    Args:
+        file_name: The file name (or path string) to inspect.
+
+    Returns:
+        The detected language name or None if the extension is unknown.
+    """
+    extension = os.path.splitext(file_name)[1].lower()
+    return LANGUAGE_EXTENSIONS.get(extension)
+
 def detect_language(file_path: Path) -> Optional[str]:
     """
     Detects the programming language of a file based on its extension.
@@ -54,9 +73,10 @@ def detect_language(file_path: Path) -> Optional[str]:
     extension = file_path.suffix.lower()
     language = LANGUAGE_EXTENSIONS.get(extension)
 
-    if language:
-        logging.debug(f"Detected language '{language}' for file: {file_path}")
-    else:
-        logging.debug(f"Could not detect language for file extension '{extension}' in file: {file_path}")
+    if log.DEBUG:
+        if language:
+            logging.debug(f"Detected language '{language}' for file: {file_path}")
+        else:
+            logging.debug(f"Could not detect language for file extension '{extension}' in file: {file_path}")
 
     return language
\ No newline at end of file
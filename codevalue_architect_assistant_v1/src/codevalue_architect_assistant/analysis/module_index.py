@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Precomputed lookup tables for resolving imports by name.
+
+Building the tables once per run turns each import resolution into a few
+dictionary lookups on strings, instead of constructing and comparing Path
+objects for every import.
+"""
+
+import logging
+import posixpath
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Source roots tried when none are configured; a root is only used if it contains files
+DEFAULT_PYTHON_SOURCE_ROOTS: Tuple[str, ...] = ("", "src")
+
+class PythonModuleIndex:
+    """
+    Maps dotted Python module names to project files.
+
+    Every .py file is indexed under its dotted name relative to each source
+    root that contains it ('pkg/mod.py' -> 'pkg.mod', 'pkg/__init__.py' ->
+    'pkg'). A package's __init__.py takes precedence over a same-named module
+    file, and earlier source roots take precedence over later ones.
+    Directories without __init__.py (namespace packages) have no entry of
+    their own; their modules are found by their full dotted names.
+    """
+
+    def __init__(self, py_files_rel: Iterable[Path], source_roots: Optional[Sequence[str]] = None):
+        """
+        Args:
+            py_files_rel: Relative paths of all project .py files.
+            source_roots: Directories (relative to the project root, '/'-separated)
+                that act as import roots, in order of precedence. Defaults to the
+                project root plus 'src/' when it holds any Python files.
+        """
+        # posix string -> the Path object handed out as the resolution result
+        self._paths: Dict[str, Path] = {path.as_posix(): path for path in py_files_rel}
+        # Names relative to the project root (used for relative imports)
+        self._root_names: Dict[str, str] = _index_names(self._paths, "")
+        # Names relative to every source root (used for absolute imports)
+        self._names: Dict[str, str] = {}
+        # Directory parts of importing files, computed once per file
+        self._source_dirs: Dict[Path, Tuple[str, ...]] = {}
+
+        roots = [root.strip("/") for root in (source_roots if source_roots is not None else DEFAULT_PYTHON_SOURCE_ROOTS)]
+        self.source_roots: List[str] = []
+        for root in roots:
+            names = self._root_names if not root else _index_names(self._paths, root + "/")
+            if not names:
+                continue
+            self.source_roots.append(root)
+            for name, posix in names.items():
+                self._names.setdefault(name, posix)
+        logging.debug(f"Indexed {len(self._names)} Python module names under source roots {self.source_roots}")
+
+    def lookup(self, dotted_name: str) -> Optional[Path]:
+        """Returns the file of an absolutely imported module or package, or None."""
+        posix = self._names.get(dotted_name)
+        return self._paths[posix] if posix is not None else None
+
+    def is_package(self, dotted_name: str) -> bool:
+        """Whether dotted_name is a regular package (has an __init__.py)."""
+        posix = self._names.get(dotted_name)
+        return posix is not None and posix.endswith("__init__.py")
+
+    def lookup_relative(self, source_file_rel: Path, level: int, dotted_name: str) -> Optional[Path]:
+        """
+        Resolves a name imported relative to a source file.
+
+        Args:
+            source_file_rel: Relative path of the importing file.
+            level: Number of leading dots (1 = the file's own directory).
+            dotted_name: The name after the dots ('' refers to the directory itself).
+
+        Returns:
+            The module or package file, or None if it does not exist (or the
+            import climbs above the project root).
+        """
+        parts = self._source_dirs.get(source_file_rel)
+        if parts is None:
+            parts = self._source_dirs[source_file_rel] = source_file_rel.parent.parts
+        if level - 1 > len(parts):
+            return None
+        base = parts[:len(parts) - (level - 1)]
+        full_name = ".".join(base + tuple(dotted_name.split("."))) if dotted_name else ".".join(base)
+        posix = self._root_names.get(full_name)
+        return self._paths[posix] if posix is not None else None
+
+def _index_names(paths: Iterable[str], prefix: str) -> Dict[str, str]:
+    """Maps dotted names to files for all paths under prefix ('' or a '/'-terminated root)."""
+    names: Dict[str, str] = {}
+    for posix in paths:
+        if prefix and not posix.startswith(prefix):
+            continue
+        name, is_package = _module_name(posix[len(prefix):])
+        if name is None:
+            continue
+        existing = names.get(name)
+        # A package beats a same-named module; otherwise the first file wins
+        if existing is None or (is_package and not existing.endswith("__init__.py")):
+            names[name] = posix
+    return names
+
+def _module_name(relative_posix: str) -> Tuple[Optional[str], bool]:
+    """Returns (dotted name, is_package) for a path relative to a source root."""
+    if not relative_posix.endswith(".py"):
+        return None, False
+    stem = relative_posix[:-3]
+    if stem == "__init__":
+        return None, False # __init__.py directly in a source root names no module
+    if stem.endswith("/__init__"):
+        return stem[:-len("/__init__")].replace("/", "."), True
+    return stem.replace("/", "."), False
+
+# Extensions tried, in order, for a JavaScript specifier without a matching file
+JS_RESOLVE_EXTENSIONS: Tuple[str, ...] = (".js", ".mjs", ".cjs", ".json")
+# Directory entry points tried, in order, when a specifier names a directory
+JS_INDEX_FILES: Tuple[str, ...] = ("index.js", "index.mjs", "index.cjs")
+# The same for imports in TypeScript files, which prefer TypeScript sources
+TS_RESOLVE_EXTENSIONS: Tuple[str, ...] = (".ts", ".tsx", ".d.ts") + JS_RESOLVE_EXTENSIONS
+TS_INDEX_FILES: Tuple[str, ...] = ("index.ts", "index.tsx", "index.d.ts") + JS_INDEX_FILES
+
+class JavaScriptFileIndex:
+    """
+    Resolves path-like JavaScript specifiers ('./x', '../x', '/x') lexically.
+
+    Every file is indexed under the specifier base that reaches it, so that a
+    lookup folds in extension probing and directory index files:
+    'lib/util.js' is found as 'lib/util', and 'lib/index.js' as the directory
+    'lib' (stored under the key 'lib/'). Specifiers are normalised as
+    strings, without touching the filesystem, and results are memoized per
+    (source directory, specifier) since sibling files repeat the same imports.
+    """
+
+    def __init__(
+        self,
+        js_files_rel: Iterable[Path],
+        extensions: Sequence[str] = JS_RESOLVE_EXTENSIONS,
+        index_files: Sequence[str] = JS_INDEX_FILES
+    ):
+        """
+        Args:
+            js_files_rel: Relative paths of the project files imports may target
+                (JavaScript sources and .json files).
+            extensions: Extensions probed, in order of preference
+                (TS_RESOLVE_EXTENSIONS for imports in TypeScript files).
+            index_files: Directory entry points, in order of preference.
+        """
+        self.extensions = tuple(extensions)
+        self._paths: Dict[str, Path] = {path.as_posix(): path for path in js_files_rel}
+        # Extension-less base (or 'dir/' for index files) -> posix path, first candidate wins
+        self._targets: Dict[str, str] = {}
+        ranked: Dict[str, int] = {}
+        for posix in self._paths:
+            directory, name = posixpath.split(posix)
+            for rank, ext in enumerate(self.extensions):
+                # Compound extensions ('.d.ts') also index the file under the shorter stem
+                if posix.endswith(ext) and len(posix) > len(ext) and posix[-len(ext) - 1] != "/":
+                    _keep_best(self._targets, ranked, posix[:-len(ext)], posix, rank)
+            if name in index_files:
+                _keep_best(self._targets, ranked, directory + "/", posix, list(index_files).index(name))
+        self._memo: Dict[Tuple[str, str], Optional[Path]] = {}
+        self._source_dirs: Dict[Path, str] = {}
+
+    def resolve(self, source_file_rel: Path, specifier: str) -> Optional[Path]:
+        """
+        Resolves a relative ('./', '../') or root-absolute ('/') specifier.
+
+        Args:
+            source_file_rel: Relative path of the importing file.
+            specifier: The module specifier as written in the import.
+
+        Returns:
+            The target file, or None if no project file matches (or the
+            specifier leaves the project root).
+        """
+        source_dir = self._source_dirs.get(source_file_rel)
+        if source_dir is None:
+            source_dir = self._source_dirs[source_file_rel] = source_file_rel.parent.as_posix()
+        if specifier.startswith("/"):
+            source_dir = "." # Root-absolute specifiers do not depend on the importing file
+        key = (source_dir, specifier)
+        if key in self._memo:
+            return self._memo[key]
+        target = self._resolve_uncached(source_dir, specifier)
+        self._memo[key] = target
+        return target
+
+    def lookup_file(self, base: str) -> Optional[Path]:
+        """
+        Looks up a normalised project-relative path the way Node resolves a file:
+        the exact file first, then extension probing and the directory's index file.
+        """
+        path = self._paths.get(base)
+        if path is not None:
+            return path
+        for ext in self.extensions:
+            path = self._paths.get(base + ext)
+            if path is not None:
+                return path
+        posix = self._targets.get(base + "/")
+        return self._paths[posix] if posix is not None else None
+
+    def _resolve_uncached(self, source_dir: str, specifier: str) -> Optional[Path]:
+        base = posixpath.normpath(posixpath.join(source_dir, specifier.lstrip("/")))
+        if base == ".":
+            base = ""
+        elif base == ".." or base.startswith("../"):
+            return None
+        # A file with the specifier's extension replaced, then the directory's index file
+        posix = self._targets.get(posixpath.splitext(base)[0]) if base else None
+        if posix is None:
+            posix = self._targets.get(base + "/")
+        return self._paths[posix] if posix is not None else None
+
+def _keep_best(targets: Dict[str, str], ranked: Dict[str, int], key: str, posix: str, rank: int) -> None:
+    """Stores posix under key unless a candidate with a lower rank is already there."""
+    if key not in ranked or rank < ranked[key]:
+        targets[key] = posix
+        ranked[key] = rank
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+Resolves bare JavaScript specifiers ('lodash', '@org/ui/button') to files.
+
+Packages are looked up, in order, among:
+
+1. Workspace packages: every package.json found in the project (outside
+   node_modules) that declares a "name". Their entry points resolve to
+   project files.
+2. node_modules directories, searched from the importing file's directory
+   up to the project root, as Node does. node_modules is not scanned, so
+   these lookups go to the filesystem; each answer is cached for the run.
+
+A package's entry point is chosen from its "exports" field (subpath
+exports, '*' patterns and conditions) when present, otherwise from "module"
+/ "main" or index.js. Every manifest is parsed at most once per run.
+"""
+
+import os
+import json
+import logging
+import posixpath
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .module_index import JavaScriptFileIndex, JS_INDEX_FILES, JS_RESOLVE_EXTENSIONS
+
+MANIFEST_NAME = "package.json"
+
+# Export conditions matched for each kind of import, in order of preference
+IMPORT_CONDITIONS: Tuple[str, ...] = ("import", "module", "node", "default")
+REQUIRE_CONDITIONS: Tuple[str, ...] = ("require", "node", "default")
+
+@dataclass
+class PackageManifest:
+    """The fields of a package.json that matter for resolution."""
+    name: Optional[str]
+    directory: str # '/'-separated, relative to the project root ('' for the root)
+    main: Optional[str] = None
+    module: Optional[str] = None
+    exports: Any = None
+
+def load_manifest(manifest_path: Path, directory: str) -> Optional[PackageManifest]:
+    """
+    Reads a package.json.
+
+    Args:
+        manifest_path: Absolute path of the package.json.
+        directory: The package directory relative to the project root ('/'-separated).
+
+    Returns:
+        The manifest, or None if it cannot be read or is not a JSON object.
+    """
+    try:
+        data = json.loads(manifest_path.read_bytes())
+    except (OSError, ValueError) as e:
+        logging.debug(f"Ignoring unreadable manifest {manifest_path}: {e}")
+        return None
+    if not isinstance(data, dict):
+        return None
+    def _string(key: str) -> Optional[str]:
+        value = data.get(key)
+        return value if isinstance(value, str) else None
+    return PackageManifest(
+        name=_string("name"),
+        directory=directory,
+        main=_string("main"),
+        module=_string("module"),
+        exports=data.get("exports"),
+    )
+
+def split_package_specifier(specifier: str) -> Optional[Tuple[str, str]]:
+    """
+    Splits a bare specifier into (package name, subpath).
+
+    'lodash' -> ('lodash', '.'), '@org/ui/button' -> ('@org/ui', './button').
+    Returns None for Node built-ins ('node:fs') and malformed scoped names.
+    """
+    if specifier.startswith("node:"):
+        return None
+    parts = specifier.split("/")
+    count = 2 if specifier.startswith("@") else 1
+    if len(parts) < count or not all(parts[:count]):
+        return None
+    name = "/".join(parts[:count])
+    rest = parts[count:]
+    return name, "./" + "/".join(rest) if rest else "."
+
+# --- "exports" Resolution ---
+
+def _match_exports(exports: Any, subpath: str) -> Tuple[bool, Any, Optional[str]]:
+    """
+    Finds the exports entry for a subpath.
+
+    Returns:
+        (matched, target, pattern_match): matched is False if the subpath is not
+        exported; pattern_match is the text substituted for '*' in the target.
+    """
+    if isinstance(exports, (str, list)) or (
+        isinstance(exports, dict) and not any(key.startswith(".") for key in exports)
+    ):
+        exports = {".": exports} # Sugar: the value is the main entry point
+    if not isinstance(exports, dict):
+        return False, None, None
+    if subpath in exports and "*" not in subpath:
+        return True, exports[subpath], None
+    # Pattern keys ('./features/*.js'): the longest prefix wins
+    best_key = None
+    for key in exports:
+        star = key.find("*")
+        if star == -1 or key.find("*", star + 1) != -1:
+            continue
+        prefix, suffix = key[:star], key[star + 1:]
+        if (subpath.startswith(prefix) and subpath != prefix and subpath.endswith(suffix)
+                and len(subpath) >= len(key)):
+            if best_key is None or len(prefix) > best_key.find("*") or (
+                    len(prefix) == best_key.find("*") and len(key) > len(best_key)):
+                best_key = key
+    if best_key is None:
+        return False, None, None
+    star = best_key.find("*")
+    return True, exports[best_key], subpath[star:len(subpath) - (len(best_key) - star - 1)]
+
+def _select_target(target: Any, conditions: Tuple[str, ...], pattern_match: Optional[str]) -> List[str]:
+    """
+    Expands an exports target to candidate package-relative paths, in order of preference.
+
+    Arrays are fallbacks, objects are condition maps (keys tried in their
+    order), and null blocks the subpath.
+    """
+    if isinstance(target, str):
+        if not target.startswith("./"):
+            return []
+        return [target.replace("*", pattern_match) if pattern_match is not None else target]
+    if isinstance(target, list):
+        candidates: List[str] = []
+        for item in target:
+            candidates.extend(_select_target(item, conditions, pattern_match))
+        return candidates
+    if isinstance(target, dict):
+        for condition, value in target.items():
+            if condition in conditions:
+                candidates = _select_target(value, conditions, pattern_match)
+                if candidates:
+                    return candidates
+    return []
+
+def entry_candidates(manifest: PackageManifest, subpath: str, conditions: Tuple[str, ...]) -> Optional[List[str]]:
+    """
+    Lists the package-relative paths a subpath may resolve to, in order.
+
+    Returns:
+        The candidates ('./lib/index.js', ...). None means the package has an
+        "exports" field that does not export the subpath, so it must not be
+        resolved at all.
+    """
+    if manifest.exports is not None:
+        matched, target, pattern_match = _match_exports(manifest.exports, subpath)
+        if not matched:
+            return None
+        return _select_target(target, conditions, pattern_match)
+    if subpath != ".":
+        return [subpath]
+    fields = (manifest.module, manifest.main) if "import" in conditions else (manifest.main, manifest.module)
+    return [entry if entry.startswith(".") else "./" + entry for entry in fields if entry] + ["./index"]
+
+# --- Package Index ---
+
+class NodePackageIndex:
+    """
+    Resolves bare specifiers through workspace manifests and node_modules.
+
+    Build one per run: manifests, node_modules lookups and resolutions are
+    cached, so repeated imports of the same package cost a dictionary lookup.
+    """
+
+    def __init__(self, project_root: Path, js_index: JavaScriptFileIndex, manifest_files_rel: Iterable[Path] = ()):
+        """
+        Args:
+            project_root: Absolute path to the project root.
+            js_index: Index of the project's JavaScript and JSON files.
+            manifest_files_rel: Relative paths of the project's package.json files.
+        """
+        self.project_root = project_root
+        self._root_str = str(project_root)
+        self._js_index = js_index
+        self._workspaces: Dict[str, PackageManifest] = {}
+        for manifest_rel in sorted(manifest_files_rel, key=lambda p: len(p.parts)):
+            if "node_modules" in manifest_rel.parts:
+                continue
+            directory = manifest_rel.parent.as_posix()
+            manifest = load_manifest(project_root / manifest_rel, "" if directory == "." else directory)
+            if manifest is not None and manifest.name:
+                # The shallowest manifest wins if a name is declared twice (e.g. by a fixture)
+                self._workspaces.setdefault(manifest.name, manifest)
+        # node_modules package directory (relative posix) -> manifest, None if absent
+        self._installed: Dict[str, Optional[PackageManifest]] = {}
+        self._files: Dict[str, bool] = {}
+        self._memo: Dict[Tuple[str, str, bool, Tuple[str, ...]], Optional[Path]] = {}
+        self._source_dirs: Dict[Path, str] = {}
+        logging.debug(f"Indexed {len(self._workspaces)} workspace packages")
+
+    @property
+    def workspace_packages(self) -> Dict[str, PackageManifest]:
+        """Workspace package names mapped to their manifests."""
+        return dict(self._workspaces)
+
+    def resolve(
+        self,
+        source_file_rel: Path,
+        specifier: str,
+        is_require: bool = False,
+        file_index: Optional[JavaScriptFileIndex] = None
+    ) -> Optional[Path]:
+        """
+        Resolves a bare specifier imported from a project file.
+
+        Args:
+            source_file_rel: Relative path of the importing file.
+            specifier: The bare specifier ('react', '@org/ui/button').
+            is_require: Whether the import is a require() call (selects the
+                "require" rather than the "import" export condition).
+            file_index: Index used to find project files, if not the one given at
+                construction (e.g. the TypeScript index for imports in .ts files).
+
+        Returns:
+            The target file relative to the project root (inside node_modules
+            for installed third-party packages), or None.
+        """
+        source_dir = self._source_dirs.get(source_file_rel)
+        if source_dir is None:
+            directory = source_file_rel.parent.as_posix()
+            source_dir = self._source_dirs[source_file_rel] = "" if directory == "." else directory
+        split = split_package_specifier(specifier)
+        if split is None:
+            return None
+        name, subpath = split
+        # Workspace packages do not depend on the importing file's location
+        file_index = file_index or self._js_index
+        key = ("" if name in self._workspaces else source_dir, specifier, is_require, file_index.extensions)
+        if key in self._memo:
+            return self._memo[key]
+        conditions = REQUIRE_CONDITIONS if is_require else IMPORT_CONDITIONS
+        target = None
+        manifest = self._workspaces.get(name)
+        if manifest is not None:
+            target = self._resolve_in_project(manifest, subpath, conditions, file_index)
+        else:
+            manifest = self._find_installed(source_dir, name)
+            if manifest is not None:
+                target = self._resolve_installed(manifest, subpath, conditions, file_index)
+        self._memo[key] = target
+        return target
+
+    def _resolve_in_project(
+        self, manifest: PackageManifest, subpath: str, conditions: Tuple[str, ...], file_index: JavaScriptFileIndex
+    ) -> Optional[Path]:
+        for candidate in entry_candidates(manifest, subpath, conditions) or ():
+            base = posixpath.normpath(posixpath.join(manifest.directory, candidate))
+            if base.startswith("../"):
+                continue
+            target = file_index.lookup_file(base)
+            if target is not None:
+                return target
+        return None
+
+    def _find_installed(self, source_dir: str, name: str) -> Optional[PackageManifest]:
+        """Searches node_modules directories from source_dir up to the project root."""
+        directory = source_dir
+        while True:
+            if posixpath.basename(directory) != "node_modules":
+                package_dir = posixpath.join(directory, "node_modules", name)
+                if package_dir not in self._installed:
+                    manifest_path = Path(self._root_str, package_dir, MANIFEST_NAME)
+                    self._installed[package_dir] = (
+                        load_manifest(manifest_path, package_dir) if manifest_path.is_file() else None
+                    )
+                if self._installed[package_dir] is not None:
+                    return self._installed[package_dir]
+            if not directory:
+                return None
+            directory = posixpath.dirname(directory)
+
+    def _resolve_installed(
+        self, manifest: PackageManifest, subpath: str, conditions: Tuple[str, ...], file_index: JavaScriptFileIndex
+    ) -> Optional[Path]:
+        for candidate in entry_candidates(manifest, subpath, conditions) or ():
+            base = posixpath.normpath(posixpath.join(manifest.directory, candidate))
+            if base.startswith("../"):
+                continue
+            found = self._probe(base)
+            if found is not None:
+                return self._in_project(found, file_index)
+        return None
+
+    def _probe(self, base: str) -> Optional[str]:
+        """Finds an installed file: exact, then with an extension, then a directory index."""
+        for candidate in (base,) + tuple(base + ext for ext in JS_RESOLVE_EXTENSIONS) + tuple(
+                posixpath.join(base, index) for index in JS_INDEX_FILES):
+            exists = self._files.get(candidate)
+            if exists is None:
+                exists = self._files[candidate] = os.path.isfile(os.path.join(self._root_str, candidate))
+            if exists:
+                return candidate
+        return None
+
+    def _in_project(self, installed: str, file_index: JavaScriptFileIndex) -> Path:
+        """Maps a file reached through a workspace symlink in node_modules back to the project file."""
+        real = os.path.realpath(os.path.join(self._root_str, installed))
+        relative = os.path.relpath(real, os.path.realpath(self._root_str)).replace(os.sep, "/")
+        if not relative.startswith("../"):
+            target = file_index.lookup_file(relative)
+            if target is not None:
+                return target
+        return Path(installed)
@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent per-file cache of parsed imports, stored in SQLite under .cva-cache/.
+
+An entry is keyed by the file's relative path and records its size, mtime,
+content hash and the parser version that produced it. On lookup:
+
+1. If size, mtime and parser version match, the cached imports are returned
+   without reading the file at all. Files scanned without an mtime (e.g. from
+   the git index, whose stat data predates unstaged edits) are stat'ed first.
+2. Otherwise the file is read and hashed; if the content hash still matches
+   (e.g. the file was only touched), the cached imports are reused.
+3. Otherwise the file is parsed and the entry is replaced.
+
+The cache is capped in size; least-recently-used entries are evicted when a
+session is closed. A cache opened without a cap (max_bytes=None, e.g. by
+'cache stats') is only inspected: it neither evicts nor starts a session.
+"""
+
+import json
+import hashlib
+import logging
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from ..models import ProjectFile
+from ..utils.content import FileContent, read_file_content
+from . import python_parser, javascript_parser
+from .python_parser import RawImport
+from .javascript_parser import JSRawImport
+
+CACHE_DIR_NAME = ".cva-cache"
+CACHE_FILE_NAME = "parse_cache.sqlite3"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+AnyRawImport = Union[RawImport, JSRawImport]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_cache (
+    path TEXT PRIMARY KEY,
+    language TEXT NOT NULL,
+    parser_version INTEGER NOT NULL,
+    size INTEGER,
+    mtime_ns INTEGER,
+    content_hash TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    payload_bytes INTEGER NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS parse_cache_last_used ON parse_cache(last_used);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+@dataclass
+class _LanguageParser:
+    """How to parse and (de)serialize the imports of one language."""
+    version: int
+    parse_content: Callable[[FileContent], List]
+    record_type: type
+
+# Languages the cache knows how to parse
+LANGUAGE_PARSERS: Dict[str, _LanguageParser] = {
+    "python": _LanguageParser(python_parser.PARSER_VERSION, python_parser.parse_python_content, RawImport),
+    "javascript": _LanguageParser(javascript_parser.PARSER_VERSION, javascript_parser.parse_javascript_content, JSRawImport),
+    # The JavaScript scanner also handles TypeScript syntax
+    "typescript": _LanguageParser(javascript_parser.PARSER_VERSION, javascript_parser.parse_javascript_content, JSRawImport),
+}
+
+@dataclass
+class CacheStats:
+    """Summary of the cache contents and of the current session's lookups."""
+    path: Path
+    entries: int
+    payload_bytes: int
+    file_bytes: int
+    max_bytes: Optional[int] # The cap of this session, else the one of the last capped session (None if unknown)
+    hits: int = 0
+    misses: int = 0
+
+def _stat_if_unknown(project_file: ProjectFile) -> None:
+    """
+    Fills in the size and mtime of a file the scanner gave no mtime for, so that
+    they are compared with the entry (and stored with it) like a walk's.
+    """
+    if project_file.mtime_ns is not None:
+        return
+    try:
+        st = project_file.path.stat()
+    except OSError:
+        return # Left to the content hash check, where reading the file fails too
+    project_file.size_bytes = st.st_size
+    project_file.mtime_ns = st.st_mtime_ns
+
+def content_hash_of(data) -> str:
+    """Returns the hash that identifies a file's content in the cache."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+class ParseCache:
+    """
+    SQLite-backed parse cache for one repository.
+
+    Use as a context manager (or call close()) so that recency updates,
+    new entries and LRU eviction are committed at the end of the run.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: Optional[int] = DEFAULT_MAX_BYTES):
+        """
+        Opens (creating if needed) the cache database.
+
+        Args:
+            cache_dir: Directory of the database.
+            max_bytes: Payload size cap applied on close(); None opens the cache for
+                inspection only, leaving entry recency and the cap as they are.
+
+        Raises:
+            OSError / sqlite3.Error: If the cache directory or database cannot be created.
+        """
+        self.cache_dir = cache_dir
+        self.db_path = cache_dir / CACHE_FILE_NAME
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._touched: List[str] = []
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self._conn.executescript(_SCHEMA)
+        # Each session gets a new tick; last_used stores the tick of the latest hit
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'tick'").fetchone()
+        self._tick = (row[0] if row else 0) + 1
+        if max_bytes is not None:
+            self._conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES ('tick', ?)", (self._tick,))
+
+    @classmethod
+    def for_repository(cls, repository_root: Path, max_bytes: Optional[int] = DEFAULT_MAX_BYTES) -> "ParseCache":
+        """Opens the cache stored in <repository_root>/.cva-cache/."""
+        return cls(repository_root / CACHE_DIR_NAME, max_bytes=max_bytes)
+
+    def __enter__(self) -> "ParseCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def get_or_parse(self, project_file: ProjectFile) -> List[AnyRawImport]:
+        """
+        Returns the imports of a file, from the cache when it is still valid.
+
+        Args:
+            project_file: The file to parse; its language selects the parser.
+
+        Returns:
+            The parsed imports (empty for unsupported languages or unreadable files).
+        """
+        parser = LANGUAGE_PARSERS.get(project_file.language)
+        if parser is None:
+            return []
+        imports, cached_hash = self.lookup(project_file)
+        if imports is not None:
+            return imports
+
+        try:
+            content = read_file_content(project_file.path)
+        except OSError as e:
+            logging.warning(f"Could not read file {project_file.path} for parsing: {e}")
+            return []
+        content_hash = content_hash_of(content.data)
+        if content_hash == cached_hash:
+            return self.refresh(project_file)
+        imports = parser.parse_content(content)
+        self.store(project_file, content_hash, [imp.to_record() for imp in imports])
+        return imports
+
+    def lookup(self, project_file: ProjectFile) -> Tuple[Optional[List[AnyRawImport]], Optional[str]]:
+        """
+        Looks a file up by metadata only, without reading it.
+
+        Returns:
+            (imports, None) on a hit. On a miss, (None, content_hash) where
+            content_hash is the hash of a still-valid entry (compare it with the
+            file's current content, then call refresh()), or None if there is none.
+        """
+        parser = LANGUAGE_PARSERS.get(project_file.language)
+        if parser is None:
+            return [], None
+        _stat_if_unknown(project_file)
+        row = self._conn.execute(
+            "SELECT language, parser_version, size, mtime_ns, content_hash, payload FROM parse_cache WHERE path = ?",
+            (project_file.relative_path.as_posix(),),
+        ).fetchone()
+        if row is None or row[0] != project_file.language or row[1] != parser.version:
+            return None, None
+        if (project_file.size_bytes is not None and project_file.mtime_ns is not None
+                and row[2] == project_file.size_bytes and row[3] == project_file.mtime_ns):
+            return self._hit(project_file.relative_path.as_posix(), parser, row[5]), None
+        return None, row[4]
+
+    def is_fresh(self, project_file: ProjectFile) -> Tuple[bool, Optional[str]]:
+        """
+        Checks by metadata only, without reading the file or decoding the entry,
+        whether lookup() would hit.
+
+        Returns:
+            (True, None) if lookup() will return the cached imports, otherwise
+            (False, content_hash) as for a lookup() miss.
+        """
+        parser = LANGUAGE_PARSERS.get(project_file.language)
+        if parser is None:
+            return True, None
+        _stat_if_unknown(project_file)
+        row = self._conn.execute(
+            "SELECT language, parser_version, size, mtime_ns, content_hash FROM parse_cache WHERE path = ?",
+            (project_file.relative_path.as_posix(),),
+        ).fetchone()
+        if row is None or row[0] != project_file.language or row[1] != parser.version:
+            return False, None
+        if (project_file.size_bytes is not None and project_file.mtime_ns is not None
+                and row[2] == project_file.size_bytes and row[3] == project_file.mtime_ns):
+            return True, None
+        return False, row[4]
+
+    def refresh(self, project_file: ProjectFile) -> List[AnyRawImport]:
+        """
+        Records that a file's content still matches its entry (e.g. it was only touched)
+        and returns the cached imports.
+        """
+        key = project_file.relative_path.as_posix()
+        self._conn.execute(
+            "UPDATE parse_cache SET size = ?, mtime_ns = ? WHERE path = ?",
+            (project_file.size_bytes, project_file.mtime_ns, key),
+        )
+        payload = self._conn.execute("SELECT payload FROM parse_cache WHERE path = ?", (key,)).fetchone()[0]
+        return self._hit(key, LANGUAGE_PARSERS[project_file.language], payload)
+
+    def store(self, project_file: ProjectFile, content_hash: str, records: List[tuple]) -> None:
+        """
+        Stores freshly parsed imports, given as to_record() tuples.
+
+        Args:
+            project_file: The parsed file.
+            content_hash: content_hash_of() the bytes that were parsed.
+            records: The imports, serialized with to_record().
+        """
+        self.misses += 1
+        payload = json.dumps(records, separators=(",", ":"))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO parse_cache"
+            "(path, language, parser_version, size, mtime_ns, content_hash, payload, payload_bytes, last_used)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (project_file.relative_path.as_posix(), project_file.language,
+             LANGUAGE_PARSERS[project_file.language].version, project_file.size_bytes, project_file.mtime_ns,
+             content_hash, payload, len(payload), self._tick),
+        )
+
+    def _hit(self, key: str, parser: _LanguageParser, payload: str) -> List[AnyRawImport]:
+        self.hits += 1
+        self._touched.append(key)
+        return [parser.record_type.from_record(record) for record in json.loads(payload)]
+
+    def _total_payload_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(payload_bytes), 0) FROM parse_cache").fetchone()[0]
+
+    def evict(self) -> int:
+        """
+        Evicts least-recently-used entries until the payload fits in max_bytes.
+
+        Returns:
+            The number of evicted entries (0 without a cap).
+        """
+        if self.max_bytes is None:
+            return 0
+        excess = self._total_payload_bytes() - self.max_bytes
+        if excess <= 0:
+            return 0
+        to_delete = []
+        for path, payload_bytes in self._conn.execute(
+            "SELECT path, payload_bytes FROM parse_cache ORDER BY last_used ASC"
+        ):
+            to_delete.append((path,))
+            excess -= payload_bytes
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM parse_cache WHERE path = ?", to_delete)
+        logging.info(f"Evicted {len(to_delete)} entries from parse cache {self.db_path}")
+        return len(to_delete)
+
+    def stats(self) -> CacheStats:
+        """Returns the current cache statistics."""
+        entries = self._conn.execute("SELECT COUNT(*) FROM parse_cache").fetchone()[0]
+        try:
+            file_bytes = self.db_path.stat().st_size
+        except OSError:
+            file_bytes = 0
+        max_bytes = self.max_bytes
+        if max_bytes is None:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'max_bytes'").fetchone()
+            max_bytes = row[0] if row else None
+        return CacheStats(
+            path=self.db_path,
+            entries=entries,
+            payload_bytes=self._total_payload_bytes(),
+            file_bytes=file_bytes,
+            max_bytes=max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+    def clear(self) -> int:
+        """
+        Removes every entry.
+
+        Returns:
+            The number of removed entries.
+        """
+        removed = self._conn.execute("DELETE FROM parse_cache").rowcount
+        self._conn.commit()
+        self._conn.execute("VACUUM")
+        return removed
+
+    def close(self) -> None:
+        """Records entry recency, applies and records the size cap (if any) and commits."""
+        if self._conn is None:
+            return
+        try:
+            if self._touched:
+                self._conn.executemany(
+                    "UPDATE parse_cache SET last_used = ? WHERE path = ?",
+                    ((self._tick, key) for key in self._touched),
+                )
+                self._touched = []
+            if self.max_bytes is not None:
+                self.evict()
+                self._conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES ('max_bytes', ?)", (self.max_bytes,))
+            self._conn.commit()
+        finally:
+            self._conn.close()
+            self._conn = None
+
+def open_parse_cache(repository_root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> Optional[ParseCache]:
+    """
+    Opens the repository's parse cache, or returns None (with a warning) if it cannot be created,
+    e.g. on a read-only checkout.
+    """
+    try:
+        return ParseCache.for_repository(repository_root, max_bytes=max_bytes)
+    except (OSError, sqlite3.Error) as e:
+        logging.warning(f"Parse cache disabled: cannot open {repository_root / CACHE_DIR_NAME}: {e}")
+        return None
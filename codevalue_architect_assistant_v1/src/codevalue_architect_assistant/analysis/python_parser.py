@@ -4,19 +4,46 @@ Parses Python files using AST to extract information like imports.
 """
 
 import ast
+import codecs
 import logging
 from pathlib import Path
-from typing import List, Tuple, Optional
-from dataclasses import dataclass # Added import
+from typing import List, Tuple, Optional, Sequence
+
+from ..utils.content import FileContent, read_file_content
+from ..utils.records import Record
+from ..utils import log
+
+# Bump whenever the extracted imports can change for the same input,
+# so persisted parse results (see parse_cache.py) are invalidated.
+PARSER_VERSION = 1
 
 # Define a structure to hold import details temporarily
-@dataclass
-class RawImport:
-    module_name: str
-    alias: Optional[str]
-    line_number: int
-    is_from_import: bool
-    from_module: Optional[str] = None # Only used for 'from x import y'
+class RawImport(Record):
+    __slots__ = ("module_name", "alias", "line_number", "is_from_import", "from_module")
+
+    def __init__(
+        self,
+        module_name: str,
+        alias: Optional[str],
+        line_number: int,
+        is_from_import: bool,
+        from_module: Optional[str] = None # Only used for 'from x import y'
+    ):
+        self.module_name = module_name
+        self.alias = alias
+        self.line_number = line_number
+        self.is_from_import = is_from_import
+        self.from_module = from_module
+
+    def to_record(self) -> tuple:
+        """Returns a compact, picklable/JSON-friendly tuple of the fields."""
+        return (self.module_name, self.alias, self.line_number, self.is_from_import, self.from_module)
+
+    @classmethod
+    def from_record(cls, record: Sequence) -> "RawImport":
+        """Rebuilds a RawImport from to_record() output."""
+        module_name, alias, line_number, is_from_import, from_module = record
+        return cls(module_name, alias, line_number, is_from_import, from_module)
 
 class ImportVisitor(ast.NodeVisitor):
     """
@@ -35,7 +62,8 @@ class ImportVisitor(ast.NodeVisitor):
                 is_from_import=False
             )
             self.imports.append(raw_import)
-            logging.debug(f"Found import: {alias.name} (alias: {alias.asname}) at line {node.lineno}")
+            if log.DEBUG:
+                logging.debug(f"Found import: {alias.name} (alias: {alias.asname}) at line {node.lineno}")
         self.generic_visit(node) # Continue traversing child nodes if any
 
     def visit_ImportFrom(self, node: ast.ImportFrom):
@@ -57,41 +85,23 @@ class ImportVisitor(ast.NodeVisitor):
                 from_module=full_from_module
             )
             self.imports.append(raw_import)
-            logging.debug(f"Found from-import: {alias.name} (alias: {alias.asname}) from {full_from_module} at line {node.lineno}")
+            if log.DEBUG:
+                logging.debug(f"Found from-import: {alias.name} (alias: {alias.asname}) from {full_from_module} at line {node.lineno}")
         self.generic_visit(node) # Continue traversing child nodes if any
 
-def parse_python_file(file_path: Path) -> List[RawImport]:
+def parse_python_source(content: str, file_path: Path) -> List[RawImport]:
     """
-    Parses a Python file and extracts import statements using AST.
+    Extracts import statements from Python source text using AST.
 
     Args:
-        file_path: Path to the Python file.
+        content: The decoded source code.
+        file_path: Path of the file, used for error messages only.
 
     Returns:
-        A list of RawImport objects representing the found imports.
-        Returns an empty list if parsing fails or the file is not found.
+        A list of RawImport objects. Returns an empty list if parsing fails.
     """
-    logging.debug(f"Attempting to parse Python file: {file_path}")
     imports_found: List[RawImport] = []
     try:
-        # Read file content, trying common encodings
-        content = None
-        encodings_to_try = ['utf-8', 'latin-1'] # Add more if needed
-        for encoding in encodings_to_try:
-            try:
-                content = file_path.read_text(encoding=encoding)
-                logging.debug(f"Successfully read {file_path} with encoding {encoding}")
-                break
-            except UnicodeDecodeError:
-                logging.debug(f"Failed to decode {file_path} with {encoding}")
-            except Exception as e:
-                logging.warning(f"Could not read file {file_path} due to error: {e}")
-                return imports_found # Cannot proceed without content
-
-        if content is None:
-             logging.error(f"Could not decode file {file_path} with any tried encoding.")
-             return imports_found
-
         # Parse the code into an AST
         tree = ast.parse(content, filename=str(file_path))
 
@@ -99,14 +109,120 @@ def parse_python_file(file_path: Path) -> List[RawImport]:
         visitor = ImportVisitor()
         visitor.visit(tree)
         imports_found = visitor.imports
-
-    except FileNotFoundError:
-        logging.error(f"Python file not found for parsing: {file_path}")
     except SyntaxError as e:
         logging.warning(f"Syntax error parsing Python file {file_path} at line {e.lineno}: {e.msg}")
         # Optionally, could try to recover or just skip the file
     except Exception as e:
         logging.error(f"Unexpected error parsing Python file {file_path}: {e}", exc_info=True)
+    return imports_found
+
+# --- Fast Path ---
+
+# Nodes whose list fields can hold statements; anything else is an expression and never holds imports
+_STATEMENT_CONTAINERS: Tuple[type, ...] = tuple(
+    getattr(ast, name) for name in ("stmt", "excepthandler", "match_case") if hasattr(ast, name)
+)
+
+# Content starting with these is not ASCII-compatible, so a bytes search for b"import" is meaningless
+_NON_ASCII_BOMS = (codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
+def _collect_imports(tree: ast.Module) -> List[RawImport]:
+    """
+    Collects imports with a statement-level walk, in the order ImportVisitor reports them.
+
+    Statements are visited depth-first in _fields order (the order generic_visit
+    uses), but expression subtrees are never entered: they cannot contain statements.
+    """
+    imports: List[RawImport] = []
+    stack: List[ast.AST] = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append(RawImport(alias.name, alias.asname, node.lineno, False))
+            continue
+        if isinstance(node, ast.ImportFrom):
+            full_from_module = "." * node.level + (node.module or "")
+            for alias in node.names:
+                imports.append(RawImport(alias.name, alias.asname, node.lineno, True, full_from_module))
+            continue
+        children: List[ast.AST] = []
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if isinstance(value, list) and value and isinstance(value[0], _STATEMENT_CONTAINERS):
+                children.extend(value)
+        stack.extend(reversed(children))
+    return imports
+
+def extract_python_imports(data: bytes, file_path: Path) -> Optional[List[RawImport]]:
+    """
+    Extracts imports straight from raw bytes, without decoding the module to str.
+
+    Files that do not contain the bytes b"import" cannot hold an import statement
+    and are not parsed at all. Otherwise the bytes go to ast.parse(), which itself
+    honours a BOM or coding cookie, and only statement nodes are walked.
+
+    Args:
+        data: The raw file content.
+        file_path: Path of the file, used for error messages only.
+
+    Returns:
+        The imports, identical to what ImportVisitor finds, or None if the fast
+        path is unsure (non-ASCII-compatible encoding, bytes that are not valid in
+        the declared encoding, syntax errors) and the caller should fall back to
+        parse_python_source().
+    """
+    if data[:4].startswith(_NON_ASCII_BOMS):
+        return None
+    if data.find(b"import") == -1:
+        return []
+    try:
+        tree = ast.parse(data, filename=str(file_path))
+    except (SyntaxError, ValueError):
+        return None # Includes decode errors; the fallback detects the encoding and reports real errors
+    return _collect_imports(tree)
+
+def parse_python_content(content: FileContent) -> List[RawImport]:
+    """
+    Extracts imports from already-read file content (see utils/content.py).
+
+    Uses the bytes fast path (extract_python_imports) and falls back to decoding
+    the content and running ImportVisitor when the fast path is unsure.
+
+    Args:
+        content: The file content.
+
+    Returns:
+        A list of RawImport objects.
+    """
+    imports = extract_python_imports(content.data, content.path)
+    if imports is not None:
+        return imports
+    return parse_python_source(content.text, content.path)
+
+def parse_python_file(file_path: Path) -> List[RawImport]:
+    """
+    Parses a Python file and extracts import statements using AST.
+
+    Args:
+        file_path: Path to the Python file.
+
+    Returns:
+        A list of RawImport objects representing the found imports.
+        Returns an empty list if parsing fails or the file is not found.
+    """
+    if log.DEBUG:
+        logging.debug(f"Attempting to parse Python file: {file_path}")
+    imports_found: List[RawImport] = []
+    try:
+        imports_found = parse_python_content(read_file_content(file_path))
+    except FileNotFoundError:
+        logging.error(f"Python file not found for parsing: {file_path}")
+    except OSError as e:
+        logging.warning(f"Could not read file {file_path} due to error: {e}")
+    except Exception as e:
+        logging.error(f"Unexpected error parsing Python file {file_path}: {e}", exc_info=True)
 
-    logging.debug(f"Found {len(imports_found)} imports in {file_path}")
+    if log.DEBUG:
+        logging.debug(f"Found {len(imports_found)} imports in {file_path}")
     return imports_found
\ No newline at end of file
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+Resolves TypeScript path aliases from tsconfig.json.
+
+Each tsconfig.json in the project is loaded once, following its "extends"
+chain, and its compilerOptions "paths" are compiled into an AliasTrie keyed
+by the pattern prefixes. A TypeScript file uses the nearest tsconfig.json in
+its directory or above it. Non-relative specifiers are tried against the
+aliases first and then against "baseUrl", as tsc does. "include", "files"
+and project references are not taken into account.
+"""
+
+import re
+import json
+import logging
+import posixpath
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .module_index import JavaScriptFileIndex
+
+TSCONFIG_NAME = "tsconfig.json"
+
+# Strings are matched so that '//' or ',' inside them is left alone
+_JSONC_COMMENT = re.compile(r'("(?:[^"\\]|\\.)*")|//[^\n]*|/\*(?:[^*]|\*(?!/))*\*/')
+_JSONC_TRAILING_COMMA = re.compile(r'("(?:[^"\\]|\\.)*")|,(?=\s*[}\]])')
+
+def parse_jsonc(text: str) -> Any:
+    """
+    Parses JSON with comments and trailing commas, as accepted in tsconfig.json.
+
+    Raises:
+        ValueError: If the text is not valid JSON once comments and trailing commas are removed.
+    """
+    text = _JSONC_COMMENT.sub(lambda m: m.group(1) or "", text)
+    text = _JSONC_TRAILING_COMMA.sub(lambda m: m.group(1) or "", text)
+    return json.loads(text)
+
+# --- Alias Trie ---
+
+class _TrieNode:
+    __slots__ = ("children", "patterns")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # (suffix after '*', target paths) of the wildcard patterns whose prefix ends here
+        self.patterns: List[Tuple[str, List[str]]] = []
+
+class AliasTrie:
+    """
+    Prefix trie over tsconfig "paths" patterns.
+
+    Exact patterns ('jquery') are kept in a dictionary; wildcard patterns
+    ('@app/*') are stored at the node for their prefix, so a lookup walks
+    the specifier once and keeps the longest matching prefix, as tsc does.
+    Targets are stored as project-relative paths that may contain one '*'.
+    """
+
+    def __init__(self):
+        self._exact: Dict[str, List[str]] = {}
+        self._root = _TrieNode()
+        self.size = 0
+
+    def add(self, pattern: str, targets: List[str]) -> None:
+        """Adds a pattern with its project-relative target paths."""
+        self.size += 1
+        star = pattern.find("*")
+        if star == -1:
+            self._exact[pattern] = targets
+            return
+        node = self._root
+        for char in pattern[:star]:
+            node = node.children.setdefault(char, _TrieNode())
+        node.patterns.append((pattern[star + 1:], targets))
+
+    def match(self, specifier: str) -> List[str]:
+        """
+        Returns the candidate paths for a specifier, in order, with '*' substituted.
+
+        An exact pattern wins; otherwise the wildcard pattern with the longest
+        prefix (whose suffix also matches) is used. Empty if nothing matches.
+        """
+        targets = self._exact.get(specifier)
+        if targets is not None:
+            return list(targets)
+        best: Optional[Tuple[int, str, List[str]]] = None
+        node = self._root
+        depth = 0
+        while True:
+            for suffix, candidate_targets in node.patterns:
+                if specifier.endswith(suffix) and len(specifier) - depth >= len(suffix):
+                    best = (depth, suffix, candidate_targets) # Deeper nodes overwrite: longest prefix wins
+                    break
+            if depth == len(specifier):
+                break
+            node = node.children.get(specifier[depth])
+            if node is None:
+                break
+            depth += 1
+        if best is None:
+            return []
+        depth, suffix, targets = best
+        captured = specifier[depth:len(specifier) - len(suffix)]
+        return [target.replace("*", captured, 1) for target in targets]
+
+# --- tsconfig Loading ---
+
+@dataclass
+class TsConfig:
+    """The resolution settings of one tsconfig.json, with its extends chain applied."""
+    directory: str # '/'-separated, relative to the project root
+    base_url: Optional[str] = None # Project-relative, if baseUrl is set
+    aliases: AliasTrie = field(default_factory=AliasTrie)
+
+def _relative_posix(path: Path, project_root: Path) -> Optional[str]:
+    try:
+        relative = path.relative_to(project_root).as_posix()
+    except ValueError:
+        return None
+    return "" if relative == "." else relative
+
+def _find_extended(config_path: Path, extends: str, project_root: Path) -> Optional[Path]:
+    """Locates the file named by an "extends" value (a path, or a package in node_modules)."""
+    if extends.startswith((".", "/")):
+        candidate = (config_path.parent / extends)
+        candidates = [candidate, candidate.with_name(candidate.name + ".json")]
+    else:
+        candidates = []
+        directory = config_path.parent
+        while True:
+            base = directory / "node_modules" / extends
+            candidates += [base, base.with_name(base.name + ".json"), base / TSCONFIG_NAME]
+            if directory == project_root or directory.parent == directory:
+                break
+            directory = directory.parent
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+    return None
+
+def _load_compiler_options(
+    config_path: Path,
+    project_root: Path,
+    raw_cache: Dict[Path, Optional[dict]],
+    seen: Set[Path]
+) -> Dict[str, Tuple[Any, Path]]:
+    """
+    Returns the effective compilerOptions of a config as {option: (value, directory of the
+    config that set it)}, merging the extends chain (later configs override earlier ones).
+    """
+    if config_path in seen:
+        logging.warning(f"Circular 'extends' in {config_path}; ignoring it")
+        return {}
+    if config_path not in raw_cache:
+        try:
+            data = parse_jsonc(config_path.read_text(encoding="utf-8-sig"))
+            raw_cache[config_path] = data if isinstance(data, dict) else None
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read tsconfig {config_path}: {e}")
+            raw_cache[config_path] = None
+    data = raw_cache[config_path]
+    if data is None:
+        return {}
+
+    options: Dict[str, Tuple[Any, Path]] = {}
+    extends = data.get("extends")
+    for parent in ([extends] if isinstance(extends, str) else extends if isinstance(extends, list) else []):
+        if not isinstance(parent, str):
+            continue
+        parent_path = _find_extended(config_path, parent, project_root)
+        if parent_path is None:
+            logging.warning(f"tsconfig {config_path} extends '{parent}', which was not found")
+            continue
+        options.update(_load_compiler_options(parent_path, project_root, raw_cache, seen | {config_path}))
+    compiler_options = data.get("compilerOptions")
+    if isinstance(compiler_options, dict):
+        for option in ("baseUrl", "paths"):
+            if option in compiler_options:
+                options[option] = (compiler_options[option], config_path.parent)
+    return options
+
+def load_tsconfig(config_path: Path, project_root: Path, raw_cache: Optional[Dict[Path, Optional[dict]]] = None) -> TsConfig:
+    """
+    Loads a tsconfig.json and compiles its path aliases.
+
+    Args:
+        config_path: Absolute path of the tsconfig.json.
+        project_root: Absolute path to the project root.
+        raw_cache: Parsed config files shared between calls, so that a base
+            config extended by many projects is read once.
+
+    Returns:
+        The TsConfig. Aliases pointing outside the project root are dropped.
+    """
+    options = _load_compiler_options(config_path, project_root, raw_cache if raw_cache is not None else {}, set())
+    config = TsConfig(directory=_relative_posix(config_path.parent, project_root) or "")
+
+    base_url, base_url_dir = options.get("baseUrl", (None, None))
+    if isinstance(base_url, str):
+        config.base_url = _relative_posix(Path(posixpath.normpath((base_url_dir / base_url).as_posix())), project_root)
+
+    paths, paths_dir = options.get("paths", (None, None))
+    if isinstance(paths, dict):
+        # Targets are relative to baseUrl, or to the config that declares "paths" without one
+        targets_base = config.base_url if config.base_url is not None else _relative_posix(paths_dir, project_root)
+        if targets_base is None:
+            return config
+        for pattern, targets in paths.items():
+            if not isinstance(targets, list):
+                continue
+            resolved = []
+            for target in targets:
+                if not isinstance(target, str):
+                    continue
+                normalized = posixpath.normpath(posixpath.join(targets_base, target))
+                if normalized != ".." and not normalized.startswith("../"):
+                    resolved.append("" if normalized == "." else normalized)
+            config.aliases.add(pattern, resolved)
+    return config
+
+# --- Project-wide Index ---
+
+class TsConfigIndex:
+    """
+    The tsconfig.json files of a project, used to resolve non-relative
+    TypeScript specifiers. Build one per run.
+    """
+
+    def __init__(self, project_root: Path, ts_index: JavaScriptFileIndex, tsconfig_files_rel: Iterable[Path] = ()):
+        """
+        Args:
+            project_root: Absolute path to the project root.
+            ts_index: Index of the files TypeScript imports may target.
+            tsconfig_files_rel: Relative paths of the project's tsconfig.json files.
+        """
+        self._ts_index = ts_index
+        raw_cache: Dict[Path, Optional[dict]] = {}
+        self._configs: Dict[str, TsConfig] = {}
+        for config_rel in tsconfig_files_rel:
+            if "node_modules" in config_rel.parts:
+                continue
+            config = load_tsconfig(project_root / config_rel, project_root, raw_cache)
+            self._configs[config.directory] = config
+        self._nearest: Dict[str, Optional[TsConfig]] = {}
+        self._memo: Dict[Tuple[str, str], Optional[Path]] = {}
+        logging.debug(f"Loaded {len(self._configs)} tsconfig.json files")
+
+    def config_for(self, source_file_rel: Path) -> Optional[TsConfig]:
+        """Returns the nearest tsconfig.json at or above the file's directory."""
+        directory = source_file_rel.parent.as_posix()
+        directory = "" if directory == "." else directory
+        if directory in self._nearest:
+            return self._nearest[directory]
+        visited = []
+        config = None
+        while True:
+            if directory in self._nearest:
+                config = self._nearest[directory]
+                break
+            visited.append(directory)
+            config = self._configs.get(directory)
+            if config is not None or not directory:
+                break
+            directory = posixpath.dirname(directory)
+        for path in visited:
+            self._nearest[path] = config
+        return config
+
+    def resolve(self, source_file_rel: Path, specifier: str) -> Optional[Path]:
+        """
+        Resolves a non-relative specifier through "paths" and then "baseUrl".
+
+        Returns:
+            The target project file, or None (the caller then tries packages).
+        """
+        config = self.config_for(source_file_rel)
+        if config is None:
+            return None
+        key = (config.directory, specifier)
+        if key in self._memo:
+            return self._memo[key]
+        target = None
+        for candidate in config.aliases.match(specifier):
+            target = self._ts_index.lookup_file(candidate)
+            if target is not None:
+                break
+        if target is None and config.base_url is not None:
+            target = self._ts_index.lookup_file(posixpath.normpath(posixpath.join(config.base_url, specifier)))
+        self._memo[key] = target
+        return target
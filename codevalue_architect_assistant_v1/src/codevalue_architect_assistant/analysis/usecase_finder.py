@@ -7,15 +7,26 @@ import re
 import logging
 from pathlib import Path
 from typing import List, Dict, Pattern, Tuple
-from dataclasses import dataclass
 
-@dataclass
-class UseCaseMatch:
-    file_path: Path # Relative path
-    line_number: int
-    match_type: str # e.g., 'function_name', 'comment_tag'
-    matched_text: str
-    context: str # The full line where the match occurred
+from ..utils.records import Record
+from ..utils import log
+
+class UseCaseMatch(Record):
+    __slots__ = ("file_path", "line_number", "match_type", "matched_text", "context")
+
+    def __init__(
+        self,
+        file_path: Path, # Relative path
+        line_number: int,
+        match_type: str, # e.g., 'function_name', 'comment_tag'
+        matched_text: str,
+        context: str # The full line where the match occurred
+    ):
+        self.file_path = file_path
+        self.line_number = line_number
+        self.match_type = match_type
+        self.matched_text = matched_text
+        self.context = context
 
 # --- Define Patterns ---
 # These are initial, simple patterns and likely need refinement.
@@ -76,7 +87,8 @@ def find_potential_usecases(
     patterns = PATTERNS_BY_LANG.get(language)
 
     if not patterns:
-        logging.debug(f"No use-case patterns defined for language: {language}")
+        if log.DEBUG:
+            logging.debug(f"No use-case patterns defined for language: {language}")
         return matches
 
     lines = file_content.splitlines()
@@ -96,7 +108,8 @@ def find_potential_usecases(
                     context=line.strip()
                 )
                 matches.append(use_case)
-                logging.debug(f"Found potential use-case: {use_case}")
+                if log.DEBUG:
+                    logging.debug(f"Found potential use-case: {use_case}")
                 # Stop checking other patterns on this line once one matches? Optional.
                 # break # Uncomment to report only the first match type per line
 
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+CLI subcommands, one module per command.
+
+cli.py registers them by name and imports a module only when its command
+runs, so `--help` and light commands do not pay for the heavier analyzers.
+"""
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+The 'analyze' command: file and language overview of a repository.
+"""
+
+import click
+import logging
+from pathlib import Path
+
+from .common import perform_analysis, walk_threads_option, no_ignore_files_option, source_option
+
+@click.command("analyze")
+@click.argument(
+    "repository_path_str",
+    type=click.Path(exists=True, file_okay=False, resolve_path=True),
+    metavar="REPOSITORY_PATH",
+)
+@walk_threads_option
+@no_ignore_files_option
+@source_option
+def analyze(repository_path_str, walk_threads, no_ignore_files, source):
+    """
+    Analyze a repository: identify files, languages, etc.
+    """
+    repository_path = Path(repository_path_str)
+    logging.info(f"Starting analysis command for repository: {repository_path}")
+    click.echo(f"Analyzing repository at: {repository_path}", err=True) # Use stderr for progress
+
+    try:
+        analysis_result = perform_analysis(
+            repository_path, walk_threads=walk_threads, use_ignore_files=not no_ignore_files, source=source
+        )
+
+        # --- Print Summary ---
+        click.echo("-" * 20)
+        click.echo(f"Analysis Summary for: {repository_path}")
+        click.echo(f"Total files scanned: {len(analysis_result.files)}")
+        click.echo("Language Distribution:")
+        if analysis_result.languages_detected:
+            for lang, count in sorted(analysis_result.languages_detected.items()):
+                click.echo(f"  - {lang.capitalize()}: {count}")
+        else:
+            click.echo("  (No specific languages detected based on extensions)")
+        click.echo("-" * 20)
+
+    except Exception as e:
+        logging.error(f"An error occurred during analysis: {e}", exc_info=True)
+        click.echo(f"Error during analysis: {e}", err=True)
+
+    logging.info(f"Analysis command finished for: {repository_path}")
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+The 'arch-check' command: checks the dependency graph against layer and
+slice rules, and exits with status 1 if an import breaks one (e.g. as a
+pre-commit hook or CI step).
+"""
+
+import json
+import click
+import logging
+from pathlib import Path
+
+from .common import (
+    walk_threads_option, no_ignore_files_option, source_option, profile_options, make_profiler, report_profile,
+)
+from .dependency_map import dependency_options, build_dependency_map
+from ..analysis.arch_rules import load_arch_rules, check_architecture, ArchRulesError, ARCH_RULES_FILE
+
+@click.command('arch-check')
+@click.argument('repository_path_str', type=click.Path(exists=True, file_okay=False, resolve_path=True), metavar='REPOSITORY_PATH')
+@click.option(
+    '--config', 'config_file',
+    type=click.Path(dir_okay=False, resolve_path=True),
+    default=None,
+    help=f'Rules file (JSON with comments). Default: <REPOSITORY_PATH>/{ARCH_RULES_FILE}.'
+)
+@click.option(
+    '--format', 'output_format',
+    type=click.Choice(['text', 'json'], case_sensitive=False),
+    default='text',
+    show_default=True,
+    help='text: one violation per line (file:line: ...). json: a list of violations.'
+)
+@walk_threads_option
+@no_ignore_files_option
+@source_option
+@dependency_options
+@profile_options
+def arch_check(repository_path_str, config_file, output_format, walk_threads, no_ignore_files, source, no_cache,
+               cache_max_mb, jobs, python_roots, profile, profile_out, cprofile_stage, cprofile_out):
+    """
+    Check imports against architecture layer and slice rules.
+    """
+    repository_path = Path(repository_path_str)
+    config_path = Path(config_file) if config_file else repository_path / ARCH_RULES_FILE
+    try:
+        rules = load_arch_rules(config_path)
+    except ArchRulesError as e:
+        click.echo(f"Error: Invalid architecture rules: {e}", err=True)
+        raise SystemExit(2)
+    logging.info(f"Checking {len(rules.rules)} layer rules and {len(rules.slices)} slice groups for: {repository_path}")
+    profiler = make_profiler(profile, profile_out, cprofile_stage)
+
+    try:
+        dep_map = build_dependency_map(
+            repository_path, walk_threads=walk_threads, use_ignore_files=not no_ignore_files, source=source,
+            no_cache=no_cache, cache_max_mb=cache_max_mb, jobs=jobs, python_roots=python_roots, profiler=profiler
+        )
+        if dep_map is None:
+            click.echo("No files found to analyze.", err=True)
+            return
+        with profiler.stage("arch-check") as stats:
+            violations = check_architecture(dep_map.graph, rules)
+            stats.items += dep_map.graph.number_of_edges()
+    except ArchRulesError as e:
+        click.echo(f"Error: Invalid architecture rules: {e}", err=True)
+        raise SystemExit(2)
+    finally:
+        report_profile(profiler, profile, profile_out, cprofile_out)
+
+    if output_format == 'json':
+        click.echo(json.dumps([
+            {"source_file": violation.source_file, "line": violation.line_number,
+             "target_file": violation.target_file, "rule": violation.rule}
+            for violation in violations
+        ], indent=2))
+    else:
+        for violation in violations:
+            location = f"{violation.source_file}:{violation.line_number}" if violation.line_number else violation.source_file
+            click.echo(f"{location}: imports {violation.target_file} ({violation.rule})")
+
+    if violations:
+        click.echo(f"{len(violations)} architecture violation(s).", err=True)
+        raise SystemExit(1)
+    click.echo("No architecture violations.", err=True)
+    logging.info(f"Architecture check finished for: {repository_path}")
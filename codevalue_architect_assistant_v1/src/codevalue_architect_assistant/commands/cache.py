@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+The 'cache' command group: inspects or clears the persistent parse cache.
+"""
+
+import click
+from pathlib import Path
+
+from ..analysis.parse_cache import ParseCache, CACHE_DIR_NAME
+
+@click.group('cache')
+def cache():
+    """
+    Inspect or clear the persistent parse cache.
+    """
+    pass
+
+@cache.command('stats')
+@click.argument('repository_path_str', type=click.Path(exists=True, file_okay=False, resolve_path=True), metavar='REPOSITORY_PATH')
+def cache_stats(repository_path_str):
+    """
+    Show the size and entry count of the parse cache.
+    """
+    repository_path = Path(repository_path_str)
+    if not (repository_path / CACHE_DIR_NAME).is_dir():
+        click.echo(f"No parse cache found in {repository_path / CACHE_DIR_NAME}")
+        return
+    with ParseCache.for_repository(repository_path, max_bytes=None) as parse_cache:
+        stats = parse_cache.stats()
+    click.echo(f"Cache file: {stats.path}")
+    click.echo(f"Entries: {stats.entries}")
+    cap = f" (cap {stats.max_bytes / (1024 * 1024):.0f} MiB)" if stats.max_bytes is not None else ""
+    click.echo(f"Payload size: {stats.payload_bytes / 1024:.1f} KiB{cap}")
+    click.echo(f"File size on disk: {stats.file_bytes / 1024:.1f} KiB")
+
+@cache.command('clear')
+@click.argument('repository_path_str', type=click.Path(exists=True, file_okay=False, resolve_path=True), metavar='REPOSITORY_PATH')
+def cache_clear(repository_path_str):
+    """
+    Remove all entries from the parse cache.
+    """
+    repository_path = Path(repository_path_str)
+    if not (repository_path / CACHE_DIR_NAME).is_dir():
+        click.echo(f"No parse cache found in {repository_path / CACHE_DIR_NAME}")
+        return
+    with ParseCache.for_repository(repository_path, max_bytes=None) as parse_cache:
+        removed = parse_cache.clear()
+    click.echo(f"Removed {removed} entries from the parse cache.")
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers and options shared by the commands that scan a repository.
+"""
+
+import click
+import logging
+from pathlib import Path
+from typing import Iterator, Optional
+
+from ..utils.filesystem import scan_repository_entries, FileEntry
+from ..utils.git_index import scan_git_index, GitIndexError
+from ..analysis.language import detect_language_from_name
+from ..models import ProjectFile, AnalysisResult
+from ..utils.profiling import Profiler, PIPELINE_STAGES
+
+# --- Core Analysis ---
+def iter_repository_entries(
+    repository_path: Path,
+    source: str = 'walk',
+    walk_threads: int = 1,
+    use_ignore_files: bool = True,
+) -> Iterator[FileEntry]:
+    """
+    Yields the files of a repository from the selected source.
+
+    'git-index' reads tracked files from .git/index and falls back to walking
+    the working tree when no usable index is present. walk_threads and
+    use_ignore_files only apply to a walk.
+    """
+    if source == 'git-index':
+        try:
+            entries = scan_git_index(repository_path)
+        except GitIndexError as e:
+            logging.warning(f"Cannot use git index ({e}); falling back to a filesystem walk.")
+        else:
+            ignored = [option for option, given in (('--walk-threads', walk_threads != 1),
+                                                    ('--no-ignore-files', not use_ignore_files)) if given]
+            if ignored:
+                logging.warning(f"{' and '.join(ignored)} ignored: the file list comes from the git index.")
+            return entries
+    return scan_repository_entries(
+        repository_path, walk_threads=walk_threads, use_ignore_files=use_ignore_files
+    )
+
+def perform_analysis(
+    repository_path: Path,
+    walk_threads: int = 1,
+    use_ignore_files: bool = True,
+    source: str = 'walk',
+    profiler: Optional[Profiler] = None,
+) -> AnalysisResult:
+    """
+    Performs the core repository scanning and file analysis.
+
+    Args:
+        repository_path: Root of the repository to scan.
+        walk_threads: Number of threads used to list directories (1 = serial walk).
+        use_ignore_files: Whether .gitignore/.archignore rules prune the scan.
+        source: Where the file list comes from: 'walk' or 'git-index'.
+        profiler: Optional profiler; the scan is recorded as the 'scan' stage.
+    """
+    logging.info(f"Performing core analysis for: {repository_path}")
+    analysis_result = AnalysisResult(repository_root=repository_path)
+
+    profiler = profiler or Profiler(enabled=False)
+    with profiler.stage("scan") as stats:
+        # The scanner already fetched kind, size and mtime; no further stat calls are needed here.
+        entries = iter_repository_entries(repository_path, source, walk_threads, use_ignore_files)
+        for entry in entries:
+            language = detect_language_from_name(entry.relative_path.name)
+            project_file = ProjectFile(
+                root=repository_path,
+                relative_path=entry.relative_path,
+                language=language,
+                size_bytes=entry.size_bytes,
+                # An mtime from the git index may predate unstaged edits; left unset, consumers
+                # that must see the working tree's (the parse cache) stat the file themselves
+                mtime_ns=None if entry.stat_from_index else entry.mtime_ns,
+            )
+            analysis_result.files.append(project_file)
+            stats.bytes += entry.size_bytes or 0
+
+            if language:
+                analysis_result.languages_detected[language] = analysis_result.languages_detected.get(language, 0) + 1
+        stats.files += len(analysis_result.files)
+
+    logging.info(f"Core analysis found {len(analysis_result.files)} files.")
+    return analysis_result
+
+# --- Shared Options ---
+# For commands that scan the repository
+walk_threads_option = click.option(
+    '--walk-threads',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='Number of threads listing directories concurrently. Useful on NFS/FUSE mounts; output order stays deterministic.'
+)
+
+no_ignore_files_option = click.option(
+    '--no-ignore-files', 'no_ignore_files',
+    is_flag=True,
+    default=False,
+    help='Do not honour .gitignore/.archignore files (only the built-in ignore list applies).'
+)
+
+source_option = click.option(
+    '--source',
+    type=click.Choice(['walk', 'git-index'], case_sensitive=False),
+    default='walk',
+    show_default=True,
+    help='Where to get the file list: walk the working tree, or read tracked files from .git/index (falls back to walking if there is no index).'
+)
+
+def profile_options(command):
+    """Adds --profile, --profile-out, --cprofile-stage and --cprofile-out to a command."""
+    options = [
+        click.option(
+            '--profile', 'profile',
+            is_flag=True,
+            default=False,
+            help='Print the wall time, CPU time and throughput of each pipeline stage to stderr.'
+        ),
+        click.option(
+            '--profile-out',
+            type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+            default=None,
+            help='Write the per-stage report as JSON to this file (implies profiling).'
+        ),
+        click.option(
+            '--cprofile-stage',
+            type=click.Choice(PIPELINE_STAGES),
+            default=None,
+            help='Run one stage under cProfile and dump its statistics (see --cprofile-out).'
+        ),
+        click.option(
+            '--cprofile-out',
+            type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+            default=None,
+            help='pstats file for --cprofile-stage. Default: cva-<stage>.pstats in the current directory.'
+        ),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+def make_profiler(profile: bool, profile_out: Optional[str], cprofile_stage: Optional[str]) -> Profiler:
+    """Returns the profiler for a command run; disabled unless a profiling option was given."""
+    return Profiler(enabled=bool(profile or profile_out or cprofile_stage), cprofile_stage=cprofile_stage)
+
+def report_profile(profiler: Profiler, profile: bool, profile_out: Optional[str], cprofile_out: Optional[str]) -> None:
+    """Prints and/or writes the profiling results requested on the command line."""
+    if not profiler.enabled:
+        return
+    if profile:
+        click.echo("-" * 20, err=True)
+        click.echo(profiler.format_table(), err=True)
+    if profile_out:
+        profiler.write_json(profile_out)
+        click.echo(f"Profile report saved to: {profile_out}", err=True)
+    if profiler.cprofile_stage:
+        path = cprofile_out or f"cva-{profiler.cprofile_stage}.pstats"
+        if profiler.dump_cprofile(path):
+            click.echo(f"cProfile statistics of stage '{profiler.cprofile_stage}' saved to: {path}", err=True)
+        else:
+            click.echo(f"Stage '{profiler.cprofile_stage}' did not run; no cProfile statistics written.", err=True)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+The 'cycles' command: reports groups of files that import each other in a
+cycle, and can fail a CI run when a cycle appears that a baseline does not
+know about.
+"""
+
+import json
+import click
+import logging
+from pathlib import Path
+
+from .common import (
+    walk_threads_option, no_ignore_files_option, source_option, profile_options, make_profiler, report_profile,
+)
+from .dependency_map import dependency_options, build_dependency_map
+from ..analysis.cycles import find_cycles, load_baseline, write_baseline, new_cycle_groups
+
+@click.command('cycles')
+@click.argument('repository_path_str', type=click.Path(exists=True, file_okay=False, resolve_path=True), metavar='REPOSITORY_PATH')
+@click.option(
+    '--format', 'output_format',
+    type=click.Choice(['text', 'json'], case_sensitive=False),
+    default='text',
+    show_default=True,
+    help='Output format of the cycle report.'
+)
+@click.option(
+    '--baseline', 'baseline_file',
+    type=click.Path(dir_okay=False, resolve_path=True),
+    default=None,
+    help='JSON file of known cycle groups; only groups it does not cover are reported as new.'
+)
+@click.option(
+    '--update-baseline',
+    is_flag=True,
+    default=False,
+    help='Write the current cycle groups to the --baseline file.'
+)
+@click.option(
+    '--check',
+    is_flag=True,
+    default=False,
+    help='Exit with status 1 if there is a new cycle group (any group without --baseline).'
+)
+@click.option(
+    '--max-files',
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help='Number of files listed per cycle group in the text report.'
+)
+@walk_threads_option
+@no_ignore_files_option
+@source_option
+@dependency_options
+@profile_options
+def cycles(repository_path_str, output_format, baseline_file, update_baseline, check, max_files, walk_threads,
+           no_ignore_files, source, no_cache, cache_max_mb, jobs, python_roots, profile, profile_out, cprofile_stage,
+           cprofile_out):
+    """
+    Find import cycles between files (Python & JS).
+    """
+    repository_path = Path(repository_path_str)
+    if update_baseline and not baseline_file:
+        click.echo("Error: --update-baseline needs --baseline.", err=True)
+        return
+    logging.info(f"Starting cycle detection for repository: {repository_path}")
+    click.echo(f"Looking for import cycles in repository at: {repository_path}", err=True)
+    profiler = make_profiler(profile, profile_out, cprofile_stage)
+
+    try:
+        dep_map = build_dependency_map(
+            repository_path, walk_threads=walk_threads, use_ignore_files=not no_ignore_files, source=source,
+            no_cache=no_cache, cache_max_mb=cache_max_mb, jobs=jobs, python_roots=python_roots, profiler=profiler
+        )
+        if dep_map is None:
+            click.echo("No files found to analyze.", err=True)
+            return
+        with profiler.stage("cycles") as stats:
+            groups = find_cycles(dep_map.graph)
+            stats.items += dep_map.graph.number_of_edges()
+    finally:
+        report_profile(profiler, profile, profile_out, cprofile_out)
+
+    baseline = None
+    if baseline_file and not update_baseline:
+        if not Path(baseline_file).exists():
+            logging.warning(f"Baseline {baseline_file} does not exist yet; every cycle group is new.")
+            baseline = []
+        else:
+            try:
+                baseline = load_baseline(baseline_file)
+            except (OSError, ValueError) as e:
+                click.echo(f"Error: Cannot read baseline {baseline_file}: {e}", err=True)
+                raise SystemExit(2)
+    new_groups = new_cycle_groups(groups, baseline)
+    new_ids = {id(group) for group in new_groups}
+
+    if output_format == 'json':
+        click.echo(json.dumps({
+            "cycles": [
+                {"files": group.files, "example": group.example, "new": id(group) in new_ids} for group in groups
+            ],
+        }, indent=2))
+    elif not groups:
+        click.echo("No import cycles found.")
+    else:
+        click.echo("-" * 20)
+        click.echo(f"Import cycle groups: {len(groups)} ({sum(len(group.files) for group in groups)} files)"
+                   + (f", {len(new_groups)} new" if baseline is not None else ""))
+        for number, group in enumerate(groups, 1):
+            marker = " [NEW]" if baseline is not None and id(group) in new_ids else ""
+            click.echo(f"  {number}. {len(group.files)} files{marker}")
+            click.echo(f"     Cycle: {' -> '.join(group.example)}")
+            for file in group.files[:max_files]:
+                click.echo(f"     - {file}")
+            if len(group.files) > max_files:
+                click.echo(f"     - ... ({len(group.files) - max_files} more)")
+        click.echo("-" * 20)
+
+    if update_baseline:
+        write_baseline(baseline_file, groups)
+        click.echo(f"Baseline with {len(groups)} cycle groups saved to: {baseline_file}", err=True)
+    elif check and new_groups:
+        click.echo(f"Error: {len(new_groups)} new import cycle group(s).", err=True)
+        raise SystemExit(1)
+
+    logging.info(f"Cycle detection finished for: {repository_path}")
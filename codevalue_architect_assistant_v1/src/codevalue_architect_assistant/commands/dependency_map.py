@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Options and pipeline shared by the commands that work on the dependency map
+(map-deps, cycles, ...): scan the repository, parse and resolve imports
+through the parse cache, and build the DependencyMap as they are produced.
+"""
+
+import click
+import logging
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .common import perform_analysis
+from ..analysis.dependency_resolver import iter_dependencies
+from ..analysis.parse_cache import open_parse_cache, DEFAULT_MAX_BYTES, CACHE_DIR_NAME
+from ..utils.profiling import Profiler
+from ..models import DependencyMap
+
+def dependency_options(command):
+    """Adds --no-cache, --cache-max-mb, --jobs and --python-root to a command."""
+    options = [
+        click.option(
+            '--no-cache', 'no_cache',
+            is_flag=True,
+            default=False,
+            help=f'Do not use the persistent parse cache in <REPOSITORY_PATH>/{CACHE_DIR_NAME}/.'
+        ),
+        click.option(
+            '--cache-max-mb',
+            type=click.IntRange(min=1),
+            default=DEFAULT_MAX_BYTES // (1024 * 1024),
+            show_default=True,
+            help='Size cap of the parse cache; least-recently-used entries are evicted beyond it.'
+        ),
+        click.option(
+            '--jobs', '-j',
+            type=click.IntRange(min=1),
+            default=1,
+            show_default=True,
+            help='Number of worker processes used to parse files. 1 parses in the main process.'
+        ),
+        click.option(
+            '--python-root', 'python_roots',
+            multiple=True,
+            metavar='DIR',
+            help="Source root for absolute Python imports, relative to REPOSITORY_PATH (repeatable). "
+                 "Default: the repository root and 'src/' if present."
+        ),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+def build_dependency_map(
+    repository_path: Path,
+    dep_map: Optional[DependencyMap] = None,
+    walk_threads: int = 1,
+    use_ignore_files: bool = True,
+    source: str = 'walk',
+    no_cache: bool = False,
+    cache_max_mb: int = DEFAULT_MAX_BYTES // (1024 * 1024),
+    jobs: int = 1,
+    python_roots: Sequence[str] = (),
+    profiler: Optional[Profiler] = None,
+) -> Optional[DependencyMap]:
+    """
+    Scans a repository and resolves its imports into a dependency map.
+
+    Args:
+        repository_path: Root of the repository.
+        dep_map: Map to fill (e.g. one set up for a directory rollup); a new file-level map by default.
+        walk_threads, use_ignore_files, source: See perform_analysis().
+        no_cache, cache_max_mb, jobs, python_roots: The dependency_options() values.
+        profiler: Optional profiler; records the 'scan' to 'graph' stages.
+
+    Returns:
+        The filled map, or None if the scan found no files.
+    """
+    profiler = profiler or Profiler(enabled=False)
+    analysis_result = perform_analysis(
+        repository_path, walk_threads=walk_threads, use_ignore_files=use_ignore_files, source=source,
+        profiler=profiler
+    )
+    if not analysis_result.files:
+        return None
+
+    # Skip unchanged files via the parse cache, and add dependencies to the map as they are produced
+    if dep_map is None:
+        dep_map = DependencyMap(repository_root=repository_path)
+    parse_cache = None if no_cache else open_parse_cache(repository_path, max_bytes=cache_max_mb * 1024 * 1024)
+    try:
+        # Parsing and resolution run inside this stage as nested stages of their own
+        with profiler.stage("graph") as stats:
+            dep_map.add_dependencies(iter_dependencies(
+                analysis_result, repository_path, parse_cache=parse_cache, jobs=jobs,
+                python_source_roots=list(python_roots) or None, profiler=profiler
+            ))
+            stats.items += dep_map.graph.number_of_edges() # Also compacts the graph
+    finally:
+        if parse_cache is not None:
+            logging.info(f"Parse cache: {parse_cache.hits} hits, {parse_cache.misses} misses")
+            parse_cache.close()
+    return dep_map
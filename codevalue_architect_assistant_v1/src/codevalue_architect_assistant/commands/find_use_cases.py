@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+The 'find-use-cases' command: scans code for patterns that hint at use-cases.
+"""
+
+import click
+import logging
+from pathlib import Path
+from typing import List
+
+from .common import iter_repository_entries, walk_threads_option, no_ignore_files_option, source_option
+from ..analysis.language import detect_language_from_name
+from ..analysis.usecase_finder import find_potential_usecases, UseCaseMatch, PATTERNS_BY_LANG
+from ..utils.content import read_file_content
+from ..utils import log
+
+@click.command('find-use-cases')
+@click.argument('repository_path_str', type=click.Path(exists=True, file_okay=False, resolve_path=True), metavar='REPOSITORY_PATH')
+@walk_threads_option
+@no_ignore_files_option
+@source_option
+def find_use_cases(repository_path_str, walk_threads, no_ignore_files, source):
+    """
+    Find potential use-cases by scanning code for patterns.
+    """
+    repository_path = Path(repository_path_str)
+    logging.info(f"Starting use-case finding for repository: {repository_path}")
+    click.echo(f"Scanning for potential use-cases in: {repository_path}", err=True)
+
+    all_matches: List[UseCaseMatch] = []
+    processed_files = 0
+    supported_languages = PATTERNS_BY_LANG.keys() # Get languages with defined patterns
+
+    try:
+        entries = iter_repository_entries(repository_path, source, walk_threads, not no_ignore_files)
+        for entry in entries:
+            file_path = entry.path
+            language = detect_language_from_name(entry.relative_path.name)
+            if language in supported_languages:
+                processed_files += 1
+                if log.DEBUG:
+                    logging.debug(f"Scanning file for use-cases: {file_path}")
+                try:
+                    # Read once; the encoding is detected from the BOM, coding cookie or UTF-8 validity
+                    content = read_file_content(file_path)
+                    matches = find_potential_usecases(content.text, entry.relative_path, language)
+                    all_matches.extend(matches)
+                except OSError as read_err:
+                    logging.warning(f"Could not read file {file_path} for use-case scan: {read_err}")
+                except Exception as scan_err:
+                    logging.error(f"Error scanning file {file_path} for use-cases: {scan_err}", exc_info=True)
+
+        # --- Print Results ---
+        click.echo("-" * 20)
+        click.echo(f"Potential Use-Case Scan Summary for: {repository_path}")
+        click.echo(f"Files scanned (Python/JS): {processed_files}")
+        click.echo(f"Potential use-case indicators found: {len(all_matches)}")
+        click.echo("-" * 20)
+
+        if all_matches:
+            # Sort matches for consistent output
+            all_matches.sort(key=lambda m: (m.file_path, m.line_number))
+            for match in all_matches:
+                click.echo(f"{match.file_path}:{match.line_number} [{match.match_type}] => {match.matched_text}")
+                # Optionally print context: click.echo(f"  Context: {match.context}")
+        else:
+            click.echo("No potential use-case indicators found based on current patterns.")
+
+
+    except Exception as e:
+        logging.error(f"An error occurred during use-case finding: {e}", exc_info=True)
+        click.echo(f"Error during use-case finding: {e}", err=True)
+
+    logging.info(f"Use-case finding finished for: {repository_path}")
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+The 'map-deps' command: resolves imports into a dependency map and prints a
+summary or a diagram.
+"""
+
+import click
+import logging
+from pathlib import Path
+
+from .common import (
+    walk_threads_option, no_ignore_files_option, source_option, profile_options, make_profiler, report_profile,
+)
+from .dependency_map import dependency_options, build_dependency_map
+from ..models import DependencyMap, GRANULARITIES
+from ..diagrams.mermaid_generator import write_mermaid_diagram
+from ..diagrams.plantuml_generator import write_plantuml_diagram
+from ..diagrams.partition import (
+    partition_graph, write_partitioned_diagrams, PARTITION_STRATEGIES, DEFAULT_MAX_NODES, DEFAULT_MAX_EDGES,
+)
+
+class _EchoSink:
+    """Text sink that passes each chunk to click.echo (stdout), for streaming a diagram to the console."""
+
+    def write(self, text: str) -> None:
+        click.echo(text, nl=False)
+
+def _write_diagram(dep_map: DependencyMap, output_format: str, mermaid_direction: str, sink) -> None:
+    if output_format == 'mermaid':
+        write_mermaid_diagram(dep_map, sink, direction=mermaid_direction)
+    elif output_format == 'plantuml':
+        write_plantuml_diagram(dep_map, sink)
+
+@click.command('map-deps')
+@click.argument('repository_path_str', type=click.Path(exists=True, file_okay=False, resolve_path=True), metavar='REPOSITORY_PATH')
+@click.option(
+    '--format', 'output_format',
+    type=click.Choice(['summary', 'mermaid', 'plantuml'], case_sensitive=False),
+    default='summary',
+    help='Output format for the dependency map.'
+)
+@click.option(
+    '--mermaid-direction',
+    type=click.Choice(['LR', 'TD', 'RL', 'BT'], case_sensitive=False),
+    default='LR',
+    help='Direction for Mermaid graph layout (LR, TD, etc.). Only used if format is mermaid.'
+)
+@click.option(
+    '-o', '--output', 'output_file',
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help='Path to save the output diagram (Mermaid/PlantUML). If not provided, prints to console.'
+)
+@walk_threads_option
+@no_ignore_files_option
+@source_option
+@dependency_options
+@click.option(
+    '--granularity',
+    type=click.Choice(GRANULARITIES, case_sensitive=False),
+    default='file',
+    show_default=True,
+    help="Graph nodes: files, or directories ('dir') with edges weighted by the number of imports between them."
+)
+@click.option(
+    '--depth',
+    type=click.IntRange(min=1),
+    default=2,
+    show_default=True,
+    help='With --granularity dir: number of directory levels kept, e.g. 2 rolls src/app/models/ up into src/app.'
+)
+@click.option(
+    '--partition', 'partition_strategy',
+    type=click.Choice(PARTITION_STRATEGIES, case_sensitive=False),
+    default=None,
+    help='Split the diagram into linked sub-diagrams, grouped by directory or by community of files '
+         'that import each other. -o names the index diagram; sub-diagrams are written next to it.'
+)
+@click.option(
+    '--max-nodes',
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_NODES,
+    show_default=True,
+    help='Maximum number of files per sub-diagram with --partition.'
+)
+@click.option(
+    '--max-edges',
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_EDGES,
+    show_default=True,
+    help='Maximum number of dependencies per sub-diagram with --partition.'
+)
+@profile_options
+def map_deps(repository_path_str, output_format, mermaid_direction, output_file, walk_threads, no_ignore_files, source,
+             no_cache, cache_max_mb, jobs, python_roots, granularity, depth, partition_strategy, max_nodes, max_edges,
+             profile, profile_out, cprofile_stage, cprofile_out):
+    """
+    Analyze dependencies (Python & JS) and generate a dependency map or diagram.
+    """
+    repository_path = Path(repository_path_str)
+    if partition_strategy and (output_format == 'summary' or not output_file):
+        click.echo("Error: --partition needs --format mermaid or plantuml and an -o index file.", err=True)
+        return
+    logging.info(f"Starting dependency mapping for repository: {repository_path} (Format: {output_format})")
+    click.echo(f"Mapping dependencies for repository at: {repository_path}", err=True)
+    profiler = make_profiler(profile, profile_out, cprofile_stage)
+
+    try:
+        # 1. Scan the repository and resolve dependencies (Python & JS) into the Dependency Map
+        #    (or its directory rollup)
+        dep_map = build_dependency_map(
+            repository_path,
+            DependencyMap(repository_root=repository_path, granularity=granularity.lower(), rollup_depth=depth),
+            walk_threads=walk_threads, use_ignore_files=not no_ignore_files, source=source,
+            no_cache=no_cache, cache_max_mb=cache_max_mb, jobs=jobs, python_roots=python_roots, profiler=profiler
+        )
+        if dep_map is None:
+            click.echo("No files found to analyze.", err=True)
+            return
+
+        # 2. Generate Output based on format
+        if output_format == 'summary':
+            click.echo("-" * 20)
+            click.echo(f"Dependency Map Summary for: {repository_path}")
+            if dep_map.granularity == 'file':
+                click.echo(f"Total Nodes (Files): {dep_map.graph.number_of_nodes()}")
+                click.echo(f"Total Edges (Resolved Dependencies): {dep_map.graph.number_of_edges()}")
+            else:
+                click.echo(f"Total Nodes (Directories, depth {dep_map.rollup_depth}): {dep_map.graph.number_of_nodes()}")
+                click.echo(f"Total Edges (Between Directories): {dep_map.graph.number_of_edges()}")
+                click.echo(f"Resolved Dependencies Within a Directory: {dep_map.internal_dependencies}")
+            click.echo(f"Unresolved Dependencies (External/StdLib/Errors): {len(dep_map.unresolved)}")
+            if dep_map.unresolved:
+                 click.echo("  Examples of unresolved:")
+                 for source_file, target_module in dep_map.unresolved.examples():
+                     click.echo(f"    - {target_module} (from {source_file})")
+                 if len(dep_map.unresolved) > 10:
+                     click.echo("    - ...")
+            click.echo("-" * 20)
+        elif output_format in ['mermaid', 'plantuml']:
+            # The diagram is streamed to its destination as it is generated, never held as one string
+            if partition_strategy:
+                with profiler.stage("render") as stats:
+                    partitioning = partition_graph(dep_map.graph, max_nodes=max_nodes, max_edges=max_edges,
+                                                   strategy=partition_strategy.lower())
+                    written = write_partitioned_diagrams(dep_map, partitioning, Path(output_file),
+                                                         output_format=output_format, direction=mermaid_direction)
+                    stats.items += dep_map.graph.number_of_nodes()
+                    stats.files += len(written)
+                    stats.bytes += sum(path.stat().st_size for path in written)
+                click.echo(f"Diagram index saved to: {written[0]} ({len(written) - 1} sub-diagrams)", err=True)
+            elif output_file:
+                try:
+                    output_path = Path(output_file)
+                    output_path.parent.mkdir(parents=True, exist_ok=True) # Ensure directory exists
+                    with profiler.stage("render") as stats:
+                        with output_path.open('w', encoding='utf-8') as sink:
+                            _write_diagram(dep_map, output_format, mermaid_direction, sink)
+                        stats.items += dep_map.graph.number_of_nodes()
+                        stats.files += 1
+                        stats.bytes += output_path.stat().st_size
+                    click.echo(f"Diagram saved to: {output_path}", err=True)
+                except Exception as write_err:
+                    logging.error(f"Failed to write diagram to {output_file}: {write_err}", exc_info=True)
+                    click.echo(f"Error: Failed to write diagram to {output_file}: {write_err}", err=True)
+            else:
+                # Print diagram syntax to stdout if no output file specified
+                with profiler.stage("render") as stats:
+                    _write_diagram(dep_map, output_format, mermaid_direction, _EchoSink())
+                    click.echo()
+                    stats.items += dep_map.graph.number_of_nodes()
+
+    except Exception as e:
+        logging.error(f"An error occurred during dependency mapping: {e}", exc_info=True)
+        click.echo(f"Error during dependency mapping: {e}", err=True)
+    finally:
+        report_profile(profiler, profile, profile_out, cprofile_out)
+
+    logging.info(f"Dependency mapping finished for: {repository_path}")
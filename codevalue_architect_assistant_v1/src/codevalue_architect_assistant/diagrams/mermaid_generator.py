@@ -3,10 +3,13 @@
 Generates Mermaid syntax for dependency graphs.
 """
 
+import io
 import logging
-import networkx as nx
 from ..models import DependencyMap
+from ..graph import CompactGraph
+from .writer import LineWriter, DEFAULT_CHUNK_LINES
 from pathlib import Path
+from typing import Dict, Sequence, TextIO, Tuple
 
 def _sanitize_mermaid_id(node_id: str) -> str:
     """
@@ -30,63 +33,78 @@ def generate_mermaid_diagram(dep_map: DependencyMap, direction: str = "LR") -> s
     Generates a Mermaid diagram string from a DependencyMap.
 
     Args:
-        dep_map: The DependencyMap containing the networkx graph.
+        dep_map: The DependencyMap containing the dependency graph.
         direction: The graph direction ('LR' for Left-to-Right, 'TD' for Top-Down).
 
     Returns:
         A string containing the Mermaid diagram syntax.
     """
-    if not isinstance(dep_map, DependencyMap) or not isinstance(dep_map.graph, nx.DiGraph):
+    buffer = io.StringIO()
+    write_mermaid_diagram(dep_map, buffer, direction)
+    return buffer.getvalue()
+
+def write_mermaid_diagram(
+    dep_map: DependencyMap,
+    sink: TextIO,
+    direction: str = "LR",
+    chunk_lines: int = DEFAULT_CHUNK_LINES
+) -> None:
+    """
+    Writes the Mermaid diagram of a DependencyMap to a text sink, in chunks.
+
+    Runs in O(N + E): each edge is visited once, and isolated nodes are
+    found from the node degrees. The text is the same as generate_mermaid_diagram()
+    returns (no trailing newline); nothing is written for an invalid map.
+    Rolled-up maps (granularity other than 'file') label each edge with its
+    import count.
+
+    Args:
+        dep_map: The DependencyMap containing the dependency graph.
+        sink: Where to write, e.g. a file opened for writing.
+        direction: The graph direction ('LR' for Left-to-Right, 'TD' for Top-Down).
+        chunk_lines: Number of lines passed to the sink at a time.
+    """
+    if not isinstance(dep_map, DependencyMap) or not isinstance(dep_map.graph, CompactGraph):
         logging.error("Invalid DependencyMap or graph provided to Mermaid generator.")
-        return ""
+        return
 
+    writer = LineWriter(sink, chunk_lines)
     graph = dep_map.graph
     if not graph: # Handles empty graph case
         logging.warning("Dependency graph is empty. Generating empty Mermaid diagram.")
-        return f"graph {direction};\n    %% Empty Graph"
+        writer.write(f"graph {direction};")
+        writer.write("    %% Empty Graph")
+        writer.flush()
+        return
 
-    mermaid_lines = []
     # Ensure direction is valid
     valid_directions = ["TD", "TB", "BT", "RL", "LR"]
     if direction.upper() not in valid_directions:
         logging.warning(f"Invalid Mermaid direction '{direction}'. Defaulting to 'LR'.")
         direction = "LR"
-    mermaid_lines.append(f"graph {direction.upper()};")
-
-    # Add nodes and edges
-    nodes_added = set()
-    edges_added = set()
-
-    for u, v, data in graph.edges(data=True):
-        # Sanitize node IDs (file paths)
-        u_id = _sanitize_mermaid_id(str(u))
-        v_id = _sanitize_mermaid_id(str(v))
-
-        # Add node definitions if not already added (optional, Mermaid creates nodes from edges)
-        # Explicit definition allows styling later if needed.
-        # if u_id not in nodes_added:
-        #     mermaid_lines.append(f'    {u_id}["{str(u)}"];') # Display original path in label
-        #     nodes_added.add(u_id)
-        # if v_id not in nodes_added:
-        #     mermaid_lines.append(f'    {v_id}["{str(v)}"];') # Display original path in label
-        #     nodes_added.add(v_id)
-
-        # Add edge
-        edge_str = f'    {u_id} --> {v_id};'
-        # Prevent duplicate edges in output if graph has parallel edges (unlikely here)
-        if edge_str not in edges_added:
-             mermaid_lines.append(edge_str)
-             edges_added.add(edge_str)
-
-    # Add nodes that might not have edges (isolated files)
-    for node in graph.nodes():
-        node_id_sanitized = _sanitize_mermaid_id(str(node))
-        # Check if the node participated in any added edge
-        participated = any(node_id_sanitized in edge for edge in edges_added)
-        if not participated:
-             # Add node explicitly if it had no edges
-             mermaid_lines.append(f'    {node_id_sanitized}["{str(node)}"];')
-
+    writer.write(f"graph {direction.upper()};")
+
+    # Sanitize each node ID (file path) once; edges refer to nodes by integer ID
+    names = graph.paths.names
+    sanitized_ids = [_sanitize_mermaid_id(name) for name in names]
+    # The graph has no parallel edges; the output can only repeat an edge if two paths sanitize alike
+    edges_added = set() if len(set(sanitized_ids)) < len(sanitized_ids) else None
+
+    weighted = dep_map.granularity != "file"
+    for u, v, weight in graph.iter_weighted_edges():
+        arrow = f"-->|{weight}|" if weighted else "-->"
+        edge_str = f'    {sanitized_ids[u]} {arrow} {sanitized_ids[v]};'
+        if edges_added is not None:
+            if edge_str in edges_added:
+                continue
+            edges_added.add(edge_str)
+        writer.write(edge_str)
+
+    # Add nodes without edges (isolated files) explicitly
+    out_degrees, in_degrees = graph.out_degrees(), graph.in_degrees()
+    for node_id, (node, node_id_sanitized) in enumerate(zip(names, sanitized_ids)):
+        if not out_degrees[node_id] and not in_degrees[node_id]:
+            writer.write(f'    {node_id_sanitized}["{node}"];')
 
     # Add unresolved dependencies as separate nodes (optional visualization choice)
     # for i, unresolved in enumerate(dep_map.unresolved_dependencies):
@@ -96,7 +114,33 @@ def generate_mermaid_diagram(dep_map: DependencyMap, direction: str = "LR") -> s
     #     mermaid_lines.append(f'    {target_id}[("{target_label}")];') # Style external nodes differently
     #     mermaid_lines.append(f'    {source_id} -.-> {target_id};') # Dashed line for external
 
-    if not mermaid_lines[1:]: # Check if only the 'graph TD/LR;' line exists
-         mermaid_lines.append("    %% No dependencies found to visualize")
+    if writer.lines == 1: # Check if only the 'graph TD/LR;' line exists
+        writer.write("    %% No dependencies found to visualize")
+    writer.flush()
+
+def write_mermaid_index(
+    entries: Sequence[Tuple[str, str]],
+    edges: Dict[Tuple[int, int], int],
+    sink: TextIO,
+    direction: str = "LR",
+    chunk_lines: int = DEFAULT_CHUNK_LINES
+) -> None:
+    """
+    Writes the index diagram of a partitioned graph (see diagrams.partition).
 
-    return "\n".join(mermaid_lines)
\ No newline at end of file
+    Args:
+        entries: (label, link) per sub-diagram; clicking its node opens the link.
+        edges: Number of dependencies between sub-diagrams, keyed by their (source, target) index.
+        sink: Where to write.
+        direction: The graph direction.
+        chunk_lines: Number of lines passed to the sink at a time.
+    """
+    writer = LineWriter(sink, chunk_lines)
+    writer.write(f"graph {direction.upper()};")
+    for index, (label, _) in enumerate(entries):
+        writer.write(f'    part{index}["{label}"];')
+    for (source, target), count in sorted(edges.items()):
+        writer.write(f"    part{source} -->|{count}| part{target};")
+    for index, (_, link) in enumerate(entries):
+        writer.write(f'    click part{index} "{link}" "Open sub-diagram"')
+    writer.flush()
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""
+Splits a dependency graph into sub-diagrams of bounded size.
+
+Mermaid and PlantUML renderers time out or run out of memory past a few
+thousand edges. partition_graph() assigns every node to a partition of at
+most max_nodes nodes and max_edges edges; write_partitioned_diagrams() then
+writes one diagram per partition with the edges inside it, and an index
+diagram with one node per partition, linked to that partition's file, and
+the number of imports between partitions.
+
+A node's outgoing edges are charged to its partition, so the edge budget
+bounds the edges a sub-diagram can contain (those that stay inside it).
+
+Grouping strategies:
+  * 'directory': the directory tree is cut at the largest directories that
+    fit the budget; consecutive small directories share a partition.
+  * 'community': label propagation over the undirected graph finds groups
+    of files that mostly import each other; groups over the budget are split
+    by directory as above.
+Both take O((N + E) * depth) time besides sorting the paths, where depth is
+that of the directory tree (a fixed number of propagation rounds for
+'community').
+"""
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from ..graph import CompactGraph
+from ..models import DependencyMap
+
+PARTITION_STRATEGIES = ("directory", "community")
+DEFAULT_MAX_NODES = 500
+DEFAULT_MAX_EDGES = 1500
+LABEL_PROPAGATION_ROUNDS = 10
+
+@dataclass
+class Partition:
+    """A group of nodes drawn as one sub-diagram."""
+    label: str # The deepest directory containing all its nodes ('.' for the root), numbered if shared
+    nodes: List[int] = field(default_factory=list) # Node IDs, ordered by path
+
+@dataclass
+class Partitioning:
+    """The partitions of a graph and, for every node ID, the index of its partition."""
+    partitions: List[Partition]
+    assignment: List[int]
+
+# --- Partitioning ---
+
+def _path_parts(name: str) -> List[str]:
+    return name.replace("\\", "/").split("/")
+
+def _pack(groups: Sequence[List[int]], weights: List[int], max_nodes: int, max_edges: int) -> List[List[int]]:
+    """
+    Merges consecutive groups while the result fits the budget.
+
+    Each group must fit on its own, except a single node whose edges exceed
+    max_edges, which then gets a partition to itself.
+    """
+    packed: List[List[int]] = []
+    current: List[int] = []
+    current_edges = 0
+    for group in groups:
+        group_edges = sum(weights[node] for node in group)
+        if current and (len(current) + len(group) > max_nodes or current_edges + group_edges > max_edges):
+            packed.append(current)
+            current, current_edges = [], 0
+        current.extend(group)
+        current_edges += group_edges
+    if current:
+        packed.append(current)
+    return packed
+
+def _directory_groups(nodes: List[int], parts: List[List[str]], weights: List[int],
+                      depth: int, max_nodes: int, max_edges: int) -> List[List[int]]:
+    """
+    Splits nodes (all under the same directory at the given depth) along the directory tree.
+
+    Returns groups that each fit the budget, in path order: the directory
+    itself if it fits, else its own files in budget-sized chunks followed
+    by the groups of each subdirectory.
+    """
+    if len(nodes) <= max_nodes and sum(weights[node] for node in nodes) <= max_edges:
+        return [nodes]
+    files: List[List[int]] = []
+    subdirectories: Dict[str, List[int]] = {}
+    for node in nodes:
+        node_parts = parts[node]
+        if len(node_parts) - 1 <= depth:
+            files.append([node])
+        else:
+            subdirectories.setdefault(node_parts[depth], []).append(node)
+    groups = _pack(files, weights, max_nodes, max_edges)
+    for name in sorted(subdirectories):
+        groups.extend(_directory_groups(subdirectories[name], parts, weights, depth + 1, max_nodes, max_edges))
+    return groups
+
+def _label_propagation(graph: CompactGraph, rounds: int) -> List[int]:
+    """
+    Community label of every node, by label propagation over the undirected graph.
+
+    Nodes are visited in ID order and adopt the label most common among
+    their neighbours, keeping their own on ties if it is among the most
+    common, else taking the smallest, so the result is deterministic.
+    Stops after the given number of rounds, or once fewer than 0.1% of the
+    nodes change label in a round.
+    """
+    node_count = len(graph.paths)
+    neighbours: List[List[int]] = [[] for _ in range(node_count)]
+    for u, v in graph.iter_edges():
+        if u != v:
+            neighbours[u].append(v)
+            neighbours[v].append(u)
+    labels = list(range(node_count))
+    for _ in range(rounds):
+        changed = 0
+        for node in range(node_count):
+            adjacent = neighbours[node]
+            if not adjacent:
+                continue
+            counts: Dict[int, int] = {}
+            for other in adjacent:
+                label = labels[other]
+                counts[label] = counts.get(label, 0) + 1
+            best = max(counts.values())
+            if counts.get(labels[node]) == best:
+                continue
+            labels[node] = min(label for label, count in counts.items() if count == best)
+            changed += 1
+        if changed <= node_count // 1000: # Settled, up to a few nodes flipping between equal neighbours
+            break
+    return labels
+
+def _common_directory(nodes: List[int], parts: List[List[str]]) -> str:
+    prefix = parts[nodes[0]][:-1]
+    for node in nodes[1:]:
+        node_dirs = parts[node][:-1]
+        length = 0
+        while length < len(prefix) and length < len(node_dirs) and prefix[length] == node_dirs[length]:
+            length += 1
+        prefix = prefix[:length]
+        if not prefix:
+            break
+    return "/".join(prefix) or "."
+
+def partition_graph(graph: CompactGraph, max_nodes: int = DEFAULT_MAX_NODES, max_edges: int = DEFAULT_MAX_EDGES,
+                    strategy: str = "directory") -> Partitioning:
+    """
+    Assigns the nodes of a graph to partitions that fit a node and edge budget.
+
+    Args:
+        graph: The dependency graph; node names are relative paths.
+        max_nodes: Maximum number of nodes per partition.
+        max_edges: Maximum number of edges leaving the nodes of a partition.
+        strategy: One of PARTITION_STRATEGIES.
+
+    Returns:
+        The Partitioning; partitions follow path order within each community (or the whole graph).
+
+    Raises:
+        ValueError: If the strategy is unknown or a budget is below 1.
+    """
+    if strategy not in PARTITION_STRATEGIES:
+        raise ValueError(f"Unknown partition strategy '{strategy}', expected one of {PARTITION_STRATEGIES}")
+    if max_nodes < 1 or max_edges < 1:
+        raise ValueError("Partition budgets must be at least 1")
+
+    names = graph.paths.names
+    parts = [_path_parts(name) for name in names]
+    weights = graph.out_degrees()
+    by_path = sorted(range(len(names)), key=lambda node: parts[node])
+
+    if strategy == "directory":
+        groups = _directory_groups(by_path, parts, weights, 0, max_nodes, max_edges)
+    else:
+        labels = _label_propagation(graph, LABEL_PROPAGATION_ROUNDS)
+        communities: Dict[int, List[int]] = {} # In the path order of their first node
+        for node in by_path:
+            communities.setdefault(labels[node], []).append(node)
+        groups = []
+        for community in communities.values():
+            groups.extend(_directory_groups(community, parts, weights, 0, max_nodes, max_edges))
+        logging.info(f"Label propagation found {len(communities)} communities")
+
+    partitions = [Partition(_common_directory(nodes, parts), nodes)
+                  for nodes in _pack(groups, weights, max_nodes, max_edges)]
+    # A directory split into several partitions labels each of them, e.g. 'src/app [2/3]'
+    label_counts = Counter(partition.label for partition in partitions)
+    label_seen: Counter = Counter()
+    for partition in partitions:
+        if label_counts[partition.label] > 1:
+            label_seen[partition.label] += 1
+            partition.label = f"{partition.label} [{label_seen[partition.label]}/{label_counts[partition.label]}]"
+    assignment = [0] * len(names)
+    for index, partition in enumerate(partitions):
+        for node in partition.nodes:
+            assignment[node] = index
+    logging.info(f"Partitioned {len(names)} nodes into {len(partitions)} sub-diagrams ({strategy})")
+    return Partitioning(partitions, assignment)
+
+# --- Output ---
+
+def partition_file_names(index_path: Path, count: int) -> List[str]:
+    """File names of the sub-diagrams, next to the index: <stem>-part-001<suffix>, ..."""
+    width = max(3, len(str(count)))
+    return [f"{index_path.stem}-part-{number:0{width}d}{index_path.suffix}" for number in range(1, count + 1)]
+
+def write_partitioned_diagrams(dep_map: DependencyMap, partitioning: Partitioning, index_path: Path,
+                               output_format: str = "mermaid", direction: str = "LR") -> List[Path]:
+    """
+    Writes one diagram per partition and the index diagram linking them.
+
+    Sub-diagram files go next to index_path (see partition_file_names()); the
+    index links to them by relative name, so the directory can be moved as
+    a whole.
+
+    Args:
+        dep_map: The DependencyMap that was partitioned.
+        partitioning: The result of partition_graph() for dep_map.graph.
+        index_path: Path of the index diagram.
+        output_format: 'mermaid' or 'plantuml'.
+        direction: Graph direction of Mermaid diagrams.
+
+    Returns:
+        The paths written, index first.
+    """
+    # Imported here so each generator module only loads when its format is used
+    if output_format == "mermaid":
+        from .mermaid_generator import write_mermaid_diagram, write_mermaid_index
+        write_diagram = lambda sub_map, sink: write_mermaid_diagram(sub_map, sink, direction=direction)
+        write_index = lambda parts, edges, sink: write_mermaid_index(parts, edges, sink, direction=direction)
+    elif output_format == "plantuml":
+        from .plantuml_generator import write_plantuml_diagram, write_plantuml_index
+        write_diagram, write_index = write_plantuml_diagram, write_plantuml_index
+    else:
+        raise ValueError(f"Unsupported diagram format '{output_format}'")
+
+    graph = dep_map.graph
+    names = graph.paths.names
+    assignment = partitioning.assignment
+    partitions = partitioning.partitions
+
+    # One pass over the edges: inner edges per partition, counts between partitions
+    inner_edges: List[List[Tuple[int, int, int]]] = [[] for _ in partitions]
+    cross_edges: Counter = Counter()
+    for u, v, weight in graph.iter_weighted_edges():
+        if assignment[u] == assignment[v]:
+            inner_edges[assignment[u]].append((u, v, weight))
+        else:
+            cross_edges[assignment[u], assignment[v]] += weight
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    file_names = partition_file_names(index_path, len(partitions))
+    written = [index_path]
+    local_ids = [0] * len(names) # Node ID within its partition's graph; partitions are disjoint
+    for partition, edges, file_name in zip(partitions, inner_edges, file_names):
+        sub_map = DependencyMap(repository_root=dep_map.repository_root, granularity=dep_map.granularity)
+        for node in partition.nodes:
+            local_ids[node] = sub_map.graph.add_node(names[node])
+        for u, v, weight in edges:
+            sub_map.graph.add_edge_ids(local_ids[u], local_ids[v], weight=weight)
+        path = index_path.with_name(file_name)
+        with path.open("w", encoding="utf-8") as sink:
+            write_diagram(sub_map, sink)
+        written.append(path)
+
+    unit = "files" if dep_map.granularity == "file" else "directories"
+    index_entries = [(f"{partition.label} ({len(partition.nodes)} {unit})", file_name)
+                     for partition, file_name in zip(partitions, file_names)]
+    with index_path.open("w", encoding="utf-8") as sink:
+        write_index(index_entries, cross_edges, sink)
+    return written
@@ -3,10 +3,13 @@
 Generates PlantUML syntax for dependency graphs.
 """
 
+import io
 import logging
-import networkx as nx
 from ..models import DependencyMap
+from ..graph import CompactGraph
+from .writer import LineWriter, DEFAULT_CHUNK_LINES
 from pathlib import Path
+from typing import Dict, Sequence, TextIO, Tuple
 
 def _sanitize_plantuml_alias(node_id: str) -> str:
     """
@@ -28,53 +31,83 @@ def generate_plantuml_diagram(dep_map: DependencyMap) -> str:
     Generates a PlantUML component diagram string from a DependencyMap.
 
     Args:
-        dep_map: The DependencyMap containing the networkx graph.
+        dep_map: The DependencyMap containing the dependency graph.
 
     Returns:
         A string containing the PlantUML diagram syntax.
     """
-    if not isinstance(dep_map, DependencyMap) or not isinstance(dep_map.graph, nx.DiGraph):
+    buffer = io.StringIO()
+    write_plantuml_diagram(dep_map, buffer)
+    return buffer.getvalue()
+
+def write_plantuml_diagram(dep_map: DependencyMap, sink: TextIO, chunk_lines: int = DEFAULT_CHUNK_LINES) -> None:
+    """
+    Writes the PlantUML component diagram of a DependencyMap to a text sink, in chunks.
+
+    The text is the same as generate_plantuml_diagram() returns; nothing is
+    written for an invalid map. Rolled-up maps (granularity other than
+    'file') label each relationship with its import count.
+
+    Args:
+        dep_map: The DependencyMap containing the dependency graph.
+        sink: Where to write, e.g. a file opened for writing.
+        chunk_lines: Number of lines passed to the sink at a time.
+    """
+    if not isinstance(dep_map, DependencyMap) or not isinstance(dep_map.graph, CompactGraph):
         logging.error("Invalid DependencyMap or graph provided to PlantUML generator.")
-        return ""
+        return
 
+    writer = LineWriter(sink, chunk_lines)
     graph = dep_map.graph
     if not graph:
         logging.warning("Dependency graph is empty. Generating empty PlantUML diagram.")
-        return "@startuml\n' Empty Graph\n@enduml"
-
-    plantuml_lines = ["@startuml", "' Dependency Diagram generated by CodeValue Architect Assistant"]
-    plantuml_lines.append("skinparam componentStyle uml2") # Use UML2 styling for components
-
-    # Define components (nodes) first
+        writer.write("@startuml")
+        writer.write("' Empty Graph")
+        writer.write("@enduml")
+        writer.flush()
+        return
+
+    writer.write("@startuml")
+    writer.write("' Dependency Diagram generated by CodeValue Architect Assistant")
+    writer.write("skinparam componentStyle uml2") # Use UML2 styling for components
+
+    # Define components (nodes) first; aliases are computed once per node ID
+    names = graph.paths.names
+    aliases = [_sanitize_plantuml_alias(name) for name in names]
     nodes_defined = set()
-    for node in graph.nodes():
-        node_str = str(node)
-        alias = _sanitize_plantuml_alias(node_str)
+    for node_str, alias in zip(names, aliases):
         if alias not in nodes_defined:
             # Use filepath as the component name, alias for referencing
-            plantuml_lines.append(f'component "{node_str}" as {alias}')
+            writer.write(f'component "{node_str}" as {alias}')
             nodes_defined.add(alias)
 
     # Define relationships (edges)
     edges_added = set()
-    for u, v, data in graph.edges(data=True):
-        u_str = str(u)
-        v_str = str(v)
-        u_alias = _sanitize_plantuml_alias(u_str)
-        v_alias = _sanitize_plantuml_alias(v_str)
+    weighted = dep_map.granularity != "file"
+    for u, v, weight in graph.iter_weighted_edges():
+        u_str = names[u]
+        v_str = names[v]
+        u_alias = aliases[u]
+        v_alias = aliases[v]
 
         # Ensure nodes were defined (should be, but safety check)
         if u_alias not in nodes_defined:
-             plantuml_lines.append(f'component "{u_str}" as {u_alias}')
+             writer.write(f'component "{u_str}" as {u_alias}')
              nodes_defined.add(u_alias)
         if v_alias not in nodes_defined:
-             plantuml_lines.append(f'component "{v_str}" as {v_alias}')
+             writer.write(f'component "{v_str}" as {v_alias}')
              nodes_defined.add(v_alias)
 
         # Add relationship
-        edge_tuple = tuple(sorted((u_alias, v_alias))) # Basic check against duplicate relationships
+        if weighted:
+            # Directories often depend on each other both ways; keep both directions
+            edge_tuple = (u_alias, v_alias)
+            edge_str = f"{u_alias} --> {v_alias} : {weight}"
+        else:
+            edge_tuple = tuple(sorted((u_alias, v_alias))) # Basic check against duplicate relationships
+            edge_str = f"{u_alias} --> {v_alias}"
         if edge_tuple not in edges_added:
-            plantuml_lines.append(f"{u_alias} --> {v_alias}")
+            writer.write(edge_str)
             edges_added.add(edge_tuple)
 
 
@@ -87,16 +120,42 @@ def generate_plantuml_diagram(dep_map: DependencyMap) -> str:
     #     # Create a unique alias for the external module if not seen before
     #     ext_alias = _sanitize_plantuml_alias(target_label) + "_ext"
     #     if ext_alias not in nodes_defined and ext_alias not in external_nodes:
-    #         plantuml_lines.append(f'component "{target_label}" as {ext_alias} <<external>>') # Style external
+    #         writer.write(f'component "{target_label}" as {ext_alias} <<external>>') # Style external
     #         external_nodes.add(ext_alias)
     #
     #     # Add relationship if source exists
     #     if source_alias in nodes_defined and ext_alias in external_nodes:
-    #          plantuml_lines.append(f"{source_alias} ..> {ext_alias}") # Dashed line
+    #          writer.write(f"{source_alias} ..> {ext_alias}") # Dashed line
 
 
     if not edges_added and len(nodes_defined) <= 1 : # Check if only isolated nodes or empty
-         plantuml_lines.append("' No dependencies found to visualize")
+         writer.write("' No dependencies found to visualize")
+
+    writer.write("@enduml")
+    writer.flush()
+
+def write_plantuml_index(
+    entries: Sequence[Tuple[str, str]],
+    edges: Dict[Tuple[int, int], int],
+    sink: TextIO,
+    chunk_lines: int = DEFAULT_CHUNK_LINES
+) -> None:
+    """
+    Writes the index diagram of a partitioned graph (see diagrams.partition).
 
-    plantuml_lines.append("@enduml")
-    return "\n".join(plantuml_lines)
\ No newline at end of file
+    Args:
+        entries: (label, link) per sub-diagram; its component links to it.
+        edges: Number of dependencies between sub-diagrams, keyed by their (source, target) index.
+        sink: Where to write.
+        chunk_lines: Number of lines passed to the sink at a time.
+    """
+    writer = LineWriter(sink, chunk_lines)
+    writer.write("@startuml")
+    writer.write("' Index of sub-diagrams generated by CodeValue Architect Assistant")
+    writer.write("skinparam componentStyle uml2")
+    for index, (label, link) in enumerate(entries):
+        writer.write(f'component "{label}" as part{index} [[{link}]]')
+    for (source, target), count in sorted(edges.items()):
+        writer.write(f"part{source} --> part{target} : {count}")
+    writer.write("@enduml")
+    writer.flush()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Chunked line output shared by the diagram generators.
+
+Generators emit their diagram line by line into a LineWriter, which joins
+lines with newlines and passes them to a text sink (an open file, stdout or
+io.StringIO) a chunk at a time, so a large diagram is never held in memory
+as one list of lines or one string.
+"""
+
+from typing import List, TextIO
+
+DEFAULT_CHUNK_LINES = 4096
+
+class LineWriter:
+    """Writes lines separated by '\\n' (no trailing newline) to a sink, in chunks."""
+
+    def __init__(self, sink: TextIO, chunk_lines: int = DEFAULT_CHUNK_LINES):
+        self._sink = sink
+        self._chunk_lines = chunk_lines
+        self._buffer: List[str] = []
+        self._started = False
+        self.lines = 0 # Lines written so far, including buffered ones
+
+    def write(self, line: str) -> None:
+        self._buffer.append(line)
+        self.lines += 1
+        if len(self._buffer) >= self._chunk_lines:
+            self.flush()
+
+    def flush(self) -> None:
+        """Passes the buffered lines to the sink (the sink itself is not flushed)."""
+        if not self._buffer:
+            return
+        text = "\n".join(self._buffer)
+        self._sink.write("\n" + text if self._started else text)
+        self._started = True
+        self._buffer.clear()
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+Compact directed graph used for dependency maps.
+
+Node names (relative paths or module names) are interned in a PathTable and
+referred to by integer IDs. Edges are appended to flat typed columns
+(stdlib array) and compacted on first read into CSR form: for each source
+node, a contiguous slice of target IDs, with parallel columns for the edge
+type and line number. This takes a few bytes per edge instead of the
+dictionaries networkx keeps per node and per edge.
+
+Like networkx.DiGraph, the graph keeps one edge per (source, target) pair:
+adding an existing edge updates its attributes but not its position. Each
+edge also has a weight, the sum of the weights it was added with (by
+default, how many times it was added: the number of imports it stands for).
+Nodes and each node's successors keep insertion order.
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+class PathTable:
+    """Interns strings (paths, module names) as consecutive integer IDs."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def intern(self, name: str) -> int:
+        """Returns the ID of name, assigning the next free one if it is new."""
+        node_id = self._ids.get(name)
+        if node_id is None:
+            node_id = self._ids[name] = len(self._names)
+            self._names.append(name)
+        return node_id
+
+    def canonical(self, name: str) -> str:
+        """Returns the shared instance of name, interning it if it is new."""
+        return self._names[self.intern(name)]
+
+    def get(self, name: str) -> Optional[int]:
+        """Returns the ID of name, or None if it was never interned."""
+        return self._ids.get(name)
+
+    def name(self, node_id: int) -> str:
+        return self._names[node_id]
+
+    @property
+    def names(self) -> List[str]:
+        """All interned strings, indexed by ID (do not modify)."""
+        return self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+_NO_LINE = 0 # Line numbers are 1-based; 0 stores "unknown"
+
+class CompactGraph:
+    """
+    A directed graph over interned node names with CSR edge storage.
+
+    The integer API (node_id, iter_edges, successors, degrees) is what the
+    analyses and diagram generators use. A small networkx-like API
+    (add_edge, nodes, edges, number_of_edges, ...) is kept for callers that
+    work with names, and to_networkx() converts on demand.
+    """
+
+    def __init__(self):
+        self.paths = PathTable()
+        self._edge_types = PathTable() # Edge type names ('import_from', ...) share a tiny table
+        # Edges added since the last compaction
+        self._pending_src = array("i")
+        self._pending_dst = array("i")
+        self._pending_type = array("B")
+        self._pending_line = array("i")
+        self._pending_weight = array("I")
+        # CSR: the successors of node n are _targets[_offsets[n]:_offsets[n + 1]]
+        self._offsets = array("q", [0])
+        self._targets = array("i")
+        self._types = array("B")
+        self._lines = array("i")
+        self._weights = array("I")
+
+    # --- Building ---
+
+    def add_node(self, name: str) -> int:
+        """Adds a node (if new) and returns its ID."""
+        return self.paths.intern(name)
+
+    def add_nodes_from(self, names: Iterable[str]) -> None:
+        for name in names:
+            self.paths.intern(name)
+
+    def add_edge(self, source: str, target: str, type: Optional[str] = None, line: Optional[int] = None,
+                 weight: int = 1) -> None:
+        """Adds an edge between two named nodes, adding the nodes if needed."""
+        self.add_edge_ids(self.paths.intern(source), self.paths.intern(target), type, line, weight)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple], nodes: Iterable[str] = ()) -> "CompactGraph":
+        """Builds a graph from (source, target[, type, line, weight]) tuples and extra isolated nodes."""
+        graph = cls()
+        graph.add_nodes_from(nodes)
+        for edge in edges:
+            graph.add_edge(*edge)
+        return graph
+
+    def add_edge_ids(self, source_id: int, target_id: int, type: Optional[str] = None, line: Optional[int] = None,
+                     weight: int = 1) -> None:
+        """Adds an edge between two node IDs returned by add_node(); weights of repeated edges add up."""
+        self._pending_src.append(source_id)
+        self._pending_dst.append(target_id)
+        self._pending_type.append(self._edge_types.intern(type or ""))
+        self._pending_line.append(line if line else _NO_LINE)
+        self._pending_weight.append(weight)
+
+    def _compact(self) -> None:
+        """Merges pending edges into the CSR arrays (counting sort by source, O(N + E))."""
+        node_count = len(self.paths)
+        if not self._pending_src:
+            # Nodes added since the last compaction have no edges yet
+            missing = node_count + 1 - len(self._offsets)
+            if missing > 0:
+                self._offsets.extend([self._offsets[-1]] * missing)
+            return
+        # Current edges first, then pending ones, so positions follow insertion order
+        src = array("i")
+        for node in range(len(self._offsets) - 1):
+            src.extend([node] * (self._offsets[node + 1] - self._offsets[node]))
+        src.extend(self._pending_src)
+        dst = self._targets + self._pending_dst
+        types = self._types + self._pending_type
+        lines = self._lines + self._pending_line
+        weights = self._weights + self._pending_weight
+
+        counts = [0] * (node_count + 1)
+        for s in src:
+            counts[s + 1] += 1
+        for node in range(node_count):
+            counts[node + 1] += counts[node]
+        slots = counts[:-1] # Next free slot per source
+        order = array("i", [0]) * len(src)
+        for index, s in enumerate(src):
+            order[slots[s]] = index
+            slots[s] += 1
+
+        # Drop repeated (source, target) pairs: first position, last attributes, summed weight
+        offsets = array("q", [0])
+        targets, new_types, new_lines, new_weights = array("i"), array("B"), array("i"), array("I")
+        for node in range(node_count):
+            row_start = len(targets)
+            seen: Dict[int, int] = {}
+            for index in order[counts[node]:counts[node + 1]]:
+                target = dst[index]
+                slot = seen.get(target)
+                if slot is None:
+                    seen[target] = len(targets) - row_start
+                    targets.append(target)
+                    new_types.append(types[index])
+                    new_lines.append(lines[index])
+                    new_weights.append(weights[index])
+                else:
+                    new_types[row_start + slot] = types[index]
+                    new_lines[row_start + slot] = lines[index]
+                    new_weights[row_start + slot] += weights[index]
+            offsets.append(len(targets))
+
+        self._offsets, self._targets, self._types, self._lines = offsets, targets, new_types, new_lines
+        self._weights = new_weights
+        self._pending_src, self._pending_dst = array("i"), array("i")
+        self._pending_type, self._pending_line, self._pending_weight = array("B"), array("i"), array("I")
+
+    # --- Integer API ---
+
+    def node_id(self, name: str) -> Optional[int]:
+        return self.paths.get(name)
+
+    def node_name(self, node_id: int) -> str:
+        return self.paths.name(node_id)
+
+    def iter_edges(self) -> Iterator[Tuple[int, int]]:
+        """Yields (source ID, target ID) for every edge, grouped by source."""
+        self._compact()
+        offsets, targets = self._offsets, self._targets
+        for node in range(len(offsets) - 1):
+            for index in range(offsets[node], offsets[node + 1]):
+                yield node, targets[index]
+
+    def iter_edge_data(self) -> Iterator[Tuple[int, int, str, Optional[int]]]:
+        """Yields (source ID, target ID, edge type, line number) for every edge."""
+        self._compact()
+        offsets, targets, types, lines = self._offsets, self._targets, self._types, self._lines
+        type_names = self._edge_types.names
+        for node in range(len(offsets) - 1):
+            for index in range(offsets[node], offsets[node + 1]):
+                yield node, targets[index], type_names[types[index]], lines[index] or None
+
+    def iter_weighted_edges(self) -> Iterator[Tuple[int, int, int]]:
+        """Yields (source ID, target ID, weight) for every edge."""
+        self._compact()
+        offsets, targets, weights = self._offsets, self._targets, self._weights
+        for node in range(len(offsets) - 1):
+            for index in range(offsets[node], offsets[node + 1]):
+                yield node, targets[index], weights[index]
+
+    def successors(self, node_id: int) -> array:
+        """The target IDs of a node's outgoing edges."""
+        self._compact()
+        return self._targets[self._offsets[node_id]:self._offsets[node_id + 1]]
+
+    def csr(self) -> Tuple[array, array]:
+        """
+        The CSR arrays (offsets, targets), for whole-graph algorithms: the
+        successors of node n are targets[offsets[n]:offsets[n + 1]]. Do not modify.
+        """
+        self._compact()
+        return self._offsets, self._targets
+
+    def reverse_csr(self) -> Tuple[array, array]:
+        """
+        CSR arrays of the reversed graph (offsets, sources): the nodes with an
+        edge to node n are sources[offsets[n]:offsets[n + 1]]. Built on each
+        call, in O(N + E).
+        """
+        offsets, targets = self.csr()
+        node_count = len(offsets) - 1
+        counts = [0] * (node_count + 1)
+        for target in targets:
+            counts[target + 1] += 1
+        for node in range(node_count):
+            counts[node + 1] += counts[node]
+        slots = counts[:-1] # Next free slot per target
+        sources = array("i", [0]) * len(targets)
+        for node in range(node_count):
+            for index in range(offsets[node], offsets[node + 1]):
+                target = targets[index]
+                sources[slots[target]] = node
+                slots[target] += 1
+        return array("q", counts), sources
+
+    def out_degrees(self) -> List[int]:
+        self._compact()
+        offsets = self._offsets
+        return [offsets[node + 1] - offsets[node] for node in range(len(offsets) - 1)]
+
+    def in_degrees(self) -> List[int]:
+        self._compact()
+        degrees = [0] * len(self.paths)
+        for target in self._targets:
+            degrees[target] += 1
+        return degrees
+
+    # --- networkx-like API ---
+
+    def has_node(self, name: str) -> bool:
+        return name in self.paths
+
+    def has_edge(self, source: str, target: str) -> bool:
+        source_id, target_id = self.paths.get(source), self.paths.get(target)
+        return source_id is not None and target_id is not None and target_id in self.successors(source_id)
+
+    def nodes(self) -> List[str]:
+        return list(self.paths.names)
+
+    def edges(self, data: bool = False) -> Iterator[tuple]:
+        """Yields (source, target) names, or (source, target, {'type', 'line', 'weight'}) with data=True."""
+        names = self.paths.names
+        if data:
+            weights = iter(self.iter_weighted_edges())
+            for u, v, type_, line in self.iter_edge_data():
+                yield names[u], names[v], {"type": type_ or None, "line": line, "weight": next(weights)[2]}
+        else:
+            for u, v in self.iter_edges():
+                yield names[u], names[v]
+
+    def number_of_nodes(self) -> int:
+        return len(self.paths)
+
+    def number_of_edges(self) -> int:
+        self._compact()
+        return len(self._targets)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.nodes())
+
+    def to_networkx(self):
+        """Returns the graph as a networkx.DiGraph (edge attributes 'type', 'line' and 'weight')."""
+        import networkx as nx # Only needed by callers that ask for it
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.paths.names)
+        graph.add_edges_from((u, v, attrs) for u, v, attrs in self.edges(data=True))
+        return graph
@@ -3,28 +3,65 @@
 Core data structures (models) for representing project information.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-import networkx as nx
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 
-@dataclass
-class ProjectFile:
-    """Represents a single file within the analyzed project."""
-    path: Path
-    relative_path: Path # Path relative to the repository root
-    language: Optional[str] = None
-    size_bytes: Optional[int] = None
-    # Add more attributes as needed, e.g., last modified, hash
+from .graph import CompactGraph
+from .utils.records import Record
 
-@dataclass
-class Dependency:
+class ProjectFile(Record):
+    """
+    Represents a single file within the analyzed project.
+
+    Build it with root= (shared by all files of a scan) rather than path=:
+    the absolute path is then derived from root and relative_path on access
+    instead of being stored per file.
+    """
+    __slots__ = ("relative_path", "language", "size_bytes", "mtime_ns", "root", "_path")
+    _fields = ("path", "relative_path", "language", "size_bytes", "mtime_ns")
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        relative_path: Optional[Path] = None, # Path relative to the repository root
+        language: Optional[str] = None,
+        size_bytes: Optional[int] = None,
+        mtime_ns: Optional[int] = None, # Last modification time in nanoseconds, as reported by the scanner
+        root: Optional[Path] = None
+    ):
+        if relative_path is None or (path is None and root is None):
+            raise TypeError("ProjectFile needs relative_path and either path or root")
+        self.relative_path = relative_path
+        self.language = language
+        self.size_bytes = size_bytes
+        self.mtime_ns = mtime_ns
+        self.root = root
+        self._path = path # An explicit path wins over root
+
+    @property
+    def path(self) -> Path:
+        """Absolute path of the file."""
+        return self._path if self._path is not None else self.root / self.relative_path
+
+class Dependency(Record):
     """Represents a dependency link between two entities."""
-    source_file: Path # Relative path of the file containing the dependency
-    target_module: str # The imported/required module string
-    target_file: Optional[Path] = None # Resolved relative path of the target file, if found within the project
-    line_number: Optional[int] = None
-    type: str = "static_import" # e.g., static_import, dynamic_import, require
+    __slots__ = ("source_file", "target_module", "target_file", "line_number", "type")
+
+    def __init__(
+        self,
+        source_file: Path, # Relative path of the file containing the dependency
+        target_module: str, # The imported/required module string
+        target_file: Optional[Path] = None, # Resolved relative path of the target file, if found within the project
+        line_number: Optional[int] = None,
+        type: str = "static_import" # e.g., static_import, dynamic_import, require
+    ):
+        self.source_file = source_file
+        self.target_module = target_module
+        self.target_file = target_file
+        self.line_number = line_number
+        self.type = type
 
 @dataclass
 class AnalysisResult:
@@ -34,29 +71,118 @@ class AnalysisResult:
     languages_detected: Dict[str, int] = field(default_factory=dict) # Language name -> count
     # Add more fields like detected frameworks, total lines of code, etc.
 
+@dataclass
+class UnresolvedSummary:
+    """
+    Running aggregate of unresolved dependencies: a total, a count per target
+    module and the few examples the summary output shows. Memory grows with
+    the number of distinct modules, not with the number of imports.
+    """
+    max_examples: int = 10
+    total: int = 0
+    by_module: Counter = field(default_factory=Counter)
+    # (source file, arrival order, target module); pruned to the max_examples smallest
+    _examples: List[Tuple[Path, int, str]] = field(default_factory=list, repr=False)
+
+    def add(self, dep: Dependency) -> None:
+        self.by_module[dep.target_module] += 1
+        self._examples.append((dep.source_file, self.total, dep.target_module))
+        self.total += 1
+        if len(self._examples) >= 2 * self.max_examples + 64:
+            self._prune()
+
+    def _prune(self) -> None:
+        self._examples.sort()
+        del self._examples[self.max_examples:]
+
+    def examples(self) -> List[Tuple[Path, str]]:
+        """The (source file, target module) pairs that sort first by source file, in import order on ties."""
+        self._prune()
+        return [(source_file, target_module) for source_file, _, target_module in self._examples]
+
+    def __len__(self) -> int:
+        return self.total
+
+GRANULARITIES = ("file", "dir")
+
 @dataclass
 class DependencyMap:
-    """Holds the dependency graph and related information."""
+    """
+    Holds the dependency graph and related information.
+
+    With granularity='dir', files are rolled up into their directory,
+    truncated to rollup_depth levels ('.' for files at the root), as
+    dependencies are added: the graph then has one node per directory and
+    edge weights count the imports between them, without the file graph
+    ever being built. Imports within a directory are only counted, in
+    internal_dependencies.
+    """
     repository_root: Path
-    graph: nx.DiGraph = field(default_factory=nx.DiGraph) # Nodes are relative file paths (str), edges have Dependency attributes
+    graph: CompactGraph = field(default_factory=CompactGraph) # Nodes are relative file paths (str), edges have 'type' and 'line'
+    unresolved: UnresolvedSummary = field(default_factory=UnresolvedSummary)
+    # Full unresolved Dependency objects, only collected when keep_unresolved is set
     unresolved_dependencies: List[Dependency] = field(default_factory=list)
+    keep_unresolved: bool = False
+    granularity: str = "file" # One of GRANULARITIES
+    rollup_depth: int = 2
+    internal_dependencies: int = 0
+    _rollup_names: Dict[str, str] = field(default_factory=dict, repr=False) # File path -> its directory node
+    # (source, target) node IDs -> [weight, type, line] of directory edges not yet added to the graph
+    _rollup_edges: Dict[Tuple[int, int], list] = field(default_factory=dict, repr=False)
+
+    def node_name(self, file_path: Path) -> str:
+        """The graph node that stands for a file: its path, or its directory with granularity='dir'."""
+        path_str = str(file_path)
+        if self.granularity == "file":
+            return path_str
+        name = self._rollup_names.get(path_str)
+        if name is None:
+            directories = path_str.replace("\\", "/").split("/")[:-1]
+            name = self._rollup_names[path_str] = "/".join(directories[:self.rollup_depth]) or "."
+        return name
+
+    def add_dependencies(self, deps: Iterable[Dependency]) -> None:
+        """Adds dependencies as they are produced (e.g. by analysis.dependency_resolver.iter_dependencies)."""
+        for dep in deps:
+            self._add(dep)
+        self._flush_rollup_edges()
 
     def add_dependency(self, dep: Dependency):
         """Adds a dependency to the graph."""
-        source_str = str(dep.source_file)
-        target_str = str(dep.target_file) if dep.target_file else dep.target_module
-
-        # Ensure nodes exist
-        if not self.graph.has_node(source_str):
-            self.graph.add_node(source_str) # Add attributes later if needed
+        self._add(dep)
+        self._flush_rollup_edges()
 
-        # Add target node only if it's resolved within the project
-        if dep.target_file and not self.graph.has_node(target_str):
-             self.graph.add_node(target_str)
+    def _add(self, dep: Dependency) -> None:
+        # Ensure the source node exists
+        source_id = self.graph.add_node(self.node_name(dep.source_file))
 
-        # Add edge if target is resolved, otherwise track as unresolved
+        # Add edge (and target node) if target is resolved within the project, otherwise track as unresolved
         if dep.target_file:
             # Store dependency details on the edge
-            self.graph.add_edge(source_str, target_str, type=dep.type, line=dep.line_number)
+            target_id = self.graph.add_node(self.node_name(dep.target_file))
+            if self.granularity == "file":
+                self.graph.add_edge_ids(source_id, target_id, type=dep.type, line=dep.line_number)
+            elif source_id == target_id:
+                self.internal_dependencies += 1
+            else:
+                # Summed here, so pending graph edges grow with the directory graph, not with the imports
+                edge = self._rollup_edges.get((source_id, target_id))
+                if edge is None:
+                    self._rollup_edges[(source_id, target_id)] = [1, dep.type, dep.line_number]
+                else:
+                    edge[0] += 1
+                    edge[1], edge[2] = dep.type, dep.line_number
         else:
-            self.unresolved_dependencies.append(dep)
\ No newline at end of file
+            self.unresolved.add(dep)
+            if self.keep_unresolved:
+                self.unresolved_dependencies.append(dep)
+
+    def _flush_rollup_edges(self) -> None:
+        """Adds the directory edges summed so far to the graph, each once with its import count."""
+        for (source_id, target_id), (weight, type_, line) in self._rollup_edges.items():
+            self.graph.add_edge_ids(source_id, target_id, type=type_, line=line, weight=weight)
+        self._rollup_edges.clear()
+
+    def to_networkx(self):
+        """Returns the dependency graph as a networkx.DiGraph."""
+        return self.graph.to_networkx()
\ No newline at end of file
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Reads source files and decodes them with their detected encoding.
+
+A FileContent holds the raw bytes of one file plus its encoding, detected
+once from the BOM, a PEP 263 coding cookie or UTF-8 validation. The decoded
+text is produced on first use and cached, so a consumer that needs both the
+bytes and the text (the parse cache hashes the bytes, the parsers decode
+them) reads the file only once.
+"""
+
+import re
+import codecs
+import logging
+from pathlib import Path
+from typing import Optional, Tuple
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"), # Must be tested before UTF-16 LE, which is its prefix
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# PEP 263: a comment matching this on line 1 or 2 declares the encoding
+_CODING_COOKIE = re.compile(rb"^[ \t\f]*#.*?coding[:=][ \t]*([-\w.]+)")
+
+def _coding_cookie(data: bytes) -> Optional[str]:
+    """Returns the normalized codec name declared by a PEP 263 cookie, if any."""
+    start = 0
+    for _ in range(2):
+        end = data.find(b"\n", start)
+        line = data[start:end if end != -1 else len(data)]
+        match = _CODING_COOKIE.match(line)
+        if match:
+            try:
+                return codecs.lookup(match.group(1).decode("ascii")).name
+            except (LookupError, UnicodeDecodeError):
+                return None
+        # Only a blank or comment line may precede the cookie
+        if end == -1 or not (line.strip() == b"" or line.lstrip().startswith(b"#")):
+            return None
+        start = end + 1
+    return None
+
+def _detect(data: bytes) -> Tuple[str, Optional[str]]:
+    """Returns (encoding, text); text is set when UTF-8 validation already decoded the data."""
+    head = data[:4]
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding, None
+    cookie = _coding_cookie(data[:1024])
+    if cookie is not None:
+        return cookie, None
+    try:
+        return "utf-8", codecs.decode(data, "utf-8")
+    except UnicodeDecodeError:
+        return "latin-1", None
+
+def detect_encoding(data: bytes) -> str:
+    """
+    Detects the encoding of source bytes.
+
+    Order: byte order mark, PEP 263 coding cookie, UTF-8 validation, and
+    finally latin-1, which decodes any byte sequence.
+
+    Args:
+        data: The raw file content.
+
+    Returns:
+        A codec name accepted by bytes.decode().
+    """
+    return _detect(data)[0]
+
+class FileContent:
+    """The raw bytes of one file, with its detected encoding and lazily decoded text."""
+
+    def __init__(self, path: Path, data: bytes, encoding: Optional[str] = None):
+        self.path = path
+        self.data = data
+        self._encoding = encoding
+        self._text: Optional[str] = None
+
+    @property
+    def encoding(self) -> str:
+        """The detected encoding (computed on first access)."""
+        if self._encoding is None:
+            # UTF-8 validation decodes the whole buffer; keep the result as the text
+            self._encoding, self._text = _detect(self.data)
+        return self._encoding
+
+    @property
+    def text(self) -> str:
+        """The decoded content, falling back to latin-1 if the declared encoding is wrong."""
+        encoding = self.encoding
+        if self._text is None:
+            try:
+                self._text = codecs.decode(self.data, encoding)
+            except UnicodeDecodeError:
+                logging.debug(f"{self.path} is not valid {self.encoding}; decoding as latin-1")
+                self._encoding = "latin-1"
+                self._text = codecs.decode(self.data, "latin-1")
+        return self._text
+
+def read_file_content(file_path: Path) -> FileContent:
+    """
+    Reads a file into a FileContent.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(file_path, "rb") as f:
+        return FileContent(file_path, f.read())
@@ -5,8 +5,14 @@ Filesystem scanning utilities.
 
 import os
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Set
+from typing import Deque, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .ignore import IGNORE_FILE_NAMES, IgnoreChain, IgnoreMatcher, is_ignored, load_root_matchers
+from . import log
 
 # Default directories and files to ignore during scanning
 DEFAULT_IGNORE_DIRS: Set[str] = {
@@ -23,60 +29,279 @@ DEFAULT_IGNORE_DIRS: Set[str] = {
     ".mypy_cache",
     ".vscode",
     ".idea",
+    ".cva-cache",
 }
 DEFAULT_IGNORE_FILES: Set[str] = {
     ".gitignore",
     ".gitattributes",
+    ".archignore",
     # Add specific file names if needed
 }
-# Consider adding support for .gitignore parsing later
 
-def scan_repository(
+# A directory still to be listed: (absolute path, relative '/'-terminated prefix, ignore matchers in effect).
+# The matcher chain is None when ignore files are not honoured.
+_DirItem = Tuple[str, str, Optional[IgnoreChain]]
+
+@dataclass
+class FileEntry:
+    """
+    A file found while scanning, carrying the metadata fetched during the listing.
+
+    Consumers should use these fields instead of calling stat() on the path again.
+    """
+    path: Path
+    relative_path: Path # Path relative to the scan root
+    size_bytes: Optional[int] = None
+    mtime_ns: Optional[int] = None
+    is_symlink: bool = False
+    stat_from_index: bool = False # Size and mtime were recorded by git when the file was staged
+
+def _make_file_entry(entry: os.DirEntry, relative_dir: str) -> FileEntry:
+    """Builds a FileEntry from a DirEntry, using its cached stat data where possible."""
+    size_bytes = None
+    mtime_ns = None
+    try:
+        # DirEntry caches the result; on Windows this costs no extra syscall at all.
+        st = entry.stat()
+        size_bytes = st.st_size
+        mtime_ns = st.st_mtime_ns
+    except OSError as e:
+        logging.warning(f"Could not stat file {entry.path}: {e}")
+
+    try:
+        is_symlink = entry.is_symlink()
+    except OSError:
+        is_symlink = False
+
+    return FileEntry(
+        path=Path(entry.path),
+        relative_path=Path(relative_dir + entry.name),
+        size_bytes=size_bytes,
+        mtime_ns=mtime_ns,
+        is_symlink=is_symlink,
+    )
+
+def _list_directory(
+    item: _DirItem,
+    ignore_dirs: Set[str],
+    ignore_files: Set[str],
+    sort_entries: bool = False,
+) -> Tuple[List[FileEntry], List[_DirItem]]:
+    """
+    Lists a single directory with os.scandir.
+
+    If the directory contains .gitignore/.archignore files, they are compiled and
+    appended to the inherited matcher chain before any entry is considered, so
+    ignored subdirectories are pruned without ever being listed.
+
+    If sort_entries is True, entries are processed in name order so the result
+    does not depend on the filesystem's listing order.
+
+    Returns:
+        A tuple (files, subdirs) where files are FileEntry objects for the
+        non-ignored files and subdirs are the directories to descend into,
+        both in listing order.
+    """
+    dir_path, relative_dir, chain = item
+    files: List[FileEntry] = []
+    subdirs: List[_DirItem] = []
+    try:
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+    except OSError as e:
+        logging.warning(f"Could not list directory {dir_path}: {e}")
+        return files, subdirs
+
+    if sort_entries:
+        entries.sort(key=lambda e: e.name)
+
+    if chain is not None:
+        names = {entry.name for entry in entries}
+        for ignore_name in IGNORE_FILE_NAMES:
+            if ignore_name in names:
+                matcher = IgnoreMatcher.from_file(Path(dir_path) / ignore_name, base_dir=relative_dir)
+                if matcher:
+                    chain = chain + (matcher,)
+
+    for entry in entries:
+        name = entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+
+        if is_dir:
+            if name in ignore_dirs:
+                if log.DEBUG:
+                    logging.debug(f"Ignoring directory: {entry.path}")
+                continue
+            # Like os.walk(followlinks=False): symlinked directories are not descended into
+            if entry.is_symlink():
+                continue
+            if chain and is_ignored(chain, relative_dir + name, True):
+                if log.DEBUG:
+                    logging.debug(f"Pruning ignored directory: {entry.path}")
+                continue
+            subdirs.append((entry.path, relative_dir + name + "/", chain))
+        elif name in ignore_files:
+            if log.DEBUG:
+                logging.debug(f"Ignoring file: {entry.path}")
+        elif chain and is_ignored(chain, relative_dir + name, False):
+            if log.DEBUG:
+                logging.debug(f"Ignoring file matched by ignore rules: {entry.path}")
+        else:
+            file_entry = _make_file_entry(entry, relative_dir)
+            if log.DEBUG:
+                logging.debug(f"Found file: {file_entry.path}")
+            files.append(file_entry)
+
+    return files, subdirs
+
+def _scan_parallel(
+    root_item: _DirItem,
+    ignore_dirs: Set[str],
+    ignore_files: Set[str],
+    walk_threads: int,
+    ordered: bool,
+) -> Iterator[FileEntry]:
+    """
+    Walks the tree with a bounded thread pool, listing sibling directories concurrently.
+
+    Directory listings are submitted ahead of the consumer, but never more than
+    a few per thread, so memory stays bounded even if the consumer is slow.
+
+    In ordered mode the output is deterministic: entries are sorted by name
+    within each directory and directories are emitted depth-first in pre-order,
+    regardless of which listing finishes first. In unordered mode each
+    directory's files are yielded as soon as its listing completes.
+    """
+    max_pending = walk_threads * 4
+    executor = ThreadPoolExecutor(max_workers=walk_threads, thread_name_prefix="scan")
+
+    def submit(item: _DirItem) -> Future:
+        return executor.submit(_list_directory, item, ignore_dirs, ignore_files, ordered)
+
+    # Ordered mode: DFS pre-order stack whose items are submitted futures or not-yet-submitted directories.
+    stack: List[Union[Future, _DirItem]] = []
+    # Unordered mode: directories waiting for a slot, and listings in progress.
+    waiting: Deque[_DirItem] = deque()
+    pending: Set[Future] = set()
+
+    try:
+        if ordered:
+            stack.append(submit(root_item))
+            submitted = 1
+            while stack:
+                item = stack.pop()
+                if isinstance(item, Future):
+                    submitted -= 1
+                    files, subdirs = item.result()
+                else:
+                    files, subdirs = _list_directory(item, ignore_dirs, ignore_files, ordered)
+                yield from files
+                stack.extend(reversed(subdirs))
+                # Prefetch the directories the consumer will need next
+                i = len(stack) - 1
+                while i >= 0 and submitted < max_pending:
+                    if not isinstance(stack[i], Future):
+                        stack[i] = submit(stack[i])
+                        submitted += 1
+                    i -= 1
+        else:
+            waiting.append(root_item)
+            while waiting or pending:
+                while waiting and len(pending) < max_pending:
+                    pending.add(submit(waiting.popleft()))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    waiting.extend(subdirs)
+                    yield from files
+    finally:
+        # The consumer may stop early: drop queued listings instead of finishing the walk
+        for item in list(stack) + list(pending):
+            if isinstance(item, Future):
+                item.cancel()
+        executor.shutdown(wait=True)
+
+def scan_repository_entries(
     root_path: Path,
     ignore_dirs: Set[str] = DEFAULT_IGNORE_DIRS,
     ignore_files: Set[str] = DEFAULT_IGNORE_FILES,
-    # TODO: Add support for custom ignore patterns (e.g., from .gitignore)
-) -> Iterable[Path]:
+    walk_threads: int = 1,
+    ordered: bool = True,
+    use_ignore_files: bool = True,
+) -> Iterator[FileEntry]:
     """
-    Recursively scans a directory, yielding paths to files.
+    Recursively scans a directory with os.scandir, yielding FileEntry objects.
+
+    Each directory is listed exactly once and each file is stat'ed at most once;
+    the kind, size and mtime obtained during the listing travel with the entry.
+    With a single thread, output order matches os.walk(topdown=True): a
+    directory's files, then its subdirectories depth-first.
 
-    Skips directories and files specified in the ignore sets.
+    With walk_threads > 1, directories are listed by a bounded thread pool,
+    which helps on NFS/FUSE mounts where per-directory latency dominates.
+    Results are still streamed to the caller.
 
     Args:
         root_path: The root directory path to start scanning from.
         ignore_dirs: A set of directory names to ignore.
         ignore_files: A set of file names to ignore.
+        walk_threads: Number of threads listing directories (1 = serial walk).
+        ordered: Only used when walk_threads > 1. If True, the output order is
+            deterministic (name-sorted, depth-first pre-order); if False, files
+            are yielded as soon as their directory listing completes.
+        use_ignore_files: Honour .git/info/exclude and nested .gitignore /
+            .archignore files, pruning ignored directories before descending.
 
     Yields:
-        Path objects for each non-ignored file found.
+        FileEntry objects for each non-ignored file found.
     """
     logging.info(f"Scanning directory: {root_path}")
     if not root_path.is_dir():
         logging.error(f"Provided path is not a directory: {root_path}")
         return
 
-    for dirpath, dirnames, filenames in os.walk(str(root_path), topdown=True):
-        current_dir_path = Path(dirpath)
-        logging.debug(f"Scanning in: {current_dir_path}")
-
-        # Modify dirnames in-place to prevent os.walk from descending into ignored directories
-        dirs_to_remove = []
-        for i, dirname in enumerate(dirnames):
-            if dirname in ignore_dirs:
-                logging.debug(f"Ignoring directory: {current_dir_path / dirname}")
-                dirs_to_remove.append(dirname)
-        # Remove ignored directories by modifying the list os.walk iterates over
-        # Must iterate backwards or use a copy to avoid index issues when removing
-        for d in dirs_to_remove:
-             dirnames.remove(d) # This modifies the list used by os.walk for recursion
-
-        # Yield non-ignored files
-        for filename in filenames:
-            if filename not in ignore_files:
-                file_path = current_dir_path / filename
-                logging.debug(f"Found file: {file_path}")
-                yield file_path
-            else:
-                logging.debug(f"Ignoring file: {current_dir_path / filename}")
-
-    logging.info(f"Finished scanning directory: {root_path}")
\ No newline at end of file
+    root_chain = load_root_matchers(root_path) if use_ignore_files else None
+    root_item: _DirItem = (str(root_path), "", root_chain)
+
+    if walk_threads > 1:
+        yield from _scan_parallel(root_item, ignore_dirs, ignore_files, walk_threads, ordered)
+        logging.info(f"Finished scanning directory: {root_path}")
+        return
+
+    stack: List[_DirItem] = [root_item]
+    while stack:
+        item = stack.pop()
+        if log.DEBUG:
+            logging.debug(f"Scanning in: {item[0]}")
+        files, subdirs = _list_directory(item, ignore_dirs, ignore_files)
+        yield from files
+        # Push in reverse so the first subdirectory is visited first
+        stack.extend(reversed(subdirs))
+
+    logging.info(f"Finished scanning directory: {root_path}")
+
+def scan_repository(
+    root_path: Path,
+    ignore_dirs: Set[str] = DEFAULT_IGNORE_DIRS,
+    ignore_files: Set[str] = DEFAULT_IGNORE_FILES,
+) -> Iterable[Path]:
+    """
+    Recursively scans a directory, yielding paths to files.
+
+    Skips directories and files specified in the ignore sets, as well as paths
+    matched by .gitignore/.archignore rules. This is a thin
+    wrapper around scan_repository_entries() for callers that only need paths.
+
+    Args:
+        root_path: The root directory path to start scanning from.
+        ignore_dirs: A set of directory names to ignore.
+        ignore_files: A set of file names to ignore.
+
+    Yields:
+        Path objects for each non-ignored file found.
+    """
+    for entry in scan_repository_entries(root_path, ignore_dirs, ignore_files):
+        yield entry.path
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Enumerates tracked files directly from a git index (.git/index).
+
+Reading the index replaces a full working-tree walk for git checkouts: it is a
+single sequential file read, and untracked build artefacts are never visited.
+Size and mtime come from the index entries themselves, so no file is stat'ed.
+They are the stat data git recorded when the file was last staged, so entries
+are flagged (FileEntry.stat_from_index): a file edited since then has another
+size and mtime in the working tree.
+
+The whole file is validated when it is opened (trailing SHA-1 checksum, or
+a full pass over the entries if git was told to skip writing it), so that a
+corrupt index is rejected before callers commit to this source.
+
+Supports index format versions 2, 3 and 4 (path prefix compression). Only the
+built-in ignore lists apply to this source; tracked files are not re-checked
+against .gitignore/.archignore rules.
+"""
+
+import os
+import struct
+import hashlib
+import itertools
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from .filesystem import DEFAULT_IGNORE_DIRS, DEFAULT_IGNORE_FILES, FileEntry
+
+INDEX_SIGNATURE = b"DIRC"
+SUPPORTED_VERSIONS = (2, 3, 4)
+CHECKSUM_SIZE = 20 # SHA-1 of everything before it; all zeros with index.skipHash
+
+# Fixed part of an index entry: ctime s/ns, mtime s/ns, dev, ino, mode, uid, gid, size, sha1, flags
+_ENTRY_HEADER = struct.Struct(">10I20sH")
+_EXTENDED_FLAGS_SIZE = 2
+
+_FLAG_EXTENDED = 0x4000
+_FLAG_STAGE_MASK = 0x3000
+_EXT_FLAG_SKIP_WORKTREE = 0x4000
+
+# Object type bits of the entry mode
+_MODE_TYPE_MASK = 0o170000
+_MODE_SYMLINK = 0o120000
+_MODE_GITLINK = 0o160000 # Submodule
+
+class GitIndexError(Exception):
+    """Raised when no usable git index is found or the index cannot be parsed."""
+
+def find_git_dir(start_path: Path) -> Optional[Tuple[Path, Path]]:
+    """
+    Locates the git directory for a path, searching the path and its parents.
+
+    Handles both regular checkouts (.git directory) and worktrees/submodules
+    (.git file containing 'gitdir: <path>').
+
+    Returns:
+        A tuple (worktree_root, git_dir) or None if the path is not inside a checkout.
+    """
+    for candidate in (start_path, *start_path.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return candidate, dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if content.startswith("gitdir:"):
+                git_dir = Path(content[len("gitdir:"):].strip())
+                if not git_dir.is_absolute():
+                    git_dir = candidate / git_dir
+                return candidate, git_dir
+            return None
+    return None
+
+def _read_offset_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Reads git's offset varint (used by index v4). Returns (value, new position)."""
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, pos
+
+class GitIndex:
+    """A parsed git index header, ready to iterate its entries."""
+
+    def __init__(self, index_path: Path, worktree_root: Path):
+        """
+        Reads and validates the index file.
+
+        Raises:
+            GitIndexError: If the file is missing, truncated, corrupt or has an unsupported format.
+        """
+        self.index_path = index_path
+        self.worktree_root = worktree_root
+        try:
+            self._data = index_path.read_bytes()
+        except OSError as e:
+            raise GitIndexError(f"Cannot read git index {index_path}: {e}") from e
+
+        if len(self._data) < 12 or self._data[:4] != INDEX_SIGNATURE:
+            raise GitIndexError(f"Not a git index file: {index_path}")
+        self.version, self.entry_count = struct.unpack_from(">II", self._data, 4)
+        if self.version not in SUPPORTED_VERSIONS:
+            raise GitIndexError(f"Unsupported git index version {self.version} in {index_path}")
+        self._validate()
+
+    def _validate(self) -> None:
+        """Checks the trailing checksum, or (without one) that every entry lies within the file."""
+        data = self._data
+        if len(data) < 12 + CHECKSUM_SIZE:
+            raise GitIndexError(f"Truncated git index {self.index_path}")
+        checksum = data[-CHECKSUM_SIZE:]
+        if checksum != bytes(CHECKSUM_SIZE):
+            if hashlib.sha1(memoryview(data)[:-CHECKSUM_SIZE]).digest() != checksum:
+                raise GitIndexError(f"Truncated or corrupt git index {self.index_path} (checksum mismatch)")
+            return
+        for _ in self.iter_raw_entries(): # Raises GitIndexError on an entry out of bounds
+            pass
+
+    @classmethod
+    def for_path(cls, root_path: Path) -> "GitIndex":
+        """
+        Opens the index of the checkout containing root_path.
+
+        Raises:
+            GitIndexError: If root_path is not in a git checkout or it has no index.
+        """
+        located = find_git_dir(root_path)
+        if located is None:
+            raise GitIndexError(f"No git checkout found for {root_path}")
+        worktree_root, git_dir = located
+        index_path = git_dir / "index"
+        if not index_path.is_file():
+            raise GitIndexError(f"No git index at {index_path}")
+        return cls(index_path, worktree_root)
+
+    def iter_raw_entries(self) -> Iterator[Tuple[str, int, int, int]]:
+        """
+        Yields (path, mode, size, mtime_ns) for every stage-0 entry in index order.
+
+        Paths are '/'-separated and relative to the worktree root. Conflicted
+        paths (stages 1-3) are reported once, and sparse-checkout entries that
+        are not present in the working tree are skipped.
+
+        Raises:
+            GitIndexError: If an entry runs past the end of the entry table.
+        """
+        data = self._data
+        limit = len(data) - CHECKSUM_SIZE
+        pos = 12
+        previous_path = b""
+        header_size = _ENTRY_HEADER.size
+        try:
+            for _ in range(self.entry_count):
+                (_, _, mtime_s, mtime_ns, _, _, mode, _, _, size, _, flags) = _ENTRY_HEADER.unpack_from(data, pos)
+                entry_start = pos
+                pos += header_size
+                extended_flags = 0
+                if flags & _FLAG_EXTENDED and self.version >= 3:
+                    extended_flags = struct.unpack_from(">H", data, pos)[0]
+                    pos += _EXTENDED_FLAGS_SIZE
+
+                if self.version == 4:
+                    strip, pos = _read_offset_varint(data, pos)
+                    end = data.index(b"\0", pos)
+                    path_bytes = previous_path[:len(previous_path) - strip] + data[pos:end]
+                    pos = end + 1
+                else:
+                    end = data.index(b"\0", pos)
+                    path_bytes = data[pos:end]
+                    # Entries are NUL-padded to a multiple of 8 bytes (1-8 NULs)
+                    entry_length = end - entry_start
+                    pos = entry_start + (entry_length + 8) // 8 * 8
+                if pos > limit:
+                    raise ValueError(f"entry ends at byte {pos}, past the entry table")
+
+                if path_bytes == previous_path:
+                    continue # Same path at another merge stage
+                previous_path = path_bytes
+
+                if extended_flags & _EXT_FLAG_SKIP_WORKTREE:
+                    continue
+                if (mode & _MODE_TYPE_MASK) == _MODE_GITLINK:
+                    continue
+                yield os.fsdecode(path_bytes), mode, size, mtime_s * 1_000_000_000 + mtime_ns
+        except (struct.error, ValueError, IndexError) as e:
+            raise GitIndexError(f"Truncated or corrupt git index {self.index_path}: {e}") from e
+
+    def iter_entries(
+        self,
+        root_path: Path,
+        ignore_dirs: Set[str] = DEFAULT_IGNORE_DIRS,
+        ignore_files: Set[str] = DEFAULT_IGNORE_FILES,
+    ) -> Iterator[FileEntry]:
+        """
+        Yields FileEntry objects for tracked files under root_path.
+
+        Args:
+            root_path: Scan root; may be the worktree root or a directory inside it.
+            ignore_dirs: Directory names whose contents are skipped.
+            ignore_files: File names that are skipped.
+        """
+        try:
+            prefix = root_path.relative_to(self.worktree_root).as_posix()
+        except ValueError:
+            raise GitIndexError(f"{root_path} is not inside {self.worktree_root}")
+        prefix = "" if prefix == "." else prefix + "/"
+
+        # Ignore decisions are made once per directory, not once per file
+        dir_ignored: Dict[str, bool] = {}
+        root_str = str(root_path)
+
+        for path, mode, size, mtime_ns in self.iter_raw_entries():
+            if prefix:
+                if not path.startswith(prefix):
+                    continue
+                path = path[len(prefix):]
+
+            directory, _, name = path.rpartition("/")
+            if name in ignore_files:
+                continue
+            ignored = dir_ignored.get(directory)
+            if ignored is None:
+                ignored = any(part in ignore_dirs for part in directory.split("/")) if directory else False
+                dir_ignored[directory] = ignored
+            if ignored:
+                continue
+
+            yield FileEntry(
+                path=Path(root_str, path),
+                relative_path=Path(path),
+                size_bytes=size,
+                mtime_ns=mtime_ns,
+                is_symlink=(mode & _MODE_TYPE_MASK) == _MODE_SYMLINK,
+                stat_from_index=True,
+            )
+
+def scan_git_index(
+    root_path: Path,
+    ignore_dirs: Set[str] = DEFAULT_IGNORE_DIRS,
+    ignore_files: Set[str] = DEFAULT_IGNORE_FILES,
+) -> Iterator[FileEntry]:
+    """
+    Yields tracked files under root_path from the git index.
+
+    The index is opened and read up to the first file under root_path eagerly,
+    so GitIndexError is raised by this call (not on first iteration) when there
+    is no usable index. Callers can fall back to scan_repository_entries() in
+    that case.
+
+    Raises:
+        GitIndexError: If no usable index exists for root_path, or it lists no
+            file under root_path (e.g. an untracked directory inside a checkout).
+    """
+    index = GitIndex.for_path(root_path)
+    logging.info(f"Reading {index.entry_count} entries from git index {index.index_path} (version {index.version})")
+    entries = index.iter_entries(root_path, ignore_dirs, ignore_files)
+    first = next(entries, None)
+    if first is None:
+        raise GitIndexError(f"No tracked files under {root_path} in {index.index_path}")
+    return itertools.chain((first,), entries)
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+Gitignore-style ignore rules compiled into fast per-path matchers.
+
+Each ignore file (.gitignore, .archignore, .git/info/exclude) becomes one
+IgnoreMatcher anchored at the directory that contains it. The scanner keeps a
+chain of matchers from the root down to the current directory and consults it
+before descending, so ignored subtrees are pruned without being listed.
+"""
+
+import re
+import logging
+from pathlib import Path
+from typing import Iterable, List, Optional, Pattern, Sequence, Tuple
+
+# Ignore files read in every directory, in increasing order of precedence
+IGNORE_FILE_NAMES: Tuple[str, ...] = (".gitignore", ".archignore")
+
+# Repository-wide exclude file, relative to the scan root
+GIT_INFO_EXCLUDE = Path(".git") / "info" / "exclude"
+
+def _translate_glob(glob: str) -> str:
+    """Translates the body of a gitignore pattern (no '!' or trailing '/') to a regex."""
+    out: List[str] = []
+    i = 0
+    n = len(glob)
+    while i < n:
+        c = glob[i]
+        if c == "*":
+            if glob.startswith("**", i):
+                j = i + 2
+                at_start = i == 0 or glob[i - 1] == "/"
+                at_end = j == n or glob[j] == "/"
+                if at_start and at_end:
+                    if j == n:
+                        out.append(".*") # 'dir/**' or '**': everything below
+                    else:
+                        out.append("(?:.*/)?") # '**/' or '/**/': zero or more directories
+                        j += 1
+                    i = j
+                    continue
+            # Any other run of stars behaves like a single '*'
+            while i < n and glob[i] == "*":
+                i += 1
+            out.append("[^/]*")
+            continue
+        if c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = glob.find("]", i + 2 if glob.startswith("[!", i) or glob.startswith("[^", i) else i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = glob[i + 1:end]
+                if body[:1] in ("!", "^"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(glob[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+def compile_pattern(line: str) -> Optional[Tuple[str, bool, bool]]:
+    """
+    Compiles a single gitignore line.
+
+    Args:
+        line: One line of an ignore file.
+
+    Returns:
+        A tuple (regex, negated, dir_only), or None for blank lines and comments.
+        The regex must fully match the path relative to the ignore file's directory.
+    """
+    line = line.rstrip("\r\n")
+    if not line or line.startswith("#"):
+        return None
+
+    negated = False
+    if line.startswith("!"):
+        negated = True
+        line = line[1:]
+    elif line.startswith("\\!") or line.startswith("\\#"):
+        line = line[1:]
+
+    # Trailing spaces are ignored unless escaped
+    while line.endswith(" ") and not line.endswith("\\ "):
+        line = line[:-1]
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    # A slash at the start or in the middle anchors the pattern to the ignore file's directory
+    anchored = "/" in line
+    line = line.lstrip("/")
+    body = _translate_glob(line)
+    regex = body if anchored else "(?:.*/)?" + body
+    return regex, negated, dir_only
+
+class IgnoreMatcher:
+    """
+    The compiled rules of one ignore file.
+
+    Rules without negations are folded into a single alternation regex, so a
+    lookup is one regex call. Files with '!' rules fall back to evaluating the
+    rules last-to-first, but only after the combined regex reports a hit.
+    """
+
+    def __init__(self, patterns: Iterable[str], base_dir: str = "", source: str = ""):
+        """
+        Args:
+            patterns: Lines of the ignore file.
+            base_dir: Directory of the ignore file relative to the scan root, as a
+                '/'-terminated prefix ('' for the root).
+            source: Where the patterns came from (for logging).
+        """
+        self.base_dir = base_dir
+        self.source = source
+        self.rules: List[Tuple[Pattern, bool, bool]] = []
+        for line in patterns:
+            compiled = compile_pattern(line)
+            if compiled is None:
+                continue
+            regex, negated, dir_only = compiled
+            self.rules.append((re.compile(regex, re.DOTALL), negated, dir_only))
+
+        self.has_negations = any(negated for _, negated, _ in self.rules)
+        self._any_file_rule = self._combine(r for r in self.rules if not r[2])
+        self._any_dir_rule = self._combine(self.rules)
+
+    @staticmethod
+    def _combine(rules: Iterable[Tuple[Pattern, bool, bool]]) -> Optional[Pattern]:
+        parts = [f"(?:{rule[0].pattern})" for rule in rules]
+        return re.compile("|".join(parts), re.DOTALL) if parts else None
+
+    @classmethod
+    def from_file(cls, file_path: Path, base_dir: str = "") -> Optional["IgnoreMatcher"]:
+        """Reads and compiles an ignore file. Returns None if it cannot be read or has no rules."""
+        try:
+            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+                matcher = cls(f.read().splitlines(), base_dir=base_dir, source=str(file_path))
+        except OSError as e:
+            logging.warning(f"Could not read ignore file {file_path}: {e}")
+            return None
+        if not matcher.rules:
+            return None
+        logging.debug(f"Loaded {len(matcher.rules)} ignore rules from {file_path}")
+        return matcher
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def match(self, relative_path: str, is_dir: bool) -> Optional[bool]:
+        """
+        Matches a path against this file's rules.
+
+        Args:
+            relative_path: Path relative to the scan root, '/'-separated, inside base_dir.
+            is_dir: Whether the path is a directory (dir-only rules apply to directories only).
+
+        Returns:
+            True if the path is ignored, False if a '!' rule re-includes it, or
+            None if no rule in this file applies.
+        """
+        path = relative_path[len(self.base_dir):]
+        combined = self._any_dir_rule if is_dir else self._any_file_rule
+        if combined is None or combined.fullmatch(path) is None:
+            return None
+        if not self.has_negations:
+            return True
+        for regex, negated, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(path) is not None:
+                return not negated
+        return None
+
+IgnoreChain = Tuple[IgnoreMatcher, ...]
+
+def is_ignored(chain: Sequence[IgnoreMatcher], relative_path: str, is_dir: bool) -> bool:
+    """
+    Decides whether a path is ignored by a chain of matchers.
+
+    Matchers later in the chain (deeper directories, higher precedence files)
+    win over earlier ones, as in git.
+    """
+    for matcher in reversed(chain):
+        result = matcher.match(relative_path, is_dir)
+        if result is not None:
+            return result
+    return False
+
+def load_root_matchers(root_path: Path) -> IgnoreChain:
+    """Loads repository-wide rules that apply above any .gitignore (currently .git/info/exclude)."""
+    exclude_file = root_path / GIT_INFO_EXCLUDE
+    if exclude_file.is_file():
+        matcher = IgnoreMatcher.from_file(exclude_file)
+        if matcher:
+            return (matcher,)
+    return ()
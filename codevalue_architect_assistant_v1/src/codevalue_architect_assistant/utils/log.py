@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Run-wide logging configuration, and a debug switch for hot loops.
+
+Messages are logged on the root logger as elsewhere in the package, but
+per-file and per-import debug messages are guarded by `if log.DEBUG:` so
+that, unless debug output is on, their f-strings are never built. DEBUG is
+resolved once per run by configure_logging() (the CLI calls it), instead of
+asking the logging module for every message.
+"""
+
+import logging
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+# Whether debug records are emitted; see refresh_debug_flag()
+DEBUG = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+def refresh_debug_flag() -> bool:
+    """
+    Re-reads whether the root logger emits debug records.
+
+    Call it after changing the logging configuration outside configure_logging()
+    (e.g. when using the package as a library), or hot-loop debug messages
+    keep following the previous setting.
+    """
+    global DEBUG
+    DEBUG = logging.getLogger().isEnabledFor(logging.DEBUG)
+    return DEBUG
+
+def configure_logging(level: str = "INFO", quiet: bool = False) -> None:
+    """
+    Configures the root logger for a command run.
+
+    Args:
+        level: One of LOG_LEVELS.
+        quiet: Only log warnings and errors, whatever the level.
+    """
+    numeric_level = logging.WARNING if quiet else getattr(logging, level.upper())
+    logging.basicConfig(level=numeric_level, format=LOG_FORMAT)
+    logging.getLogger().setLevel(numeric_level) # basicConfig() leaves an already configured root logger alone
+    refresh_debug_flag()
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Per-stage timing and counters for the analysis pipeline.
+
+A Profiler is handed to the pipeline functions (scan, parse, resolve, graph
+building, rendering), which wrap each unit of work in `with
+profiler.stage(name) as stats:` and add the files, bytes and items it
+processed to stats. Stages nest: while an inner stage runs, the outer one is
+paused, so each stage reports its own (exclusive) wall and CPU time even
+though the pipeline is a chain of generators. The CPU time is that of this
+process; with --jobs the parsing work of worker processes shows up as wall
+time of the 'parse' stage only.
+
+One stage can additionally be run under cProfile and its statistics dumped
+for pstats / snakeviz.
+
+A disabled profiler (Profiler(enabled=False), the default of every
+pipeline function) makes stage() a near no-op.
+"""
+
+import json
+import time
+import cProfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# The stages recorded by map-deps, in pipeline order
+PIPELINE_STAGES = ("scan", "index", "parse", "resolve", "graph", "render")
+
+@dataclass
+class StageStats:
+    """Accumulated cost and throughput of one pipeline stage."""
+    name: str
+    calls: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    files: int = 0
+    bytes: int = 0
+    items: int = 0 # Stage-specific unit: imports, dependencies, edges, nodes...
+
+    def to_dict(self) -> Dict[str, Any]:
+        def _rate(count: float) -> Optional[float]:
+            return count / self.wall_s if self.wall_s > 0 and count else None
+        return {
+            "stage": self.name,
+            "calls": self.calls,
+            "wall_s": self.wall_s,
+            "cpu_s": self.cpu_s,
+            "files": self.files,
+            "bytes": self.bytes,
+            "items": self.items,
+            "files_per_s": _rate(self.files),
+            "bytes_per_s": _rate(self.bytes),
+            "items_per_s": _rate(self.items),
+        }
+
+class Profiler:
+    """Collects StageStats for the stages of one run."""
+
+    def __init__(self, enabled: bool = True, cprofile_stage: Optional[str] = None):
+        """
+        Args:
+            enabled: If False, stage() does no timing and nothing is recorded.
+            cprofile_stage: Name of a stage to run under cProfile (see dump_cprofile()).
+        """
+        self.enabled = enabled
+        self.cprofile_stage = cprofile_stage
+        self.stages: Dict[str, StageStats] = {} # In the order stages were first entered
+        self._stack: List[Tuple[StageStats, float, float]] = [] # (stage, wall start, cpu start) of running stages
+        self._cprofile = cProfile.Profile() if enabled and cprofile_stage else None
+        self._started = time.perf_counter()
+        self._discard = StageStats("") # Handed out when disabled
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageStats]:
+        """
+        Times a unit of work of the named stage; yields its StageStats for the counters.
+
+        The block must not span a generator's yield, or the time of whatever
+        runs in between would be charged to this stage.
+        """
+        if not self.enabled:
+            yield self._discard
+            return
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats(name)
+        stats.calls += 1
+        self._switch(stats)
+        try:
+            yield stats
+        finally:
+            self._switch(None)
+
+    def _switch(self, entering: Optional[StageStats]) -> None:
+        """Charges the time since the last switch to the running stage, then enters or leaves a stage."""
+        wall, cpu = time.perf_counter(), time.process_time()
+        if self._stack:
+            running, wall_start, cpu_start = self._stack[-1]
+            running.wall_s += wall - wall_start
+            running.cpu_s += cpu - cpu_start
+            if self._cprofile is not None and running.name == self.cprofile_stage:
+                self._cprofile.disable()
+        if entering is not None:
+            self._stack.append((entering, wall, cpu))
+        else:
+            self._stack.pop()
+        if self._stack:
+            # The stage now on top (re)starts its clock
+            running = self._stack[-1][0]
+            self._stack[-1] = (running, wall, cpu)
+            if self._cprofile is not None and running.name == self.cprofile_stage:
+                self._cprofile.enable()
+
+    # --- Reporting ---
+
+    def _ordered(self) -> List[StageStats]:
+        """Known stages in pipeline order, then any others in the order they were entered."""
+        rank = {name: index for index, name in enumerate(PIPELINE_STAGES)}
+        return sorted(self.stages.values(), key=lambda stats: rank.get(stats.name, len(rank)))
+
+    @property
+    def total_wall_s(self) -> float:
+        """Wall time since the profiler was created."""
+        return time.perf_counter() - self._started
+
+    def report(self) -> Dict[str, Any]:
+        """The JSON-serializable report: total wall time and one entry per stage."""
+        total = self.total_wall_s
+        stages = [stats.to_dict() for stats in self._ordered()]
+        return {
+            "total_wall_s": total,
+            "unattributed_wall_s": max(0.0, total - sum(stats.wall_s for stats in self.stages.values())),
+            "stages": stages,
+        }
+
+    def format_table(self) -> str:
+        """The report as a plain-text table."""
+        total = self.total_wall_s
+        lines = [f"{'stage':<10} {'calls':>7} {'wall s':>8} {'%':>5} {'cpu s':>8} {'files':>8} {'MiB':>8} "
+                 f"{'files/s':>9} {'MiB/s':>8} {'items':>9} {'items/s':>10}"]
+        for stats in self._ordered():
+            row = stats.to_dict()
+            share = 100 * stats.wall_s / total if total > 0 else 0.0
+            lines.append(
+                f"{stats.name:<10} {stats.calls:>7} {stats.wall_s:>8.3f} {share:>5.1f} {stats.cpu_s:>8.3f} "
+                f"{stats.files:>8} {stats.bytes / 2**20:>8.1f} {row['files_per_s'] or 0:>9.0f} "
+                f"{(row['bytes_per_s'] or 0) / 2**20:>8.1f} {stats.items:>9} {row['items_per_s'] or 0:>10.0f}"
+            )
+        attributed = sum(stats.wall_s for stats in self.stages.values())
+        lines.append(f"{'total':<10} {'':>7} {total:>8.3f} {'':>5} (other: {max(0.0, total - attributed):.3f} s)")
+        return "\n".join(lines)
+
+    def write_json(self, path: Union[str, Path]) -> None:
+        Path(path).write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+
+    def dump_cprofile(self, path: Union[str, Path]) -> bool:
+        """
+        Writes the cProfile statistics of cprofile_stage (load them with pstats.Stats).
+
+        Returns:
+            False if no stage was profiled.
+        """
+        if self._cprofile is None or self.cprofile_stage not in self.stages:
+            return False
+        self._cprofile.dump_stats(str(path))
+        return True
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Base class for the small records created once per file, import or match.
+
+A run creates millions of them, so they keep their attributes in __slots__
+instead of a per-instance __dict__ (about half the memory of a dataclass
+instance). Record adds the dataclass conveniences the code relies on:
+keyword construction is left to each subclass's __init__, equality compares
+the fields, and repr() lists them.
+"""
+
+from typing import Tuple
+
+class Record:
+    """
+    A __slots__ record with field-wise equality and a dataclass-like repr.
+
+    Subclasses declare __slots__ and an __init__. The fields compared and
+    shown are their slots, unless the class sets _fields (e.g. to expose a
+    property instead of a private slot).
+    """
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_fields" not in cls.__dict__:
+            cls._fields = tuple(cls.__dict__.get("__slots__", ()))
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None # Mutable, like a dataclass with eq=True
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Tests for architecture rules."""
+
+import pytest
+from pathlib import Path
+from codevalue_architect_assistant.graph import CompactGraph
+from codevalue_architect_assistant.analysis.arch_rules import (
+    parse_arch_rules, load_arch_rules, check_architecture, selector_regex, ArchRulesError,
+)
+
+RULES = {
+    "layers": {
+        "domain": ["src/domain"],
+        "infrastructure": ["src/infra/**", "re:src/adapters/.*_db\\.py"],
+        "api": ["src/api/*.py"],
+    },
+    "rules": [
+        {"from": "domain", "forbid": ["infrastructure", "api"]},
+        {"name": "api stays thin", "from": "api", "allow": ["domain"]},
+    ],
+    "slices": {"features": "src/features/*"},
+}
+
+@pytest.mark.parametrize("selector, path, expected", [
+    ("src/domain", "src/domain/user.py", True),
+    ("src/domain", "src/domainx/user.py", False),
+    ("src/api/*.py", "src/api/routes.py", True),
+    ("src/api/*.py", "src/api/v1/routes.py", False),
+    ("src/**/models.py", "src/models.py", True),
+    ("src/**/models.py", "src/a/b/models.py", True),
+    ("re:.*_db\\.py", "src/adapters/user_db.py", True),
+])
+def test_selectors(selector, path, expected):
+    import re
+    assert (re.fullmatch(selector_regex(selector), path) is not None) is expected
+
+def test_check_architecture_reports_layer_and_slice_violations():
+    graph = CompactGraph.from_edges([
+        ("src/domain/user.py", "src/infra/db/session.py", "import_from", 3), # Forbidden
+        ("src/domain/user.py", "src/domain/base.py", "import_from", 1), # Same layer
+        ("src/api/routes.py", "src/domain/user.py", "import_from", 2), # Allowed
+        ("src/api/routes.py", "src/adapters/user_db.py", "import_from", 5), # Not in the allow list
+        ("src/api/routes.py", "src/api/schemas.py", "import_from", 6), # Own layer
+        ("src/infra/db/session.py", "src/domain/user.py", "import_from", 1), # No rule
+        ("src/features/cart/view.py", "src/features/cart/model.py", "import_from", 1), # Same slice
+        ("src/features/cart/view.py", "src/features/billing/api.py", "import_from", 4), # Other slice
+        ("src/features/cart/view.py", "src/domain/user.py", "import_from", 7), # Not a slice
+    ])
+    violations = check_architecture(graph, parse_arch_rules(RULES))
+    assert [(v.source_file, v.line_number, v.target_file, v.rule) for v in violations] == [
+        ("src/domain/user.py", 3, "src/infra/db/session.py", "domain must not import infrastructure, api"),
+        ("src/api/routes.py", 5, "src/adapters/user_db.py", "api stays thin"),
+        ("src/features/cart/view.py", 4, "src/features/billing/api.py", "slices of 'features' must not import each other"),
+    ]
+
+@pytest.mark.parametrize("data, message", [
+    ({"layers": {"a": ["x"]}, "rules": [{"from": "a", "forbid": ["b"]}]}, "unknown layer 'b'"),
+    ({"layers": {"a": ["x"]}, "rules": [{"from": "a"}]}, "either 'forbid' or 'allow'"),
+    ({"layers": {"a": 1}}, "selectors of layer 'a'"),
+])
+def test_parse_arch_rules_rejects_invalid_rules(data, message):
+    with pytest.raises(ArchRulesError, match=message):
+        parse_arch_rules(data)
+
+def test_load_arch_rules_accepts_comments(tmp_path: Path):
+    path = tmp_path / ".archrules.json"
+    path.write_text('{\n  // Layers\n  "layers": {"a": ["x/**"],},\n}\n', encoding="utf-8")
+    assert load_arch_rules(path).layers == {"a": ["x/**"]}
+    with pytest.raises(ArchRulesError):
+        load_arch_rules(tmp_path / "missing.json")
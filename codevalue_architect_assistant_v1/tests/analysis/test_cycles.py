@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Tests for import cycle detection."""
+
+from pathlib import Path
+from codevalue_architect_assistant.graph import CompactGraph
+from codevalue_architect_assistant.analysis.cycles import (
+    strongly_connected_components, find_cycles, load_baseline, write_baseline, new_cycle_groups, CycleGroup,
+)
+
+def test_strongly_connected_components_in_dependency_order():
+    graph = CompactGraph.from_edges([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"), ("d", "e"), ("e", "d")], nodes=["lonely"])
+    names = graph.paths.names
+    components = [sorted(names[node] for node in component) for component in strongly_connected_components(graph)]
+    assert components == [["lonely"], ["d", "e"], ["a", "b", "c"]]
+
+def test_find_cycles_reports_groups_with_shortest_example():
+    graph = CompactGraph.from_edges([
+        ("a.py", "b.py"), ("b.py", "c.py"), ("c.py", "d.py"), ("d.py", "a.py"), ("b.py", "a.py"), # a <-> b is shortest
+        ("x.py", "y.py"), ("y.py", "x.py"),
+        ("self.py", "self.py"),
+        ("a.py", "x.py"), ("tree.py", "a.py"),
+    ])
+    groups = find_cycles(graph)
+    assert [group.files for group in groups] == [
+        ["a.py", "b.py", "c.py", "d.py"], ["x.py", "y.py"], ["self.py"],
+    ]
+    assert groups[0].example == ["a.py", "b.py", "a.py"]
+    assert groups[1].example == ["x.py", "y.py", "x.py"]
+    assert groups[2].example == ["self.py", "self.py"]
+
+def test_find_cycles_on_long_chain_needs_no_recursion():
+    """A 200k-file import chain closed into one cycle is far beyond the recursion limit."""
+    count = 200_000
+    graph = CompactGraph()
+    for i in range(count):
+        graph.add_edge_ids(graph.add_node(f"m{i}.py"), graph.add_node(f"m{(i + 1) % count}.py"))
+    groups = find_cycles(graph)
+    assert len(groups) == 1 and len(groups[0].files) == count
+    assert len(groups[0].example) == count + 1
+
+def test_baseline_round_trip_and_new_groups(tmp_path: Path):
+    baseline_path = tmp_path / "cycles.json"
+    write_baseline(baseline_path, [CycleGroup(["a.py", "b.py", "c.py"]), CycleGroup(["x.py", "y.py"])])
+    baseline = load_baseline(baseline_path)
+
+    known_part = CycleGroup(["a.py", "b.py"]) # Cycle partly broken
+    merged = CycleGroup(["a.py", "x.py", "y.py"]) # Two known groups joined
+    grown = CycleGroup(["x.py", "y.py", "z.py"])
+    assert new_cycle_groups([known_part, merged, grown], baseline) == [merged, grown]
+    assert new_cycle_groups([known_part], None) == [known_part]
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 """Tests for Python and JavaScript dependency resolution."""
 
+import threading
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Set
 
@@ -9,9 +11,14 @@ from typing import Set
 from codevalue_architect_assistant.analysis.python_parser import RawImport
 from codevalue_architect_assistant.analysis.javascript_parser import JSRawImport # Added
 from codevalue_architect_assistant.models import Dependency
+from codevalue_architect_assistant.commands.common import perform_analysis
+from codevalue_architect_assistant.analysis import dependency_resolver
+from codevalue_architect_assistant.analysis.parse_cache import ParseCache
 from codevalue_architect_assistant.analysis.dependency_resolver import ( # Updated imports
     resolve_python_import,
-    resolve_javascript_import
+    resolve_javascript_import,
+    resolve_all_dependencies,
+    _map_bounded,
 )
 
 # --- Test Setup ---
@@ -123,7 +130,15 @@ def test_resolve_from_absolute_import_module(tmp_path: Path):
     dep = resolve_python_import(raw_import, source_file, project_root, project_files)
     assert dep.source_file == source_file
     assert dep.target_module == 'package.mod1'
-    assert dep.target_file == Path("package/__init__.py") # Resolved to package containing mod1
+    assert dep.target_file == Path("package/mod1.py") # mod1 is a submodule, not a name from __init__.py
+
+def test_resolve_from_absolute_import_name_from_package(tmp_path: Path):
+    """Test 'from package import helper' from main.py, where helper is not a module."""
+    project_files = setup_mock_py_project(tmp_path)
+    project_root = tmp_path / "py_project"
+    raw_import = RawImport(module_name='helper', alias=None, line_number=7, is_from_import=True, from_module='package')
+    dep = resolve_python_import(raw_import, Path("main.py"), project_root, project_files)
+    assert dep.target_file == Path("package/__init__.py") # Defined in (or re-exported by) the package
 
 def test_resolve_from_absolute_import_submodule(tmp_path: Path):
     """Test 'from package.subpackage import mod2' from main.py."""
@@ -134,7 +149,7 @@ def test_resolve_from_absolute_import_submodule(tmp_path: Path):
     dep = resolve_python_import(raw_import, source_file, project_root, project_files)
     assert dep.source_file == source_file
     assert dep.target_module == 'package.subpackage.mod2'
-    assert dep.target_file == Path("package/subpackage/__init__.py")
+    assert dep.target_file == Path("package/subpackage/mod2.py")
 
 def test_resolve_relative_import_sibling_module(tmp_path: Path):
     """Test 'from . import utils' from main.py."""
@@ -351,4 +366,99 @@ def test_resolve_js_json_import(tmp_path: Path):
     source_file = Path("lib/helper.mjs") # Source file is in lib/
     raw_import = JSRawImport(module_specifier='../data/users.json', type='require')
     dep = resolve_javascript_import(raw_import, source_file, project_root, project_files)
-    assert dep.target_file == Path("data/users.json") # Resolved to users.json
\ No newline at end of file
+    assert dep.target_file == Path("data/users.json") # Resolved to users.json
+
+
+# --- resolve_all_dependencies Tests ---
+
+def _make_mixed_project(tmp_path: Path) -> Path:
+    root = tmp_path / "mixed"
+    (root / "pkg").mkdir(parents=True)
+    (root / "web").mkdir()
+    (root / "main.py").write_text("import os\nimport pkg.mod\nfrom pkg import mod\n", encoding="utf-8")
+    (root / "pkg" / "__init__.py").write_text("", encoding="utf-8")
+    for i in range(12):
+        (root / "pkg" / f"m{i}.py").write_text(f"import json\nimport pkg.m{(i + 1) % 12}\n", encoding="utf-8")
+    (root / "pkg" / "mod.py").write_text("import sys\n", encoding="utf-8")
+    (root / "web" / "app.js").write_text("const u = require('./util');\nimport x from 'react';\n", encoding="utf-8")
+    (root / "web" / "util.js").write_text("module.exports = {};\n", encoding="utf-8")
+    return root
+
+def test_resolve_all_dependencies_parallel_matches_serial(tmp_path: Path):
+    """Test that --jobs N yields the same dependencies, in the same order, as serial parsing."""
+
+    root = _make_mixed_project(tmp_path)
+    analysis_result = perform_analysis(root)
+    serial = resolve_all_dependencies(analysis_result, root)
+    assert len(serial) == 30
+    json_imports = [d.target_module for d in serial if d.target_module == "json"]
+    assert len(json_imports) == 12 and all(m is json_imports[0] for m in json_imports) # Interned
+
+    assert resolve_all_dependencies(analysis_result, root, jobs=3) == serial
+    with ParseCache.for_repository(root) as cache:
+        assert resolve_all_dependencies(analysis_result, root, parse_cache=cache, jobs=3) == serial
+        assert cache.misses == len(analysis_result.files)
+    with ParseCache.for_repository(root) as cache:
+        assert resolve_all_dependencies(analysis_result, root, parse_cache=cache, jobs=3) == serial
+        assert cache.misses == 0
+
+def test_resolve_all_dependencies_typescript(tmp_path: Path):
+    """Test that .ts/.tsx files are parsed and resolved through tsconfig paths and workspaces."""
+
+    root = tmp_path / "ts"
+    (root / "src" / "components").mkdir(parents=True)
+    (root / "packages" / "ui").mkdir(parents=True)
+    (root / "tsconfig.json").write_text('{"compilerOptions": {"paths": {"@/*": ["src/*"]}}} // comment\n', encoding="utf-8")
+    (root / "packages" / "ui" / "package.json").write_text('{"name": "@org/ui", "main": "index.ts"}', encoding="utf-8")
+    (root / "packages" / "ui" / "index.ts").write_text("export const ui = 1;\n", encoding="utf-8")
+    (root / "src" / "util.ts").write_text("export const x = 1;\n", encoding="utf-8")
+    (root / "src" / "components" / "Button.tsx").write_text("import type { T } from '../util.js';\n", encoding="utf-8")
+    (root / "src" / "main.ts").write_text(
+        "import { Button } from '@/components/Button';\nimport { ui } from '@org/ui';\nimport React from 'react';\n",
+        encoding="utf-8",
+    )
+    dependencies = resolve_all_dependencies(perform_analysis(root), root)
+    resolved = {(d.source_file.as_posix(), d.target_module): (d.target_file, d.type) for d in dependencies}
+    assert resolved == {
+        ("src/components/Button.tsx", "../util.js"): (Path("src/util.ts"), "import_type"),
+        ("src/main.ts", "@/components/Button"): (Path("src/components/Button.tsx"), "import_from"),
+        ("src/main.ts", "@org/ui"): (Path("packages/ui/index.ts"), "import_from"),
+        ("src/main.ts", "react"): (None, "import_from"),
+    }
+
+def test_iter_dependencies_is_lazy_and_falls_back_to_serial(tmp_path: Path, monkeypatch):
+    """Test that dependencies are produced file by file, and that a failing worker pool does not lose any."""
+
+    root = _make_mixed_project(tmp_path)
+    analysis_result = perform_analysis(root)
+    serial = dependency_resolver.resolve_all_dependencies(analysis_result, root)
+
+    parsed = []
+    original = dependency_resolver._parse_project_file
+    monkeypatch.setattr(dependency_resolver, "_parse_project_file",
+                        lambda project_file, *args: parsed.append(project_file) or original(project_file, *args))
+    stream = dependency_resolver.iter_dependencies(analysis_result, root)
+    assert next(stream) == serial[0]
+    assert len(parsed) == 1
+    assert [serial[0]] + list(stream) == serial
+
+    def broken_pool(*args, **kwargs):
+        raise OSError("no worker processes here")
+    monkeypatch.setattr(dependency_resolver, "ProcessPoolExecutor", broken_pool)
+    assert list(dependency_resolver.iter_dependencies(analysis_result, root, jobs=3)) == serial
+
+def test_map_bounded_limits_items_in_flight():
+    """Test that results are yielded in order with at most `window` items submitted ahead of the consumer."""
+    lock = threading.Lock()
+    started = []
+    def work(item):
+        with lock:
+            started.append(item)
+        return item * 2
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = []
+        for result in _map_bounded(executor, work, iter(range(50)), window=3):
+            results.append(result)
+            assert len(started) <= len(results) + 3
+    assert results == [item * 2 for item in range(50)]
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Tests for change-impact queries."""
+
+import random
+import pytest
+from codevalue_architect_assistant.graph import CompactGraph
+from codevalue_architect_assistant.analysis.impact import ImpactIndex, is_test_file
+
+def test_reverse_csr_lists_importers():
+    graph = CompactGraph.from_edges([("a", "c"), ("b", "c"), ("c", "a")])
+    offsets, sources = graph.reverse_csr()
+    c = graph.node_id("c")
+    assert sorted(graph.node_name(node) for node in sources[offsets[c]:offsets[c + 1]]) == ["a", "b"]
+
+@pytest.mark.parametrize("reachability", [False, True])
+def test_affected_files_follow_importers_transitively(reachability):
+    graph = CompactGraph.from_edges([
+        ("app/views.py", "app/models.py"), ("app/models.py", "lib/db.py"),
+        ("tests/test_views.py", "app/views.py"), ("tests/test_db.py", "lib/db.py"),
+        ("lib/db.py", "lib/config.py"), ("lib/config.py", "lib/db.py"), # Cycle
+    ], nodes=["tools/unrelated.py"])
+    index = ImpactIndex(graph, reachability=reachability)
+    assert index.affected_files(["app/models.py"]) == ["app/models.py", "app/views.py", "tests/test_views.py"]
+    assert index.affected_files(["lib/config.py"], tests_only=True) == ["tests/test_db.py", "tests/test_views.py"]
+    assert index.affected_files(["new_file.py"]) == ["new_file.py"] # Not in the graph
+
+def test_reachability_index_matches_search_on_random_graph():
+    rng = random.Random(7)
+    graph = CompactGraph()
+    for i in range(400):
+        graph.add_node(f"m{i}.py")
+    for _ in range(1200):
+        graph.add_edge_ids(rng.randrange(400), rng.randrange(400))
+    search, bitsets = ImpactIndex(graph), ImpactIndex(graph, reachability=True)
+    assert bitsets.has_reachability and not search.has_reachability
+    for _ in range(50):
+        query = [rng.randrange(400) for _ in range(rng.randrange(1, 4))]
+        assert bitsets.affected(query) == search.affected(query)
+
+@pytest.mark.parametrize("path, expected", [
+    ("tests/test_cli.py", True), ("src/pkg/test_utils.py", True), ("pkg/models_test.py", True),
+    ("web/src/button.test.tsx", True), ("web/src/api.spec.js", True), ("web/__tests__/App.js", True),
+    ("src/pkg/testing.py", False), ("src/contest.py", False), ("web/src/latest.js", False),
+])
+def test_is_test_file(path, expected):
+    assert is_test_file(path) is expected
@@ -3,7 +3,7 @@
 
 import pytest
 from pathlib import Path
-from codevalue_architect_assistant.analysis.language import detect_language
+from codevalue_architect_assistant.analysis.language import detect_language, detect_language_from_name
 
 # Use parametrize to test multiple extensions efficiently
 @pytest.mark.parametrize(
@@ -61,4 +61,18 @@ def test_detect_language_directory(tmp_path: Path):
 def test_detect_language_none_path():
     """Test detection with None input."""
     detected = detect_language(None)
-    assert detected is None
\ No newline at end of file
+    assert detected is None
+
+@pytest.mark.parametrize(
+    "filename, expected_language",
+    [
+        ("script.py", "python"),
+        ("App.JS", "javascript"),
+        ("archive.tar.gz", None),
+        (".dotfile", None),
+        ("no_extension", None),
+    ],
+)
+def test_detect_language_from_name(filename: str, expected_language):
+    """Test name-based detection, which must not require the file to exist."""
+    assert detect_language_from_name(filename) == expected_language
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Tests for the precomputed module-name and JavaScript file indexes."""
+
+from pathlib import Path
+
+from codevalue_architect_assistant.analysis.module_index import PythonModuleIndex, JavaScriptFileIndex
+
+# --- PythonModuleIndex ---
+
+def _index(*files: str, source_roots=None) -> PythonModuleIndex:
+    return PythonModuleIndex({Path(f) for f in files}, source_roots=source_roots)
+
+def test_lookup_modules_and_packages():
+    index = _index("app.py", "pkg/__init__.py", "pkg/mod.py", "pkg/sub/__init__.py")
+    assert index.lookup("app") == Path("app.py")
+    assert index.lookup("pkg") == Path("pkg/__init__.py")
+    assert index.lookup("pkg.mod") == Path("pkg/mod.py")
+    assert index.lookup("pkg.sub") == Path("pkg/sub/__init__.py")
+    assert index.lookup("pkg.missing") is None
+    assert index.is_package("pkg") and not index.is_package("pkg.mod")
+
+def test_package_takes_precedence_over_module():
+    index = _index("pkg.py", "pkg/__init__.py")
+    assert index.lookup("pkg") == Path("pkg/__init__.py")
+
+def test_src_layout_is_indexed_by_default():
+    index = _index("setup.py", "src/pkg/__init__.py", "src/pkg/core.py")
+    assert index.source_roots == ["", "src"]
+    assert index.lookup("pkg.core") == Path("src/pkg/core.py")
+    assert index.lookup("src.pkg.core") == Path("src/pkg/core.py") # Still importable from the root
+
+def test_configured_source_roots_and_precedence():
+    files = ("lib/util.py", "tools/util.py", "tools/extra.py")
+    assert _index(*files, source_roots=["lib", "tools"]).lookup("util") == Path("lib/util.py")
+    assert _index(*files, source_roots=["tools/", "lib"]).lookup("util") == Path("tools/util.py")
+    # The project root is not a source root unless configured
+    assert _index(*files, source_roots=["lib"]).lookup("tools.extra") is None
+
+def test_namespace_package_modules():
+    index = _index("ns/part/mod.py")
+    assert index.lookup("ns.part.mod") == Path("ns/part/mod.py")
+    assert index.lookup("ns.part") is None
+    assert not index.is_package("ns")
+
+def test_lookup_relative():
+    index = _index("pkg/__init__.py", "pkg/a.py", "pkg/sub/__init__.py", "pkg/sub/b.py")
+    source = Path("pkg/sub/b.py")
+    assert index.lookup_relative(source, 1, "") == Path("pkg/sub/__init__.py")
+    assert index.lookup_relative(source, 2, "a") == Path("pkg/a.py")
+    assert index.lookup_relative(Path("pkg/a.py"), 1, "sub.b") == Path("pkg/sub/b.py")
+    assert index.lookup_relative(source, 4, "a") is None # Above the project root
+
+# --- JavaScriptFileIndex ---
+
+def test_js_extension_probing_and_directory_index():
+    index = JavaScriptFileIndex({Path(f) for f in (
+        "src/app.js", "src/util.mjs", "src/util.json", "src/lib/index.cjs", "src/lib/index.js", "src/lib.js", "index.js",
+    )})
+    source = Path("src/app.js")
+    assert index.resolve(source, "./util") == Path("src/util.mjs") # .mjs is tried before .json
+    assert index.resolve(source, "./util.json") == Path("src/util.mjs") # The extension is replaced, as before
+    assert index.resolve(source, "./lib") == Path("src/lib.js") # A file beats a directory index
+    assert index.resolve(source, "./lib/") == Path("src/lib.js")
+    assert index.resolve(source, "./lib/index") == Path("src/lib/index.js")
+    assert index.resolve(source, "..") == Path("index.js")
+    assert index.resolve(source, "/src/app") == Path("src/app.js")
+
+def test_js_resolution_is_lexical_and_memoized():
+    index = JavaScriptFileIndex({Path("a/b/c.js"), Path("a/d.js")})
+    assert index.resolve(Path("a/b/c.js"), "./../d") == Path("a/d.js")
+    assert index.resolve(Path("a/b/c.js"), "../../../d") is None # Leaves the project root
+    assert index.resolve(Path("a/b/x.js"), "../d") == Path("a/d.js")
+    assert len(index._memo) == 3
+    index.resolve(Path("a/b/y.js"), "../d") # Same directory and specifier: served from the memo
+    assert len(index._memo) == 3
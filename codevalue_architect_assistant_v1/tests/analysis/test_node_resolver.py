@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Tests for bare-specifier resolution through workspaces and node_modules."""
+
+import json
+import pytest
+from pathlib import Path
+
+from codevalue_architect_assistant.analysis.module_index import JavaScriptFileIndex
+from codevalue_architect_assistant.analysis.node_resolver import (
+    NodePackageIndex,
+    PackageManifest,
+    REQUIRE_CONDITIONS,
+    IMPORT_CONDITIONS,
+    entry_candidates,
+    split_package_specifier,
+)
+
+def _write(root: Path, rel: str, content: str = "") -> Path:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return Path(rel)
+
+def _manifest(root: Path, rel: str, **fields) -> Path:
+    return _write(root, rel, json.dumps(fields))
+
+@pytest.mark.parametrize("specifier, expected", [
+    ("lodash", ("lodash", ".")),
+    ("lodash/fp/map", ("lodash", "./fp/map")),
+    ("@org/ui", ("@org/ui", ".")),
+    ("@org/ui/button", ("@org/ui", "./button")),
+    ("@org", None),
+    ("node:fs", None),
+])
+def test_split_package_specifier(specifier, expected):
+    assert split_package_specifier(specifier) == expected
+
+def test_exports_conditions_patterns_and_blocked_subpaths():
+    manifest = PackageManifest(name="pkg", directory="", exports={
+        ".": {"import": "./esm/index.mjs", "require": "./cjs/index.cjs"},
+        "./features/*": "./src/features/*.js",
+        "./features/internal/*": None,
+        "./package.json": "./package.json",
+    })
+    assert entry_candidates(manifest, ".", IMPORT_CONDITIONS) == ["./esm/index.mjs"]
+    assert entry_candidates(manifest, ".", REQUIRE_CONDITIONS) == ["./cjs/index.cjs"]
+    assert entry_candidates(manifest, "./features/x", IMPORT_CONDITIONS) == ["./src/features/x.js"]
+    assert entry_candidates(manifest, "./features/internal/y", IMPORT_CONDITIONS) == [] # Blocked by null
+    assert entry_candidates(manifest, "./lib/private.js", IMPORT_CONDITIONS) is None # Not exported
+
+    sugar = PackageManifest(name="pkg", directory="", exports={"node": "./node.js", "default": "./browser.js"})
+    assert entry_candidates(sugar, ".", REQUIRE_CONDITIONS) == ["./node.js"]
+
+def test_main_and_module_fields():
+    manifest = PackageManifest(name="pkg", directory="", main="lib/main.js", module="./es/main.js")
+    assert entry_candidates(manifest, ".", IMPORT_CONDITIONS) == ["./es/main.js", "./lib/main.js", "./index"]
+    assert entry_candidates(manifest, ".", REQUIRE_CONDITIONS) == ["./lib/main.js", "./es/main.js", "./index"]
+    assert entry_candidates(manifest, "./utils", IMPORT_CONDITIONS) == ["./utils"]
+
+def test_workspace_packages_resolve_to_project_files(tmp_path: Path):
+    files = {
+        _write(tmp_path, "apps/web/src/app.js"),
+        _write(tmp_path, "packages/ui/src/index.js"),
+        _write(tmp_path, "packages/ui/src/button.js"),
+        _write(tmp_path, "packages/util/lib/index.js"),
+    }
+    manifests = [
+        _manifest(tmp_path, "package.json", name="monorepo", workspaces=["apps/*", "packages/*"]),
+        _manifest(tmp_path, "packages/ui/package.json", name="@org/ui",
+                  exports={".": "./src/index.js", "./*": "./src/*.js"}),
+        _manifest(tmp_path, "packages/util/package.json", name="util", main="lib"),
+    ]
+    index = NodePackageIndex(tmp_path, JavaScriptFileIndex(files), manifests)
+    source = Path("apps/web/src/app.js")
+    assert index.resolve(source, "@org/ui") == Path("packages/ui/src/index.js")
+    assert index.resolve(source, "@org/ui/button") == Path("packages/ui/src/button.js")
+    assert index.resolve(source, "util") == Path("packages/util/lib/index.js")
+    assert index.resolve(source, "react") is None
+    assert sorted(index.workspace_packages) == ["@org/ui", "monorepo", "util"]
+
+def test_node_modules_lookup_walks_up_and_reads_manifests_once(tmp_path: Path, monkeypatch):
+    files = {_write(tmp_path, "src/a/app.js"), _write(tmp_path, "src/b/other.js")}
+    _manifest(tmp_path, "node_modules/lodash/package.json", name="lodash", main="lodash.js")
+    _write(tmp_path, "node_modules/lodash/lodash.js")
+    _write(tmp_path, "node_modules/lodash/fp/map.js")
+    _manifest(tmp_path, "src/a/node_modules/lodash/package.json", name="lodash", main="./nested.js")
+    _write(tmp_path, "src/a/node_modules/lodash/nested.js")
+
+    index = NodePackageIndex(tmp_path, JavaScriptFileIndex(files))
+    reads = []
+    original = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self) or original(self))
+
+    # The closest node_modules wins
+    assert index.resolve(Path("src/a/app.js"), "lodash", is_require=True) == Path("src/a/node_modules/lodash/nested.js")
+    for _ in range(3):
+        assert index.resolve(Path("src/b/other.js"), "lodash") == Path("node_modules/lodash/lodash.js")
+    assert index.resolve(Path("src/b/other.js"), "lodash/fp/map") == Path("node_modules/lodash/fp/map.js")
+    assert len(reads) == 2 # One read per installed manifest
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Tests for the persistent parse cache."""
+
+import os
+import pytest
+from pathlib import Path
+
+from codevalue_architect_assistant.models import ProjectFile
+from codevalue_architect_assistant.analysis import parse_cache as parse_cache_module
+from codevalue_architect_assistant.analysis.parse_cache import ParseCache, CACHE_DIR_NAME, _LanguageParser
+from codevalue_architect_assistant.analysis.python_parser import RawImport, parse_python_content
+from codevalue_architect_assistant.analysis.javascript_parser import JSRawImport
+
+def _project_file(root: Path, rel: str, language: str = "python") -> ProjectFile:
+    path = root / rel
+    st = path.stat()
+    return ProjectFile(path=path, relative_path=Path(rel), language=language,
+                       size_bytes=st.st_size, mtime_ns=st.st_mtime_ns)
+
+def test_miss_then_metadata_hit_skips_read(tmp_path: Path, monkeypatch):
+    (tmp_path / "a.py").write_text("import os\nfrom pkg import mod\n", encoding="utf-8")
+    with ParseCache.for_repository(tmp_path) as cache:
+        first = cache.get_or_parse(_project_file(tmp_path, "a.py"))
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    def fail_read(self):
+        raise AssertionError(f"unexpected read of {self}")
+    monkeypatch.setattr(Path, "read_bytes", fail_read)
+
+    with ParseCache.for_repository(tmp_path) as cache:
+        second = cache.get_or_parse(_project_file(tmp_path, "a.py"))
+        assert (cache.hits, cache.misses) == (1, 0)
+    assert second == first
+    assert second[1] == RawImport(module_name="mod", alias=None, line_number=2, is_from_import=True, from_module="pkg")
+
+def test_touched_file_hits_via_content_hash(tmp_path: Path):
+    file_path = tmp_path / "a.py"
+    file_path.write_text("import os\n", encoding="utf-8")
+    with ParseCache.for_repository(tmp_path) as cache:
+        cache.get_or_parse(_project_file(tmp_path, "a.py"))
+
+    st = file_path.stat()
+    os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    with ParseCache.for_repository(tmp_path) as cache:
+        imports = cache.get_or_parse(_project_file(tmp_path, "a.py"))
+        assert (cache.hits, cache.misses) == (1, 0)
+    assert [imp.module_name for imp in imports] == ["os"]
+
+def test_changed_content_is_reparsed(tmp_path: Path):
+    file_path = tmp_path / "a.js"
+    file_path.write_text("const a = require('./a');\n", encoding="utf-8")
+    with ParseCache.for_repository(tmp_path) as cache:
+        cache.get_or_parse(_project_file(tmp_path, "a.js", "javascript"))
+
+    file_path.write_text("import b from './bee';\n", encoding="utf-8")
+    st = file_path.stat()
+    os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    with ParseCache.for_repository(tmp_path) as cache:
+        imports = cache.get_or_parse(_project_file(tmp_path, "a.js", "javascript"))
+        assert cache.misses == 1
+    assert len(imports) == 1
+    assert isinstance(imports[0], JSRawImport)
+    assert imports[0].module_specifier == "./bee"
+
+def test_parser_version_bump_invalidates(tmp_path: Path, monkeypatch):
+    (tmp_path / "a.py").write_text("import os\n", encoding="utf-8")
+    with ParseCache.for_repository(tmp_path) as cache:
+        cache.get_or_parse(_project_file(tmp_path, "a.py"))
+
+    monkeypatch.setitem(parse_cache_module.LANGUAGE_PARSERS, "python",
+                        _LanguageParser(999, parse_python_content, RawImport))
+    with ParseCache.for_repository(tmp_path) as cache:
+        cache.get_or_parse(_project_file(tmp_path, "a.py"))
+        assert (cache.hits, cache.misses) == (0, 1)
+
+def test_unsupported_language_is_not_cached(tmp_path: Path):
+    (tmp_path / "notes.txt").write_text("import os\n", encoding="utf-8")
+    with ParseCache.for_repository(tmp_path) as cache:
+        assert cache.get_or_parse(_project_file(tmp_path, "notes.txt", "unknown")) == []
+        assert cache.stats().entries == 0
+
+def test_lru_eviction_keeps_recently_used_entries(tmp_path: Path):
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.py").write_text(f"import {name}_module\n", encoding="utf-8")
+
+    with ParseCache.for_repository(tmp_path) as cache:
+        cache.get_or_parse(_project_file(tmp_path, "a.py"))
+        cache.get_or_parse(_project_file(tmp_path, "b.py"))
+    with ParseCache.for_repository(tmp_path) as cache:
+        cache.get_or_parse(_project_file(tmp_path, "a.py")) # 'a' becomes most recently used
+        cache.get_or_parse(_project_file(tmp_path, "c.py"))
+        entry_size = cache.stats().payload_bytes // 3
+
+    # Room for two entries: the least recently used one ('b') goes
+    with ParseCache.for_repository(tmp_path, max_bytes=entry_size * 2) as cache:
+        pass
+    with ParseCache.for_repository(tmp_path) as cache:
+        paths = {row[0] for row in cache._conn.execute("SELECT path FROM parse_cache")}
+    assert paths == {"a.py", "c.py"}
+
+def test_stats_and_clear(tmp_path: Path):
+    (tmp_path / "a.py").write_text("import os\n", encoding="utf-8")
+    with ParseCache.for_repository(tmp_path) as cache:
+        cache.get_or_parse(_project_file(tmp_path, "a.py"))
+        stats = cache.stats()
+        assert stats.entries == 1
+        assert stats.payload_bytes > 0
+        assert stats.path == tmp_path / CACHE_DIR_NAME / parse_cache_module.CACHE_FILE_NAME
+        assert cache.clear() == 1
+        assert cache.stats().entries == 0
+
+def test_inspection_does_not_evict_or_start_a_session(tmp_path: Path):
+    """Test that a cache opened without a cap keeps every entry and reports the last session's cap."""
+    for name in ("a.py", "b.py"):
+        (tmp_path / name).write_text("import os\n", encoding="utf-8")
+    with ParseCache.for_repository(tmp_path, max_bytes=10**9) as cache:
+        for name in ("a.py", "b.py"):
+            cache.get_or_parse(_project_file(tmp_path, name))
+        tick = cache._tick
+    with ParseCache.for_repository(tmp_path, max_bytes=None) as cache:
+        stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.max_bytes == 10**9
+    with ParseCache.for_repository(tmp_path, max_bytes=None) as cache:
+        assert cache.stats().entries == 2
+        assert cache._tick == tick + 1 # No session was recorded in between
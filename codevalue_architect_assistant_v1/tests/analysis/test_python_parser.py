@@ -1,9 +1,17 @@
 # -*- coding: utf-8 -*-
 """Tests for Python AST parsing."""
 
+import ast
+import codecs
 import pytest
 from pathlib import Path
-from codevalue_architect_assistant.analysis.python_parser import parse_python_file, RawImport
+import codevalue_architect_assistant
+from codevalue_architect_assistant.analysis.python_parser import (
+    parse_python_file,
+    extract_python_imports,
+    ImportVisitor,
+    RawImport,
+)
 
 # Helper function to create a temp file and parse it
 def _parse_content(tmp_path: Path, content: str, filename: str = "test_module.py") -> list[RawImport]:
@@ -141,4 +149,90 @@ def test_parse_file_with_encoding_issues(tmp_path: Path):
         assert len(imports) == 1
         assert imports[0].module_name == 'os'
     except UnicodeEncodeError:
-        pytest.skip("System locale might not support writing latin-1 easily for test setup")
\ No newline at end of file
+        pytest.skip("System locale might not support writing latin-1 easily for test setup")
+
+
+# --- Fast Path Equivalence ---
+
+_NESTED_SOURCE = """\
+import os
+def outer():
+    import json as j
+    class Inner:
+        from .sibling import thing
+        def method(self):
+            try:
+                import missing
+            except ImportError:
+                from fallback import missing
+            else:
+                import other
+            finally:
+                import last
+    return lambda: [x for x in range(3)]
+if True:
+    from ..pkg import (a, b as bee)
+else:
+    while False:
+        import never
+with open(__file__) as f:
+    import inside_with
+match os.name:
+    case "nt":
+        import nt_only
+    case _:
+        from . import *
+@decorator(lambda: None)
+async def coroutine():
+    async with ctx():
+        import async_ctx
+    async for _ in aiter():
+        import async_loop
+x = "import not_a_module"
+"""
+
+def _visitor_imports(source: str) -> list[RawImport]:
+    visitor = ImportVisitor()
+    visitor.visit(ast.parse(source))
+    return visitor.imports
+
+def test_fast_path_matches_import_visitor():
+    """Test that the statement-level walk returns exactly ImportVisitor's output, in order."""
+    expected = _visitor_imports(_NESTED_SOURCE)
+    assert len(expected) == 15
+    assert extract_python_imports(_NESTED_SOURCE.encode("utf-8"), Path("nested.py")) == expected
+
+def test_fast_path_matches_import_visitor_on_package_sources():
+    """Test equivalence on real-world files: this package's own modules."""
+    package_dir = Path(codevalue_architect_assistant.__file__).parent
+    for file_path in sorted(package_dir.rglob("*.py")):
+        data = file_path.read_bytes()
+        assert extract_python_imports(data, file_path) == _visitor_imports(data.decode("utf-8")), file_path
+
+def test_fast_path_skips_files_without_import_token(monkeypatch):
+    """Test that files without b'import' never reach the parser."""
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("ast.parse should not be called")
+    monkeypatch.setattr(ast, "parse", fail_parse)
+    assert extract_python_imports(b"def f():\n    return 1\n", Path("noimports.py")) == []
+
+@pytest.mark.parametrize("data", [
+    b"import os\ndef broken(:\n", # Syntax error: reported by the fallback
+    b"name = '\xe9'\nimport os\n", # Not UTF-8 and no cookie
+    codecs.BOM_UTF16_LE + "import os\n".encode("utf-16-le"),
+    b"import os\x00\n",
+])
+def test_fast_path_defers_when_unsure(data: bytes):
+    assert extract_python_imports(data, Path("unsure.py")) is None
+
+def test_fast_path_honours_bom_and_cookie(tmp_path: Path):
+    """Test the bytes path with a BOM and a coding cookie, and the fallback for undeclared latin-1."""
+    assert _parse_content(tmp_path, "﻿import os\n") == [RawImport('os', None, 1, False)]
+
+    cookie_file = tmp_path / "cookie.py"
+    cookie_file.write_bytes(b"# -*- coding: latin-1 -*-\nname = '\xe9'\nimport os\n")
+    assert parse_python_file(cookie_file) == [RawImport('os', None, 3, False)]
+
+    latin_file = tmp_path / "latin.py"
+    latin_file.write_bytes(b"name = '\xe9'\nimport os\n")
+    assert parse_python_file(latin_file) == [RawImport('os', None, 2, False)]
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Tests for tsconfig.json path alias resolution."""
+
+import json
+from pathlib import Path
+
+from codevalue_architect_assistant.analysis.module_index import JavaScriptFileIndex, TS_RESOLVE_EXTENSIONS, TS_INDEX_FILES
+from codevalue_architect_assistant.analysis.tsconfig import AliasTrie, TsConfigIndex, load_tsconfig, parse_jsonc
+
+def _write(root: Path, rel: str, content: str = "") -> Path:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return Path(rel)
+
+def _ts_index(*files: Path) -> JavaScriptFileIndex:
+    return JavaScriptFileIndex(set(files), TS_RESOLVE_EXTENSIONS, TS_INDEX_FILES)
+
+def test_parse_jsonc_strips_comments_and_trailing_commas():
+    text = """{
+  // line comment
+  "compilerOptions": { /* block */ "baseUrl": "./src", "paths": { "@/*": ["./*",], }, },
+  "note": "keeps // and /* inside strings, ]",
+}"""
+    assert parse_jsonc(text) == {
+        "compilerOptions": {"baseUrl": "./src", "paths": {"@/*": ["./*"]}},
+        "note": "keeps // and /* inside strings, ]",
+    }
+
+def test_alias_trie_prefers_exact_then_longest_prefix():
+    trie = AliasTrie()
+    trie.add("*", ["fallback/*"])
+    trie.add("@app/*", ["src/app/*"])
+    trie.add("@app/core/*", ["src/core/*", "legacy/core/*"])
+    trie.add("@app/config", ["config/index"])
+    trie.add("*.css", ["styles/*.css"])
+    assert trie.match("@app/config") == ["config/index"]
+    assert trie.match("@app/core/log") == ["src/core/log", "legacy/core/log"]
+    assert trie.match("@app/widgets/button") == ["src/app/widgets/button"]
+    assert trie.match("lodash") == ["fallback/lodash"]
+    assert trie.match("theme.css") == ["fallback/theme.css"] # Same (empty) prefix: the first pattern wins
+
+def test_extends_chain_and_relative_bases(tmp_path: Path):
+    _write(tmp_path, "configs/base.json", json.dumps({
+        "compilerOptions": {"baseUrl": "..", "paths": {"@shared/*": ["packages/shared/src/*"]}},
+    }))
+    _write(tmp_path, "apps/web/tsconfig.json", json.dumps({"extends": "../../configs/base"}))
+    _write(tmp_path, "apps/admin/tsconfig.json", json.dumps({
+        "extends": "../../configs/base.json",
+        "compilerOptions": {"paths": {"~/*": ["./src/*"]}}, # Overrides the inherited paths
+    }))
+    web = load_tsconfig(tmp_path / "apps/web/tsconfig.json", tmp_path)
+    assert web.base_url == ""
+    assert web.aliases.match("@shared/date") == ["packages/shared/src/date"]
+    admin = load_tsconfig(tmp_path / "apps/admin/tsconfig.json", tmp_path)
+    assert admin.aliases.match("~/x") == ["src/x"] # Relative to the inherited baseUrl, as in tsc
+    assert admin.aliases.match("@shared/date") == []
+
+def test_index_uses_nearest_config_then_base_url(tmp_path: Path):
+    files = [
+        _write(tmp_path, "apps/web/src/main.tsx"),
+        _write(tmp_path, "apps/web/src/components/Button.tsx"),
+        _write(tmp_path, "apps/web/src/lib/index.ts"),
+        _write(tmp_path, "packages/shared/src/date.ts"),
+        _write(tmp_path, "tools/script.ts"),
+    ]
+    configs = [
+        _write(tmp_path, "tsconfig.json", json.dumps({"compilerOptions": {"paths": {"@shared/*": ["packages/shared/src/*"]}}})),
+        _write(tmp_path, "apps/web/tsconfig.json", json.dumps({"compilerOptions": {"baseUrl": "src", "paths": {"@lib": ["lib"]}}})),
+    ]
+    index = TsConfigIndex(tmp_path, _ts_index(*files), configs)
+    main = Path("apps/web/src/main.tsx")
+    assert index.config_for(main).directory == "apps/web"
+    assert index.resolve(main, "@lib") == Path("apps/web/src/lib/index.ts")
+    assert index.resolve(main, "components/Button") == Path("apps/web/src/components/Button.tsx") # baseUrl
+    assert index.resolve(main, "@shared/date") is None # The nearest config does not declare it
+    assert index.resolve(Path("tools/script.ts"), "@shared/date") == Path("packages/shared/src/date.ts")
+    assert index.resolve(main, "react") is None
@@ -5,7 +5,7 @@ import pytest
 import networkx as nx
 from pathlib import Path
 from codevalue_architect_assistant.models import DependencyMap, Dependency
-from codevalue_architect_assistant.diagrams.mermaid_generator import generate_mermaid_diagram, _sanitize_mermaid_id
+from codevalue_architect_assistant.diagrams.mermaid_generator import generate_mermaid_diagram, write_mermaid_diagram, _sanitize_mermaid_id
 
 # Helper to create a basic DependencyMap for testing
 def create_test_dep_map(edges=None, nodes=None, unresolved=None) -> DependencyMap:
@@ -111,4 +111,38 @@ def test_generate_mermaid_invalid_direction():
 #     assert 'requests_ext_0[("requests")];' in output # Check external node definition
 #     assert 'missing_ext_1[("./missing")];' in output
 #     assert "main_py -.-> requests_ext_0;" in output # Check dashed line for external
-#     assert "main_py -.-> missing_ext_1;" in output
\ No newline at end of file
+#     assert "main_py -.-> missing_ext_1;" in output
+
+def test_generate_mermaid_isolated_node_named_like_part_of_an_edge():
+    """A node is isolated by its degree, not because its ID does not appear inside an edge line."""
+    dep_map = create_test_dep_map(edges=[("aa.py", "b.py")], nodes=["a.py", "aa.py", "b.py"])
+    output = generate_mermaid_diagram(dep_map)
+
+    assert "aa_py --> b_py;" in output
+    assert 'a_py["a.py"];' in output
+    assert 'b_py["b.py"];' not in output
+
+def test_write_mermaid_diagram_streams_same_text_in_chunks():
+    """Writing to a sink in small chunks gives exactly the string output."""
+    edges = [(f"m{i}.py", f"m{i + 1}.py") for i in range(10)]
+    dep_map = create_test_dep_map(edges=edges, nodes=["lonely.py"])
+    chunks = []
+
+    class _Sink:
+        def write(self, text):
+            chunks.append(text)
+
+    write_mermaid_diagram(dep_map, _Sink(), direction="TD", chunk_lines=3)
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == generate_mermaid_diagram(dep_map, direction="TD")
+    assert not "".join(chunks).endswith("\n")
+
+def test_generate_mermaid_rolled_up_map_labels_edges_with_import_counts():
+    dep_map = DependencyMap(repository_root=Path("/fake/repo"), granularity="dir")
+    dep_map.graph.add_edge("src/app", "src/lib", weight=3)
+    dep_map.graph.add_edge("src/lib", "src/app")
+    output = generate_mermaid_diagram(dep_map)
+
+    assert "src/app -->|3| src/lib;" in output
+    assert "src/lib -->|1| src/app;" in output
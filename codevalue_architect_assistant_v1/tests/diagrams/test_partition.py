@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Tests for diagram partitioning."""
+
+import random
+import pytest
+from pathlib import Path
+from codevalue_architect_assistant.graph import CompactGraph
+from codevalue_architect_assistant.models import DependencyMap
+from codevalue_architect_assistant.diagrams.partition import partition_graph, write_partitioned_diagrams
+
+def _labels(partitioning, graph):
+    names = graph.paths.names
+    return {p.label: sorted(names[node] for node in p.nodes) for p in partitioning.partitions}
+
+def test_partition_by_directory_cuts_at_directories_that_fit():
+    """Directories that fit the budget become partitions; small siblings share one."""
+    graph = CompactGraph.from_edges(
+        [("app/a.py", "app/b.py"), ("app/b.py", "app/c.py"), ("lib/x.py", "lib/y.py"), ("app/a.py", "lib/x.py")],
+        nodes=["tools/t.py"],
+    )
+    partitioning = partition_graph(graph, max_nodes=3, max_edges=10)
+
+    assert _labels(partitioning, graph) == {
+        "app": ["app/a.py", "app/b.py", "app/c.py"],
+        ".": ["lib/x.py", "lib/y.py", "tools/t.py"], # Two small directories packed together
+    }
+    assert sorted(partitioning.assignment) == [0, 0, 0, 1, 1, 1]
+
+def test_partition_splits_oversized_directory_and_numbers_labels():
+    """A directory over the budget is chunked, and each chunk gets a numbered label."""
+    graph = CompactGraph.from_edges([], nodes=[f"pkg/m{i}.py" for i in range(5)])
+    partitioning = partition_graph(graph, max_nodes=2, max_edges=10)
+
+    assert [p.label for p in partitioning.partitions] == ["pkg [1/3]", "pkg [2/3]", "pkg [3/3]"]
+    assert [len(p.nodes) for p in partitioning.partitions] == [2, 2, 1]
+
+@pytest.mark.parametrize("strategy", ["directory", "community"])
+def test_partitions_respect_budget(strategy):
+    """Every partition stays within max_nodes and max_edges (counted as edges leaving its nodes)."""
+    rng = random.Random(3)
+    names = [f"src/d{i % 7}/s{i % 3}/m{i}.py" for i in range(300)]
+    graph = CompactGraph.from_edges([(names[i], names[rng.randrange(300)]) for i in range(300) for _ in range(3)])
+    partitioning = partition_graph(graph, max_nodes=40, max_edges=60, strategy=strategy)
+
+    out_degrees = graph.out_degrees()
+    assert sorted(node for p in partitioning.partitions for node in p.nodes) == list(range(len(names)))
+    for p in partitioning.partitions:
+        assert len(p.nodes) <= 40
+        assert sum(out_degrees[node] for node in p.nodes) <= 60
+
+def test_partition_by_community_groups_files_that_import_each_other():
+    """Community grouping follows the imports rather than the directories."""
+    cycle_a = ["x/a1.py", "y/a2.py", "z/a3.py"]
+    cycle_b = ["x/b1.py", "y/b2.py", "z/b3.py"]
+    edges = [(c[i], c[j]) for c in (cycle_a, cycle_b) for i in range(3) for j in range(3) if i != j]
+    graph = CompactGraph.from_edges(edges + [("x/a1.py", "x/b1.py")])
+    partitioning = partition_graph(graph, max_nodes=3, max_edges=100, strategy="community")
+
+    groups = sorted(sorted(graph.paths.names[node] for node in p.nodes) for p in partitioning.partitions)
+    assert groups == [sorted(cycle_a), sorted(cycle_b)]
+
+def test_partition_rejects_unknown_strategy():
+    with pytest.raises(ValueError):
+        partition_graph(CompactGraph.from_edges([("a.py", "b.py")]), strategy="random")
+
+@pytest.mark.parametrize("output_format, suffix", [("mermaid", ".mmd"), ("plantuml", ".puml")])
+def test_write_partitioned_diagrams(tmp_path: Path, output_format, suffix):
+    """Sub-diagrams hold the edges inside them; the index links them and counts the edges between them."""
+    dep_map = DependencyMap(repository_root=Path("/fake/repo"))
+    for u, v in [("app/a.py", "app/b.py"), ("app/a.py", "lib/x.py"), ("app/b.py", "lib/x.py"), ("lib/x.py", "lib/y.py")]:
+        dep_map.graph.add_edge(u, v)
+    partitioning = partition_graph(dep_map.graph, max_nodes=2, max_edges=10)
+    index_path = tmp_path / "out" / f"deps{suffix}"
+
+    written = write_partitioned_diagrams(dep_map, partitioning, index_path, output_format=output_format)
+
+    assert [path.name for path in written] == [f"deps{suffix}", f"deps-part-001{suffix}", f"deps-part-002{suffix}"]
+    index = index_path.read_text(encoding="utf-8")
+    app_part = written[1].read_text(encoding="utf-8")
+    if output_format == "mermaid":
+        assert 'part0["app (2 files)"];' in index
+        assert "part0 -->|2| part1;" in index
+        assert f'click part1 "deps-part-002{suffix}"' in index
+        assert "app/a_py --> app/b_py;" in app_part and "lib" not in app_part
+    else:
+        assert f'component "app (2 files)" as part0 [[deps-part-001{suffix}]]' in index
+        assert "part0 --> part1 : 2" in index
+        assert "app_a_py --> app_b_py" in app_part and "lib" not in app_part
@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 """Tests for PlantUML diagram generator."""
 
+import io
 import pytest
 import networkx as nx
 from pathlib import Path
 from codevalue_architect_assistant.models import DependencyMap, Dependency
-from codevalue_architect_assistant.diagrams.plantuml_generator import generate_plantuml_diagram, _sanitize_plantuml_alias
+from codevalue_architect_assistant.diagrams.plantuml_generator import generate_plantuml_diagram, write_plantuml_diagram, _sanitize_plantuml_alias
 
 # Helper to create a basic DependencyMap for testing
 def create_test_dep_map(edges=None, nodes=None, unresolved=None) -> DependencyMap:
@@ -96,4 +97,23 @@ def test_sanitize_plantuml_alias():
 #     assert 'component "requests" as requests_ext <<external>>' in output
 #     assert 'component "./missing" as _missing_ext <<external>>' in output # Alias sanitized
 #     assert "main_py ..> requests_ext" in output # Dashed line
-#     assert "main_py ..> _missing_ext" in output
\ No newline at end of file
+#     assert "main_py ..> _missing_ext" in output
+
+def test_write_plantuml_diagram_streams_same_text():
+    """Writing to a sink in small chunks gives exactly the string output."""
+    edges = [(f"m{i}.py", f"m{i + 1}.py") for i in range(10)]
+    dep_map = create_test_dep_map(edges=edges)
+    sink = io.StringIO()
+    write_plantuml_diagram(dep_map, sink, chunk_lines=4)
+
+    assert sink.getvalue() == generate_plantuml_diagram(dep_map)
+    assert sink.getvalue().endswith("@enduml")
+
+def test_generate_plantuml_rolled_up_map_keeps_both_directions_with_counts():
+    dep_map = DependencyMap(repository_root=Path("/fake/repo"), granularity="dir")
+    dep_map.graph.add_edge("src/app", "src/lib", weight=3)
+    dep_map.graph.add_edge("src/lib", "src/app")
+    output = generate_plantuml_diagram(dep_map)
+
+    assert "src_app --> src_lib : 3" in output
+    assert "src_lib --> src_app : 1" in output
@@ -3,9 +3,18 @@
 Tests for the main CLI functionality.
 """
 
+import os
+import json
+import sys
+import click
 import pytest
+import shutil
+import subprocess
+from pathlib import Path
 from click.testing import CliRunner
+import codevalue_architect_assistant
 from codevalue_architect_assistant.cli import cli
+from codevalue_architect_assistant.commands.common import perform_analysis
 
 def test_cli_entrypoint():
     """Test the main CLI entry point runs without error."""
@@ -14,5 +23,298 @@ def test_cli_entrypoint():
     assert result.exit_code == 0
     assert "CodeValue Architect Assistant" in result.output
 
+def test_perform_analysis_uses_scanner_metadata(tmp_path: Path, monkeypatch):
+    """Test that ProjectFile metadata comes from the scan, without extra stat calls."""
+    (tmp_path / "main.py").write_text("import os\n", encoding="utf-8")
+    (tmp_path / "app.js").write_text("require('fs');\n", encoding="utf-8")
+    expected_size = (tmp_path / "main.py").stat().st_size
+
+    original_stat = Path.stat
+    def _no_file_stat(self, *args, **kwargs):
+        if self.parent == tmp_path:
+            raise AssertionError(f"Unexpected stat() call on {self}")
+        return original_stat(self, *args, **kwargs)
+    monkeypatch.setattr(Path, "stat", _no_file_stat)
+
+    result = perform_analysis(tmp_path)
+
+    by_name = {str(pf.relative_path): pf for pf in result.files}
+    assert set(by_name) == {"main.py", "app.js"}
+    assert by_name["main.py"].language == "python"
+    assert by_name["main.py"].size_bytes == expected_size
+    assert by_name["main.py"].mtime_ns is not None
+    assert result.languages_detected == {"python": 1, "javascript": 1}
+
 # Add more tests for specific commands later
-# def test_analyze_command(...): ...
\ No newline at end of file
+# def test_analyze_command(...): ...
+def test_perform_analysis_git_index_falls_back_to_walk(tmp_path: Path):
+    """Test that --source=git-index walks the tree when there is no index."""
+    (tmp_path / "main.py").touch()
+    result = perform_analysis(tmp_path, source="git-index")
+    assert [str(pf.relative_path) for pf in result.files] == ["main.py"]
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git executable not available")
+def test_perform_analysis_git_index_walks_untracked_directory(tmp_path: Path, caplog):
+    """Test that an untracked directory inside a checkout is walked, and walk-only options are reported as ignored."""
+    (tmp_path / "main.py").touch()
+    for args in (["init", "-q"], ["add", "main.py"]):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+    (tmp_path / "vendor").mkdir()
+    (tmp_path / "vendor" / "v.py").touch()
+    result = perform_analysis(tmp_path / "vendor", source="git-index")
+    assert [str(pf.relative_path) for pf in result.files] == ["v.py"]
+
+    perform_analysis(tmp_path, source="git-index", walk_threads=4)
+    assert "--walk-threads ignored" in caplog.text
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git executable not available")
+def test_map_deps_git_index_truncated_index_falls_back_to_walk(tmp_path: Path):
+    """Test that a corrupt .git/index makes the command walk the tree instead of failing midway."""
+    (tmp_path / "a.py").write_text("import b\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("x = 1\n", encoding="utf-8")
+    for args in (["init", "-q"], ["add", "a.py", "b.py"]):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+    index_path = tmp_path / ".git" / "index"
+    index_path.write_bytes(index_path.read_bytes()[:100]) # Inside the second entry
+    result = CliRunner().invoke(cli, ['map-deps', str(tmp_path), '--source', 'git-index', '--no-cache', '--format', 'mermaid'])
+    assert result.exit_code == 0
+    assert "a_py --> b_py" in result.output
+
+def test_map_deps_populates_cache_and_cache_commands(tmp_path: Path):
+    """Test that map-deps fills the parse cache and 'cache stats/clear' report on it."""
+    (tmp_path / "main.py").write_text("import helper\n", encoding="utf-8")
+    (tmp_path / "helper.py").write_text("import os\n", encoding="utf-8")
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ['map-deps', str(tmp_path), '--cache-max-mb', '1024'])
+    assert result.exit_code == 0
+    assert (tmp_path / ".cva-cache").is_dir()
+
+    for _ in range(2): # Inspecting the cache leaves it unchanged
+        result = runner.invoke(cli, ['cache', 'stats', str(tmp_path)])
+        assert result.exit_code == 0
+        assert "Entries: 2" in result.output
+        assert "(cap 1024 MiB)" in result.output
+
+    result = runner.invoke(cli, ['cache', 'clear', str(tmp_path)])
+    assert result.exit_code == 0
+    assert "Removed 2 entries" in result.output
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git executable not available")
+def test_map_deps_git_index_sees_unstaged_edits_through_cache(tmp_path: Path):
+    """Test that a cached file edited after staging is re-parsed with --source git-index."""
+    for name in ("b.py", "c.py"):
+        (tmp_path / name).write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "a.py").write_text("import b\n", encoding="utf-8")
+    for args in (["init", "-q"], ["add", "a.py", "b.py", "c.py"]):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+    runner = CliRunner()
+    result = runner.invoke(cli, ['map-deps', str(tmp_path), '--source', 'git-index', '--format', 'mermaid'])
+    assert result.exit_code == 0
+    assert "a_py --> b_py" in result.output
+
+    (tmp_path / "a.py").write_text("import c\n", encoding="utf-8") # Not staged
+    os.utime(tmp_path / "a.py", ns=(0, (tmp_path / "a.py").stat().st_mtime_ns + 1_000_000_000))
+    result = runner.invoke(cli, ['map-deps', str(tmp_path), '--source', 'git-index', '--format', 'mermaid'])
+    assert result.exit_code == 0
+    assert "a_py --> c_py" in result.output
+    assert "a_py --> b_py" not in result.output
+
+def test_map_deps_no_cache(tmp_path: Path):
+    """Test that --no-cache leaves the repository untouched."""
+    (tmp_path / "main.py").write_text("import os\n", encoding="utf-8")
+    result = CliRunner().invoke(cli, ['map-deps', str(tmp_path), '--no-cache'])
+    assert result.exit_code == 0
+    assert not (tmp_path / ".cva-cache").exists()
+
+# --- Startup ---
+
+def _run_python(code: str) -> str:
+    """Runs code in a fresh interpreter, so that sys.modules reflects only what it imported."""
+    src_dir = str(Path(codevalue_architect_assistant.__file__).resolve().parents[1])
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [src_dir, os.environ.get("PYTHONPATH")])))
+    return subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout
+
+def test_help_imports_no_command_modules():
+    """Test that importing the CLI and showing --help has no output side effects and loads no command."""
+    output = _run_python(
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from codevalue_architect_assistant.cli import cli\n"
+        "print(CliRunner().invoke(cli, ['--help']).output)\n"
+        "heavy = ('codevalue_architect_assistant.commands.', 'codevalue_architect_assistant.analysis.',\n"
+        "         'codevalue_architect_assistant.diagrams.', 'networkx')\n"
+        "print('LOADED:', sorted(m for m in sys.modules if m.startswith(heavy)))\n"
+    )
+    assert "DEBUG:" not in output # No debug prints
+    assert "map-deps" in output and "find-use-cases" in output
+    assert "LOADED: []" in output
+
+def test_lazy_command_help_matches_the_commands():
+    """Test that the help declared for lazy commands is what the loaded commands show."""
+    ctx = click.Context(cli)
+    for name, (_, _, declared) in cli.lazy_commands.items():
+        command = cli.get_command(ctx, name)
+        assert command.name == name
+        assert click.Command(name, help=declared).get_short_help_str(60) == command.get_short_help_str(60)
+
+
+def test_map_deps_profile_report(tmp_path: Path):
+    """Test that --profile-out writes a JSON report covering the pipeline stages."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "main.py").write_text("import helper\n", encoding="utf-8")
+    (repo / "helper.py").write_text("import os\n", encoding="utf-8")
+    report_path = tmp_path / "profile.json"
+    result = CliRunner().invoke(cli, ['map-deps', str(repo), '--no-cache', '--format', 'mermaid',
+                                      '--profile', '--profile-out', str(report_path)])
+    assert result.exit_code == 0
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    stages = {row["stage"]: row for row in report["stages"]}
+    assert list(stages) == ["scan", "index", "parse", "resolve", "graph", "render"]
+    assert stages["parse"]["files"] == 2 and stages["resolve"]["items"] == 2
+    assert stages["graph"]["items"] == 1 # One resolved edge
+
+def test_map_deps_streams_diagram_to_file_and_stdout(tmp_path: Path):
+    """Test that the diagram written with -o is the one printed to stdout, minus the final newline."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "main.py").write_text("import helper\n", encoding="utf-8")
+    (repo / "helper.py").write_text("import os\n", encoding="utf-8")
+    diagram_path = tmp_path / "out" / "deps.mmd"
+    runner = CliRunner()
+    to_file = runner.invoke(cli, ['map-deps', str(repo), '--no-cache', '--format', 'mermaid', '-o', str(diagram_path)])
+    to_stdout = runner.invoke(cli, ['map-deps', str(repo), '--no-cache', '--format', 'mermaid'])
+    assert to_file.exit_code == 0 and to_stdout.exit_code == 0
+    diagram = diagram_path.read_text(encoding="utf-8")
+    assert "main_py --> helper_py;" in diagram
+    assert diagram + "\n" in to_stdout.stdout
+
+def test_map_deps_partition_writes_index_and_sub_diagrams(tmp_path: Path):
+    """Test that --partition writes the index at -o and one sub-diagram per partition next to it."""
+    repo = tmp_path / "repo"
+    for package in ("app", "lib"):
+        (repo / package).mkdir(parents=True)
+        (repo / package / "__init__.py").write_text("", encoding="utf-8")
+    (repo / "app" / "main.py").write_text("from app import util\nfrom lib import core\n", encoding="utf-8")
+    (repo / "app" / "util.py").write_text("import os\n", encoding="utf-8")
+    (repo / "lib" / "core.py").write_text("from lib import helpers\n", encoding="utf-8")
+    (repo / "lib" / "helpers.py").write_text("import os\n", encoding="utf-8")
+    index_path = tmp_path / "out" / "deps.mmd"
+    result = CliRunner().invoke(cli, ['map-deps', str(repo), '--no-cache', '--format', 'mermaid', '-o', str(index_path),
+                                      '--partition', 'directory', '--max-nodes', '3'])
+    assert result.exit_code == 0
+    assert sorted(path.name for path in index_path.parent.iterdir()) == ["deps-part-001.mmd", "deps-part-002.mmd", "deps.mmd"]
+    assert "-->|" in index_path.read_text(encoding="utf-8")
+
+def test_map_deps_partition_needs_output_file(tmp_path: Path):
+    (tmp_path / "main.py").write_text("import os\n", encoding="utf-8")
+    result = CliRunner().invoke(cli, ['map-deps', str(tmp_path), '--format', 'mermaid', '--partition', 'directory'])
+    assert result.exit_code == 0
+    assert "--partition needs" in result.output
+
+def test_map_deps_directory_rollup(tmp_path: Path):
+    """Test that --granularity dir draws one node per directory with import counts on the edges."""
+    repo = tmp_path / "repo"
+    for package in ("app", "lib"):
+        (repo / package).mkdir(parents=True)
+        (repo / package / "__init__.py").write_text("", encoding="utf-8")
+    (repo / "app" / "main.py").write_text("from lib import core\nfrom lib import helpers\n", encoding="utf-8")
+    (repo / "lib" / "core.py").write_text("from lib import helpers\n", encoding="utf-8")
+    (repo / "lib" / "helpers.py").write_text("import os\n", encoding="utf-8")
+    result = CliRunner().invoke(cli, ['map-deps', str(repo), '--no-cache', '--format', 'mermaid',
+                                      '--granularity', 'dir', '--depth', '1'])
+    assert result.exit_code == 0
+    assert "app -->|2| lib;" in result.output
+    assert "main_py" not in result.output
+
+def test_cycles_check_against_baseline(tmp_path: Path):
+    """Test that 'cycles --check' fails on cycles missing from the baseline, and passes once recorded."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.py").write_text("import b\n", encoding="utf-8")
+    (repo / "b.py").write_text("import a\n", encoding="utf-8")
+    (repo / "c.py").write_text("import a\n", encoding="utf-8")
+    baseline = tmp_path / "cycles.json"
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ['cycles', str(repo), '--no-cache', '--check'])
+    assert result.exit_code == 1
+    assert "Cycle: a.py -> b.py -> a.py" in result.output
+
+    result = runner.invoke(cli, ['cycles', str(repo), '--no-cache', '--baseline', str(baseline), '--update-baseline'])
+    assert result.exit_code == 0
+    assert json.loads(baseline.read_text(encoding="utf-8")) == {"cycles": [["a.py", "b.py"]]}
+
+    result = runner.invoke(cli, ['cycles', str(repo), '--no-cache', '--baseline', str(baseline), '--check',
+                                 '--format', 'json'])
+    assert result.exit_code == 0
+    assert '"new": false' in result.output
+
+def test_impact_lists_dependents_and_tests(tmp_path: Path):
+    """Test that 'impact' prints the transitive dependents of the changed files, optionally tests only."""
+    repo = tmp_path / "repo"
+    (repo / "tests").mkdir(parents=True)
+    (repo / "core.py").write_text("import os\n", encoding="utf-8")
+    (repo / "service.py").write_text("import core\n", encoding="utf-8")
+    (repo / "tests" / "test_service.py").write_text("import service\n", encoding="utf-8")
+    (repo / "other.py").write_text("import os\n", encoding="utf-8")
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ['impact', str(repo), str(repo / "core.py"), '--no-cache'])
+    assert result.exit_code == 0
+    assert result.stdout.splitlines()[:3] == ["core.py", "service.py", str(Path("tests/test_service.py"))]
+    assert "other.py" not in result.stdout
+
+    result = runner.invoke(cli, ['impact', str(repo), 'core.py', '--no-cache', '--tests-only', '--index'])
+    assert result.exit_code == 0
+    assert result.stdout.splitlines()[0] == str(Path("tests/test_service.py"))
+    assert "service.py\n" not in result.stdout.replace("test_service.py\n", "")
+
+def test_impact_and_cycles_follow_submodules_imported_from_packages(tmp_path: Path):
+    """Test that 'from pkg import mod' links to pkg/mod.py, not pkg/__init__.py, for impact and cycles."""
+    repo = tmp_path / "repo"
+    for directory in ("app", "app/domain", "app/infra", "tests"):
+        (repo / directory).mkdir(parents=True)
+        if directory.startswith("app"):
+            (repo / directory / "__init__.py").touch()
+    (repo / "app" / "domain" / "model.py").write_text("import app.infra.db\n", encoding="utf-8")
+    (repo / "app" / "infra" / "db.py").write_text("from app.domain import model\n", encoding="utf-8")
+    (repo / "tests" / "test_model.py").write_text("from app.domain import model\n", encoding="utf-8")
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ['impact', str(repo), 'app/infra/db.py', '--no-cache', '--tests-only'])
+    assert result.exit_code == 0
+    assert result.stdout.splitlines()[0] == str(Path("tests/test_model.py"))
+
+    result = runner.invoke(cli, ['cycles', str(repo), '--no-cache', '--format', 'json'])
+    assert result.exit_code == 0
+    report = json.loads(result.stdout[result.stdout.index("{"):])
+    assert [cycle["files"] for cycle in report["cycles"]] == [
+        [str(Path("app/domain/model.py")), str(Path("app/infra/db.py"))]
+    ]
+
+def test_arch_check_fails_on_violations(tmp_path: Path):
+    """Test that 'arch-check' reports forbidden imports with their line and exits with status 1."""
+    repo = tmp_path / "repo"
+    for package in ("domain", "infra"):
+        (repo / package).mkdir(parents=True)
+        (repo / package / "__init__.py").write_text("", encoding="utf-8")
+    (repo / "domain" / "user.py").write_text("import os\nfrom infra.db import connect\n", encoding="utf-8")
+    (repo / "infra" / "db.py").write_text("from domain import user\n", encoding="utf-8")
+    (repo / ".archrules.json").write_text(json.dumps({
+        "layers": {"domain": ["domain"], "infra": ["infra"]},
+        "rules": [{"from": "domain", "forbid": ["infra"]}],
+    }), encoding="utf-8")
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ['arch-check', str(repo), '--no-cache'])
+    assert result.exit_code == 1
+    assert f"{Path('domain/user.py')}:2: imports {Path('infra/db.py')} (domain must not import infra)" in result.output
+
+    (repo / "domain" / "user.py").write_text("import os\n", encoding="utf-8")
+    result = runner.invoke(cli, ['arch-check', str(repo), '--no-cache'])
+    assert result.exit_code == 0
+
+    result = runner.invoke(cli, ['arch-check', str(repo), '--config', str(tmp_path / "missing.json")])
+    assert result.exit_code == 2
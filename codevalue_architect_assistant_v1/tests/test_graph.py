@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Tests for the compact dependency graph."""
+
+from pathlib import Path
+
+from codevalue_architect_assistant.graph import CompactGraph, PathTable
+from codevalue_architect_assistant.models import Dependency, DependencyMap
+
+def test_path_table_interns_consecutive_ids():
+    table = PathTable()
+    assert [table.intern(name) for name in ("a", "b", "a", "c")] == [0, 1, 0, 2]
+    assert table.get("b") == 1 and table.get("missing") is None
+    assert table.names == ["a", "b", "c"] and len(table) == 3
+
+def test_edges_keep_insertion_order_and_collapse_duplicates():
+    graph = CompactGraph()
+    graph.add_node("isolated.py")
+    graph.add_edge("b.py", "c.py", type="import_from", line=1)
+    graph.add_edge("a.py", "c.py", type="require", line=2)
+    graph.add_edge("b.py", "a.py", type="import_from", line=3)
+    assert graph.number_of_edges() == 3 # Compacted once...
+    graph.add_edge("b.py", "c.py", type="dynamic_import", line=9) # ...then updated, like networkx
+    assert graph.nodes() == ["isolated.py", "b.py", "c.py", "a.py"]
+    assert list(graph.edges(data=True)) == [
+        ("b.py", "c.py", {"type": "dynamic_import", "line": 9, "weight": 2}),
+        ("b.py", "a.py", {"type": "import_from", "line": 3, "weight": 1}),
+        ("a.py", "c.py", {"type": "require", "line": 2, "weight": 1}),
+    ]
+    assert graph.number_of_edges() == 3
+    b = graph.node_id("b.py")
+    assert [graph.node_name(t) for t in graph.successors(b)] == ["c.py", "a.py"]
+    assert graph.out_degrees() == [0, 2, 0, 1]
+    assert graph.in_degrees() == [0, 0, 2, 1]
+    assert graph.has_edge("a.py", "c.py") and not graph.has_edge("c.py", "a.py")
+
+def test_dependency_map_and_networkx_conversion():
+    dep_map = DependencyMap(repository_root=Path("/repo"))
+    dep_map.add_dependency(Dependency(Path("a.py"), "b", Path("b.py"), 1, "static_import"))
+    dep_map.add_dependency(Dependency(Path("a.py"), "os", None, 2, "static_import"))
+    assert dep_map.graph.number_of_nodes() == 2
+    assert dep_map.unresolved.by_module == {"os": 1}
+    assert dep_map.unresolved_dependencies == [] # Only kept with keep_unresolved=True
+
+    nx_graph = dep_map.to_networkx()
+    assert list(nx_graph.nodes()) == ["a.py", "b.py"]
+    assert nx_graph.edges["a.py", "b.py"] == {"type": "static_import", "line": 1, "weight": 1}
+
+def test_unresolved_summary_keeps_counts_and_first_examples():
+    dep_map = DependencyMap(repository_root=Path("/repo"), keep_unresolved=True)
+    dep_map.unresolved.max_examples = 3
+    dep_map.add_dependencies(
+        Dependency(Path(f"{name}.py"), module, None, 1, "static_import")
+        for name, module in [("d", "os"), ("b", "sys"), ("a", "os"), ("c", "re"), ("b", "json"), ("a", "os")]
+    )
+    assert len(dep_map.unresolved) == 6
+    assert dep_map.unresolved.by_module == {"os": 3, "sys": 1, "re": 1, "json": 1}
+    # Sorted by source file; imports from the same file keep their order
+    assert dep_map.unresolved.examples() == [(Path("a.py"), "os"), (Path("a.py"), "os"), (Path("b.py"), "sys")]
+    assert len(dep_map.unresolved_dependencies) == 6
+
+def test_from_edges_adds_isolated_nodes_and_edge_data():
+    graph = CompactGraph.from_edges([("a.py", "b.py"), ("b.py", "c.py", "import_from", 3, 2)], nodes=["lonely.py"])
+    assert graph.nodes() == ["lonely.py", "a.py", "b.py", "c.py"]
+    assert list(graph.edges(data=True)) == [
+        ("a.py", "b.py", {"type": None, "line": None, "weight": 1}),
+        ("b.py", "c.py", {"type": "import_from", "line": 3, "weight": 2}),
+    ]
+
+def test_edge_weights_add_up_across_compactions():
+    graph = CompactGraph()
+    graph.add_edge("a.py", "b.py")
+    graph.add_edge("a.py", "c.py", weight=4)
+    assert graph.number_of_edges() == 2
+    graph.add_edge("a.py", "b.py", weight=2)
+    assert list(graph.iter_weighted_edges()) == [(0, 1, 3), (0, 2, 4)]
+
+def test_dependency_map_rolls_files_up_into_directories():
+    dep_map = DependencyMap(repository_root=Path("/repo"), granularity="dir", rollup_depth=2)
+    dep_map.add_dependencies([
+        Dependency(Path("src/app/views/home.py"), "m", Path("src/app/models/user.py"), 1, "import_from"),
+        Dependency(Path("src/app/views/home.py"), "u", Path("src/lib/util.py"), 2, "import_from"),
+        Dependency(Path("src/app/api.py"), "u", Path("src/lib/util.py"), 1, "import_from"),
+        Dependency(Path("setup.py"), "a", Path("src/app/api.py"), 3, "static_import"),
+        Dependency(Path("src/lib/util.py"), "os", None, 1, "static_import"),
+    ])
+    graph = dep_map.graph
+    assert graph.nodes() == ["src/app", "src/lib", "."]
+    assert [(graph.node_name(u), graph.node_name(v), w) for u, v, w in graph.iter_weighted_edges()] == [
+        ("src/app", "src/lib", 2),
+        (".", "src/app", 1),
+    ]
+    assert dep_map.internal_dependencies == 1 # views -> models stays inside src/app
+    assert len(dep_map.unresolved) == 1
+
+def test_dependency_map_rollup_adds_each_directory_edge_once():
+    dep_map = DependencyMap(repository_root=Path("/repo"), granularity="dir", rollup_depth=1)
+    dep_map.add_dependencies(
+        Dependency(Path(f"a/m{i}.py"), "b", Path(f"b/m{i}.py"), i + 1, "import_from") for i in range(1000)
+    )
+    assert len(dep_map.graph._pending_src) == 1 # Not one pending row per import
+    assert list(dep_map.graph.iter_edge_data()) == [(0, 1, "import_from", 1000)]
+    assert list(dep_map.graph.iter_weighted_edges()) == [(0, 1, 1000)]
+    assert dep_map.to_networkx().edges["a", "b"]["weight"] == 1000 # The import count survives conversion
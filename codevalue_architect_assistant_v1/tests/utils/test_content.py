@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Tests for reading and decoding source files."""
+
+import codecs
+import pytest
+from pathlib import Path
+
+from codevalue_architect_assistant.utils.content import detect_encoding, read_file_content
+
+# --- Encoding Detection ---
+
+@pytest.mark.parametrize("data, expected", [
+    (codecs.BOM_UTF8 + b"import os\n", "utf-8-sig"),
+    (codecs.BOM_UTF16_LE + "x".encode("utf-16-le"), "utf-16"),
+    (b"# -*- coding: latin-1 -*-\nname = '\xe9'\n", "iso8859-1"),
+    (b"#!/usr/bin/env python\n# vim: set fileencoding=cp1252 :\n", "cp1252"),
+    (b"import os\n# coding: latin-1\n", "utf-8"), # Cookie after code does not count
+    (b"# coding: no-such-codec\n", "utf-8"),
+    ("name = 'é'\n".encode("utf-8"), "utf-8"),
+    (b"name = '\xe9'\n", "latin-1"),
+])
+def test_detect_encoding(data: bytes, expected: str):
+    assert detect_encoding(data) == expected
+
+def test_text_strips_bom_and_honours_cookie(tmp_path: Path):
+    bom_file = tmp_path / "bom.py"
+    bom_file.write_bytes(codecs.BOM_UTF8 + b"import os\n")
+    assert read_file_content(bom_file).text == "import os\n"
+
+    cookie_file = tmp_path / "cookie.py"
+    cookie_file.write_bytes(b"# coding: latin-1\nname = '\xe9'\n")
+    assert read_file_content(cookie_file).text.endswith("name = 'é'\n")
+
+def test_text_falls_back_to_latin1_without_cookie(tmp_path: Path):
+    file_path = tmp_path / "legacy.py"
+    file_path.write_bytes(b"name = '\xe9'\n")
+    content = read_file_content(file_path)
+    assert content.text == "name = 'é'\n"
+    assert content.encoding == "latin-1"
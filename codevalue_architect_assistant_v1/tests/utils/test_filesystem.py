@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 """Tests for filesystem utilities."""
 
+import os
 import pytest
 from pathlib import Path
-from codevalue_architect_assistant.utils.filesystem import scan_repository, DEFAULT_IGNORE_DIRS, DEFAULT_IGNORE_FILES
+from codevalue_architect_assistant.utils.filesystem import (
+    scan_repository,
+    scan_repository_entries,
+    FileEntry,
+    DEFAULT_IGNORE_DIRS,
+    DEFAULT_IGNORE_FILES,
+)
 
 def test_scan_repository_basic(tmp_path: Path):
     """Test basic scanning of a simple directory structure."""
@@ -92,4 +99,116 @@ def test_scan_file_path(tmp_path: Path):
     file_path = tmp_path / "a_file.txt"
     file_path.touch()
     found_files = list(scan_repository(file_path))
-    assert len(found_files) == 0 # Should not raise error, just yield nothing
\ No newline at end of file
+    assert len(found_files) == 0 # Should not raise error, just yield nothing
+
+def test_scan_repository_entries_metadata(tmp_path: Path):
+    """Test that entries carry size, mtime and relative path from the listing."""
+    (tmp_path / "pkg").mkdir()
+    target = tmp_path / "pkg" / "mod.py"
+    target.write_text("import os\n", encoding="utf-8")
+
+    entries = list(scan_repository_entries(tmp_path))
+
+    assert len(entries) == 1
+    entry = entries[0]
+    assert isinstance(entry, FileEntry)
+    assert entry.path == target
+    assert entry.relative_path == Path("pkg/mod.py")
+    assert entry.size_bytes == target.stat().st_size
+    assert entry.mtime_ns == target.stat().st_mtime_ns
+    assert entry.is_symlink is False
+
+def test_scan_repository_entries_order_matches_walk(tmp_path: Path):
+    """Test that a directory's files come before its subdirectories' files."""
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "inner.py").touch()
+    (tmp_path / "top.py").touch()
+
+    rel_paths = [e.relative_path for e in scan_repository_entries(tmp_path)]
+    assert rel_paths == [Path("top.py"), Path("a/inner.py")]
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="Symlinks not supported")
+def test_scan_repository_entries_does_not_follow_dir_symlinks(tmp_path: Path):
+    """Test that symlinked directories are not descended into, like os.walk."""
+    (tmp_path / "real").mkdir()
+    (tmp_path / "real" / "file.py").touch()
+    try:
+        os.symlink(tmp_path / "real", tmp_path / "link", target_is_directory=True)
+    except OSError:
+        pytest.skip("Cannot create symlinks in this environment")
+
+    rel_paths = {e.relative_path for e in scan_repository_entries(tmp_path)}
+    assert rel_paths == {Path("real/file.py")}
+
+def _make_wide_tree(root: Path) -> None:
+    """Creates a tree with several sibling directories and ignored folders."""
+    for d in ["b", "a", "c/inner", "c/deeper/leaf", "node_modules/pkg"]:
+        (root / d).mkdir(parents=True, exist_ok=True)
+    for f in ["z.py", "a.py", "b/one.js", "a/two.py", "c/three.py",
+              "c/inner/four.py", "c/deeper/leaf/five.py", "node_modules/pkg/index.js"]:
+        (root / f).touch()
+
+def test_scan_parallel_matches_serial(tmp_path: Path):
+    """Test that the threaded walker finds the same files and keeps ignore pruning."""
+    _make_wide_tree(tmp_path)
+    serial = {e.relative_path for e in scan_repository_entries(tmp_path)}
+    parallel = {e.relative_path for e in scan_repository_entries(tmp_path, walk_threads=4)}
+    unordered = {e.relative_path for e in scan_repository_entries(tmp_path, walk_threads=4, ordered=False)}
+
+    assert serial == parallel == unordered
+    assert Path("node_modules/pkg/index.js") not in parallel
+    assert len(parallel) == 7
+
+def test_scan_parallel_deterministic_order(tmp_path: Path):
+    """Test that ordered parallel output is name-sorted depth-first pre-order."""
+    _make_wide_tree(tmp_path)
+    expected = [
+        Path("a.py"), Path("z.py"),
+        Path("a/two.py"),
+        Path("b/one.js"),
+        Path("c/three.py"), Path("c/deeper/leaf/five.py"), Path("c/inner/four.py"),
+    ]
+    for _ in range(3):
+        order = [e.relative_path for e in scan_repository_entries(tmp_path, walk_threads=3)]
+        assert order == expected
+
+def test_scan_parallel_early_stop(tmp_path: Path):
+    """Test that abandoning the generator early shuts the walk down cleanly."""
+    _make_wide_tree(tmp_path)
+    gen = scan_repository_entries(tmp_path, walk_threads=2)
+    first = next(gen)
+    gen.close()
+    assert first.relative_path == Path("a.py")
+
+def test_scan_prunes_gitignored_subtrees(tmp_path: Path):
+    """Test that nested .gitignore/.archignore rules prune directories before descending."""
+    (tmp_path / ".gitignore").write_text("coverage/\n*.log\n", encoding="utf-8")
+    (tmp_path / "coverage").mkdir()
+    (tmp_path / "coverage" / "report.js").touch()
+    (tmp_path / "app.py").touch()
+    (tmp_path / "debug.log").touch()
+    (tmp_path / "web").mkdir()
+    (tmp_path / "web" / ".archignore").write_text("/vendor\n!important.log\n", encoding="utf-8")
+    (tmp_path / "web" / "vendor").mkdir()
+    (tmp_path / "web" / "vendor" / "lib.js").touch()
+    (tmp_path / "web" / "index.js").touch()
+    (tmp_path / "web" / "important.log").touch()
+
+    for threads in (1, 3):
+        found = {e.relative_path for e in scan_repository_entries(tmp_path, walk_threads=threads)}
+        assert found == {Path("app.py"), Path("web/index.js"), Path("web/important.log")}
+
+    unfiltered = {e.relative_path for e in scan_repository_entries(tmp_path, use_ignore_files=False)}
+    assert Path("coverage/report.js") in unfiltered
+    assert Path("web/vendor/lib.js") in unfiltered
+
+def test_scan_honours_git_info_exclude(tmp_path: Path):
+    """Test that .git/info/exclude applies at the repository root."""
+    (tmp_path / ".git" / "info").mkdir(parents=True)
+    (tmp_path / ".git" / "info" / "exclude").write_text("generated/\n", encoding="utf-8")
+    (tmp_path / "generated").mkdir()
+    (tmp_path / "generated" / "out.py").touch()
+    (tmp_path / "main.py").touch()
+
+    found = {e.relative_path for e in scan_repository_entries(tmp_path)}
+    assert found == {Path("main.py")}
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Tests for reading the file list from a git index."""
+
+import shutil
+import subprocess
+import pytest
+from pathlib import Path
+from codevalue_architect_assistant.utils.git_index import GitIndex, GitIndexError, scan_git_index
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git executable not available")
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+def _make_repo(tmp_path: Path, index_version: int = 2) -> Path:
+    """Creates a git repo with tracked and untracked files."""
+    repo = tmp_path / "repo"
+    (repo / "pkg" / "sub").mkdir(parents=True)
+    (repo / "main.py").write_text("import pkg\n", encoding="utf-8")
+    (repo / "pkg" / "__init__.py").write_text("", encoding="utf-8")
+    (repo / "pkg" / "sub" / "deep_module_name.py").write_text("x = 1\n", encoding="utf-8")
+    (repo / "pkg" / "sub" / "deep_module_other.py").write_text("y = 2\n", encoding="utf-8")
+    (repo / ".gitignore").write_text("build/\n", encoding="utf-8")
+    _git(repo, "init", "-q")
+    _git(repo, "add", "-A")
+    _git(repo, "update-index", "--index-version", str(index_version))
+    # Untracked and ignored files must not be reported
+    (repo / "untracked.py").touch()
+    (repo / "build").mkdir()
+    (repo / "build" / "artifact.js").touch()
+    return repo
+
+@pytest.mark.parametrize("index_version", [2, 4])
+def test_scan_git_index_lists_tracked_files(tmp_path: Path, index_version: int):
+    """Test that tracked files are listed with size and mtime from the index."""
+    repo = _make_repo(tmp_path, index_version)
+    entries = {e.relative_path: e for e in scan_git_index(repo)}
+
+    # .gitignore is in the default ignored file names
+    assert set(entries) == {
+        Path("main.py"),
+        Path("pkg/__init__.py"),
+        Path("pkg/sub/deep_module_name.py"),
+        Path("pkg/sub/deep_module_other.py"),
+    }
+    main = entries[Path("main.py")]
+    assert main.path == repo / "main.py"
+    assert main.size_bytes == (repo / "main.py").stat().st_size
+    assert main.mtime_ns // 1_000_000_000 == (repo / "main.py").stat().st_mtime_ns // 1_000_000_000
+    assert main.stat_from_index
+
+def test_scan_git_index_from_subdirectory(tmp_path: Path):
+    """Test scanning a directory inside the checkout."""
+    repo = _make_repo(tmp_path)
+    rel = {e.relative_path for e in scan_git_index(repo / "pkg")}
+    assert rel == {Path("__init__.py"), Path("sub/deep_module_name.py"), Path("sub/deep_module_other.py")}
+
+def test_git_index_version(tmp_path: Path):
+    """Test that the header is parsed."""
+    repo = _make_repo(tmp_path, index_version=4)
+    index = GitIndex.for_path(repo)
+    assert index.version == 4
+    assert index.entry_count == 5
+
+def test_scan_git_index_without_checkout(tmp_path: Path):
+    """Test that a missing index raises GitIndexError eagerly."""
+    (tmp_path / "plain").mkdir()
+    with pytest.raises(GitIndexError):
+        scan_git_index(tmp_path / "plain")
+
+def test_scan_git_index_untracked_directory(tmp_path: Path):
+    """Test that a directory with no tracked files raises GitIndexError instead of listing nothing."""
+    repo = _make_repo(tmp_path)
+    (repo / "vendor").mkdir()
+    (repo / "vendor" / "v.py").touch()
+    with pytest.raises(GitIndexError):
+        scan_git_index(repo / "vendor")
+
+@pytest.mark.parametrize("corrupt", ["truncate", "flip"])
+def test_scan_git_index_rejects_corrupt_index_eagerly(tmp_path: Path, corrupt: str):
+    """Test that a truncated or altered index raises GitIndexError on open, not during iteration."""
+    repo = _make_repo(tmp_path)
+    index_path = repo / ".git" / "index"
+    data = bytearray(index_path.read_bytes())
+    if corrupt == "truncate":
+        data = data[:200]
+    else:
+        data[100] ^= 0xFF
+    index_path.write_bytes(bytes(data))
+    with pytest.raises(GitIndexError):
+        scan_git_index(repo)
+
+def test_git_index_without_checksum_is_bounds_checked(tmp_path: Path):
+    """Test that an index written with index.skipHash (zero checksum) is still validated entry by entry."""
+    repo = _make_repo(tmp_path)
+    index_path = repo / ".git" / "index"
+    data = index_path.read_bytes()
+    index_path.write_bytes(data[:-20] + bytes(20))
+    assert len(list(scan_git_index(repo))) == 4
+    index_path.write_bytes(data[:200] + bytes(20))
+    with pytest.raises(GitIndexError):
+        GitIndex(index_path, repo)
+
+def test_git_index_rejects_garbage(tmp_path: Path):
+    """Test that a file without the DIRC signature is rejected."""
+    bogus = tmp_path / "index"
+    bogus.write_bytes(b"not an index at all")
+    with pytest.raises(GitIndexError):
+        GitIndex(bogus, tmp_path)
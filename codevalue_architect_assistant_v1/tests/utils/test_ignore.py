@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Tests for gitignore-style ignore matching."""
+
+import pytest
+from pathlib import Path
+from codevalue_architect_assistant.utils.ignore import IgnoreMatcher, compile_pattern, is_ignored
+
+@pytest.mark.parametrize(
+    "pattern, path, is_dir, expected",
+    [
+        # Unanchored names match at any depth
+        ("coverage", "coverage", True, True),
+        ("coverage", "pkg/coverage", True, True),
+        ("*.log", "a/b/debug.log", False, True),
+        ("*.log", "a/b/debug.logs", False, None),
+        # Dir-only rules do not match files
+        ("target/", "target", True, True),
+        ("target/", "target", False, None),
+        # Leading or middle slash anchors to the ignore file's directory
+        ("/build", "build", True, True),
+        ("/build", "src/build", True, None),
+        ("docs/*.md", "docs/a.md", False, True),
+        ("docs/*.md", "x/docs/a.md", False, None),
+        ("docs/*.md", "docs/sub/a.md", False, None),
+        # Double-star forms
+        ("**/.next", "web/app/.next", True, True),
+        ("vendor/**", "vendor/lib/x.js", False, True),
+        ("a/**/b", "a/b", True, True),
+        ("a/**/b", "a/x/y/b", True, True),
+        # Character classes and single-character wildcards
+        ("file[0-9].py", "file7.py", False, True),
+        ("file[!0-9].py", "file7.py", False, None),
+        ("?.js", "a.js", False, True),
+        # Escapes
+        ("\\#notacomment", "#notacomment", False, True),
+    ],
+)
+def test_matcher_semantics(pattern, path, is_dir, expected):
+    """Test translation of individual gitignore patterns."""
+    matcher = IgnoreMatcher([pattern])
+    assert matcher.match(path, is_dir) is expected
+
+def test_comments_and_blank_lines_are_skipped():
+    """Test that comments and blank lines produce no rules."""
+    assert compile_pattern("# comment") is None
+    assert compile_pattern("   ") is None
+    assert compile_pattern("") is None
+    assert not IgnoreMatcher(["# only a comment", ""])
+
+def test_negation_last_rule_wins():
+    """Test that '!' re-includes paths and the last matching rule wins."""
+    matcher = IgnoreMatcher(["*.js", "!keep.js", "keep.js"])
+    assert matcher.match("keep.js", False) is True
+    matcher = IgnoreMatcher(["*.js", "!keep.js"])
+    assert matcher.match("keep.js", False) is False
+    assert matcher.match("drop.js", False) is True
+    assert matcher.match("readme.md", False) is None
+
+def test_chain_deeper_file_takes_precedence():
+    """Test that a nested ignore file overrides its parent."""
+    root = IgnoreMatcher(["*.gen.py"])
+    nested = IgnoreMatcher(["!keep.gen.py"], base_dir="pkg/")
+    chain = (root, nested)
+    assert is_ignored(chain, "pkg/keep.gen.py", False) is False
+    assert is_ignored(chain, "pkg/other.gen.py", False) is True
+    assert is_ignored(chain, "main.py", False) is False
+
+def test_base_dir_anchoring():
+    """Test that anchored patterns are relative to the ignore file's directory."""
+    nested = IgnoreMatcher(["/out"], base_dir="web/")
+    assert nested.match("web/out", True) is True
+    assert nested.match("web/src/out", True) is None
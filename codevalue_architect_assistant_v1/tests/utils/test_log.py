@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Tests for the run-wide logging configuration and the hot-loop debug switch."""
+
+import logging
+import pytest
+from click.testing import CliRunner
+
+from codevalue_architect_assistant.cli import cli
+from codevalue_architect_assistant.utils import log
+from codevalue_architect_assistant.analysis.javascript_parser import parse_javascript_source
+
+class _Unformattable:
+    """A file path stand-in that fails the test if a log message is built from it."""
+    def __format__(self, spec):
+        raise AssertionError("debug message was formatted")
+
+@pytest.fixture
+def restore_root_level():
+    root = logging.getLogger()
+    level = root.level
+    yield
+    root.setLevel(level)
+    log.refresh_debug_flag()
+
+def test_debug_messages_are_not_built_unless_enabled(restore_root_level):
+    log.configure_logging("INFO")
+    assert not log.DEBUG
+    assert len(parse_javascript_source("import a from './a';", _Unformattable())) == 1
+
+    log.configure_logging("DEBUG")
+    assert log.DEBUG
+    with pytest.raises(AssertionError, match="formatted"):
+        parse_javascript_source("import a from './a';", _Unformattable())
+
+def test_cli_log_level_and_quiet(tmp_path, restore_root_level):
+    runner = CliRunner()
+    assert runner.invoke(cli, ['--log-level', 'debug', 'analyze', str(tmp_path)]).exit_code == 0
+    assert logging.getLogger().level == logging.DEBUG and log.DEBUG
+    assert runner.invoke(cli, ['--log-level', 'debug', '--quiet', 'analyze', str(tmp_path)]).exit_code == 0
+    assert logging.getLogger().level == logging.WARNING and not log.DEBUG
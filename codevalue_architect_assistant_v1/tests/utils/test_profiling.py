@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Tests for the per-stage profiler."""
+
+import json
+import pstats
+from pathlib import Path
+
+from codevalue_architect_assistant.utils import profiling
+from codevalue_architect_assistant.utils.profiling import Profiler
+
+class _FakeClock:
+    """Stands in for the time module: every reading advances the clock by one second."""
+    def __init__(self):
+        self.now = 0.0
+    def perf_counter(self) -> float:
+        self.now += 1.0
+        return self.now
+    def process_time(self) -> float:
+        return self.now
+
+def test_nested_stages_report_exclusive_time(monkeypatch):
+    monkeypatch.setattr(profiling, "time", _FakeClock())
+    profiler = Profiler()
+    with profiler.stage("graph") as graph:
+        for _ in range(2):
+            with profiler.stage("parse") as parse:
+                parse.files += 1
+                parse.bytes += 100
+        graph.items += 5
+    report = {row["stage"]: row for row in profiler.report()["stages"]}
+    # Clock readings: graph enters at 2, parse runs 3-4 and 5-6, graph leaves at 7. The outer
+    # stage is charged 2-3, 4-5 and 6-7 only
+    assert report["parse"]["calls"] == 2 and report["parse"]["wall_s"] == 2.0
+    assert report["graph"]["calls"] == 1 and report["graph"]["wall_s"] == 3.0
+    assert report["parse"]["files_per_s"] == 1.0 and report["parse"]["bytes_per_s"] == 100.0
+    assert [row["stage"] for row in profiler.report()["stages"]] == ["parse", "graph"] # Pipeline order
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler(enabled=False)
+    with profiler.stage("parse") as stats:
+        stats.files += 1
+    assert profiler.stages == {}
+
+def test_json_report_and_cprofile_dump(tmp_path: Path):
+    profiler = Profiler(cprofile_stage="parse")
+    with profiler.stage("graph"):
+        with profiler.stage("parse"):
+            sorted(range(1000), key=lambda x: -x)
+    profiler.write_json(tmp_path / "report.json")
+    assert [row["stage"] for row in json.loads((tmp_path / "report.json").read_text())["stages"]] == ["parse", "graph"]
+    assert profiler.dump_cprofile(tmp_path / "parse.pstats")
+    functions = {name for _, _, name in pstats.Stats(str(tmp_path / "parse.pstats")).stats}
+    assert "<lambda>" in functions
+    assert not Profiler(cprofile_stage="render").dump_cprofile(tmp_path / "none.pstats") # Stage never ran
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Tests for the slotted record types."""
+
+import pickle
+import pytest
+from pathlib import Path
+
+from codevalue_architect_assistant.models import Dependency, ProjectFile
+from codevalue_architect_assistant.analysis.python_parser import RawImport
+from codevalue_architect_assistant.analysis.javascript_parser import JSRawImport
+from codevalue_architect_assistant.analysis.usecase_finder import UseCaseMatch
+
+@pytest.mark.parametrize("record", [
+    Dependency(Path("a.py"), "os", None, 1),
+    RawImport("os", None, 1, False),
+    JSRawImport("react", "import_from", ["useState"], 2),
+    UseCaseMatch(Path("a.py"), 3, "function_name", "create_order", "def create_order():"),
+])
+def test_records_have_no_dict_and_behave_like_dataclasses(record):
+    assert not hasattr(record, "__dict__")
+    copy = pickle.loads(pickle.dumps(record))
+    assert copy == record and copy is not record
+    assert repr(copy) == repr(record) and repr(record).startswith(type(record).__name__ + "(")
+    copy.line_number = 99
+    assert copy != record
+
+def test_project_file_derives_its_path_from_the_root():
+    root = Path("/repo")
+    derived = ProjectFile(root=root, relative_path=Path("src/app.py"), language="python")
+    assert derived.path == Path("/repo/src/app.py")
+    assert derived == ProjectFile(path=Path("/repo/src/app.py"), relative_path=Path("src/app.py"), language="python")
+    assert repr(derived).startswith("ProjectFile(path=") and "root=" not in repr(derived)
+    with pytest.raises(TypeError):
+        ProjectFile(relative_path=Path("src/app.py"))